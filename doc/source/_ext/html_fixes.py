@@ -0,0 +1,48 @@
+"""Fix the HTML pages of the API reference as they are written.
+
+Links of the member tables that point to another page are made local, and Windows
+apostrophes are replaced with single quotes. Doing this when each page is written
+replaces a pass of scripts over the built HTML files.
+"""
+
+import re
+
+# A link in the first cell of a table row to a member documented on another page.
+# For example, '<tr class="row-odd"><td><p><a class="reference internal"
+# href="../../../v242/Ansys/ACT/Results/VectorDeformation.html#VectorDeformation.Activate"'
+MEMBER_LINK_PATTERN = re.compile(
+    r'(<tr class="[^"]*"><td><p><a class="reference internal" href=")\.\./[^"#]*(#[^"]*")'
+)
+
+# Parts of the page context that are written as is
+CONTEXT_KEYS = ("body", "title", "toc")
+
+
+def replace_apostrophes(text):
+    """Replace Windows apostrophes with single quotes."""
+    return text.replace("‘", "'").replace("’", "'")
+
+
+def make_member_links_local(body):
+    """Make the links of the member tables local to the page."""
+    return MEMBER_LINK_PATTERN.sub(r"\1\2", body)
+
+
+def fix_api_page(app, pagename, templatename, context, doctree):
+    """Fix the HTML of an API reference page before it is written."""
+    if not pagename.startswith("api/"):
+        return
+    for key in CONTEXT_KEYS:
+        value = context.get(key)
+        if not isinstance(value, str):
+            continue
+        # Index pages link to their members on the member pages
+        if key == "body" and not pagename.endswith("index"):
+            value = make_member_links_local(value)
+        context[key] = replace_apostrophes(value)
+
+
+def setup(app):
+    """Connect the fixes to the writing of the HTML pages."""
+    app.connect("html-page-context", fix_api_page)
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -10,11 +10,16 @@
 
 from datetime import datetime
 import os
+from pathlib import Path
+import sys
 
 from ansys_sphinx_theme import ansys_favicon, get_version_match, pyansys_logo_black
 
 from ansys.mechanical.stubs import __version__
 
+# Local extensions
+sys.path.insert(0, str(Path(__file__).parent / "_ext"))
+
 # -- Project information -----------------------------------------------------
 
 project = "ansys.mechanical.stubs"
@@ -31,6 +36,7 @@ cname = os.getenv("DOCUMENTATION_CNAME", default="scripting.mechanical.docs.pyan
 # Sphinx extensions
 extensions = [
     "ansys_sphinx_theme.extension.autoapi",
+    "html_fixes",
     "notfound.extension",
     "numpydoc",
     "sphinx.ext.autodoc",
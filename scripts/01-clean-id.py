@@ -23,38 +23,32 @@
 """Clean markdown files by removing vale and <a> tags."""
 
 import argparse
-import os
-import pathlib
 from pathlib import Path
 import re
 
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
+
 DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
 
+# Get all text before the first "# <Title>"
+TITLE_PREFIX_PATTERN = re.compile("^[^#]*# ")
 
-def remove_links_from_markdown_files(directory_path):
-    """Remove <a> tags and vale comments from markdown files."""
-    # Get all text before the first "# <Title>"
-    pattern = re.compile("^[^#]*# ")
 
-    # Iterate over all files and subdirectories in the specified directory
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            if file.endswith(".md"):
-                file_path = pathlib.Path(root, file)
-                print(f"Processing {file_path}")
-                with pathlib.Path.open(file_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    joined_lines = "".join(lines)
-                    matches = pattern.findall(joined_lines)
-                    if matches:
-                        # Delete all lines before "# <Title>"
-                        joined_lines = joined_lines.replace(matches[0], "# ")
-                    if "vale on" in joined_lines:
-                        # Delete the <!-- vale on --> comment
-                        joined_lines = joined_lines.replace("<!-- vale on -->", "")
+def clean_id(content):
+    """Remove <a> tags and vale comments from the content of a markdown file."""
+    match = TITLE_PREFIX_PATTERN.search(content)
+    if match:
+        # Delete all lines before "# <Title>"
+        content = content.replace(match.group(0), "# ")
+    if "vale on" in content:
+        # Delete the <!-- vale on --> comment
+        content = content.replace("<!-- vale on -->", "")
+    return content
 
-                with pathlib.Path.open(file_path, "w", encoding="utf-8") as myfile:
-                    myfile.write(joined_lines)
+
+def remove_links_from_markdown_files(directory_path, jobs=1, quiet=False):
+    """Remove <a> tags and vale comments from markdown files."""
+    return run_pipeline(directory_path, [Stage("01-clean-id", clean_id)], jobs=jobs, quiet=quiet)
 
 
 if __name__ == "__main__":
@@ -67,6 +61,7 @@ if __name__ == "__main__":
         help="Path to the folder containing Markdown files",
         default=DEFAULT_INPUT_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     folder_path = args.input_folder
@@ -75,4 +70,4 @@ if __name__ == "__main__":
         raise NotADirectoryError(f"{folder_path} is not a valid directory.")
 
     # Replace 'your_directory' with the actual path to the directory containing your Markdown files
-    remove_links_from_markdown_files(folder_path)
+    print_report(remove_links_from_markdown_files(folder_path, args.jobs, args.quiet))
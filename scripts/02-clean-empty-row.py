@@ -23,36 +23,27 @@
 """Clean empty rows before heading 1 (h1) in markdown files."""
 
 import argparse
-import os
 from pathlib import Path
 import re
 
-DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
-
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
 
-def remove_empty_rows_at_top_and_before_heading1(directory_path):
-    """Remove empty rows before heading 1 in Markdown files."""
-    # Define the regular expression pattern to match empty rows at the top and before Heading 1
-    pattern = r"^\s*\n+"
+DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
 
-    # Iterate over all files and subdirectories in the specified directory
-    for root, dirs, files in os.walk(directory_path):
-        for file in files:
-            if file.endswith(".md"):
-                file_path = Path(root, file)
+# Match empty rows at the top and before Heading 1
+EMPTY_ROWS_PATTERN = re.compile(r"^\s*\n+")
 
-                # Read the content of the Markdown file
-                with file_path.open("r", encoding="utf-8") as f:
-                    content = f.read()
 
-                # Use re.sub() to remove empty rows at the top and before the first Heading 1
-                new_content = re.sub(pattern, "", content, count=1)
+def remove_empty_rows(content):
+    """Remove empty rows before heading 1 in the content of a Markdown file."""
+    return EMPTY_ROWS_PATTERN.sub("", content, count=1)
 
-                # Write the modified content back to the file
-                with file_path.open("w", encoding="utf-8") as f:
-                    f.write(new_content)
 
-                print(f"Removed empty rows at the top and before Heading 1 in {file_path}.")
+def remove_empty_rows_at_top_and_before_heading1(directory_path, jobs=1, quiet=False):
+    """Remove empty rows before heading 1 in Markdown files."""
+    return run_pipeline(
+        directory_path, [Stage("02-clean-empty-row", remove_empty_rows)], jobs=jobs, quiet=quiet
+    )
 
 
 if __name__ == "__main__":
@@ -65,6 +56,7 @@ if __name__ == "__main__":
         help="Path to the folder containing Markdown files",
         default=DEFAULT_INPUT_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
     folder_path = args.input_folder
 
@@ -72,4 +64,4 @@ if __name__ == "__main__":
         raise NotADirectoryError(f"{folder_path} is not a valid directory.")
 
     # Replace 'your_directory' with the actual path to the directory containing your Markdown files
-    remove_empty_rows_at_top_and_before_heading1(folder_path)
+    print_report(remove_empty_rows_at_top_and_before_heading1(folder_path, args.jobs, args.quiet))
@@ -20,18 +20,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Create a table of contents file from HTML files."""
+"""Create a table of contents file from HTML files or from the stub tree."""
 
 import argparse
+import ast
+from html.parser import HTMLParser
 import os
 from pathlib import Path
-
-from bs4 import BeautifulSoup
+import re
 
 DEFAULT_API_FOLDER = "doc/_build/html/api"
 DEFAULT_HTML_FILE = "index.html"
 DEFAULT_OUTPUT_FOLDER = "output"
 
+# Folder of the version packages, relative to the api folder of the documentation
+STUBS_HREF = "ansys/mechanical/stubs"
+VERSION_PATTERN = re.compile(r"^v[0-9]{3}$")
+ALL_PATTERN = re.compile(r"^__all__ = (\[.*\])$", re.MULTILINE)
+CLASS_PATTERN = re.compile(r"^class (\w+)\((.*)\):", re.MULTILINE)
+
 
 # This script must be run as follows: python script_name api index.html
 def parse_index_html(html_file):
@@ -42,23 +49,45 @@ def parse_index_html(html_file):
     return html_content, html_file.parent
 
 
+class _ReferenceLinkParser(HTMLParser):
+    """Collect the href and text of the links with the ``reference internal`` class."""
+
+    def __init__(self):
+        super().__init__()
+        self.links = []
+        self._href = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        attributes = dict(attrs)
+        if tag == "a" and attributes.get("class") == "reference internal":
+            self._href = attributes.get("href") or ""
+            self._text = []
+
+    def handle_data(self, data):
+        if self._href is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._href is not None:
+            self.links.append((self._href, "".join(self._text)))
+            self._href = None
+
+
 def extract_nav_items(base_dir, html_content):
     """Extract navigation items and append them to a dictionary."""
-    soup = BeautifulSoup(html_content, "html.parser")
-    # nav_links = soup.find_all('a', class_='nav-link nav-internal')  # Find nav links with class 'nav-link nav-internal'
-    reference_links = soup.find_all(
-        "a", class_="reference internal"
-    )  # Find reference links with class 'reference internal'
+    parser = _ReferenceLinkParser()
+    parser.feed(html_content)
+    parser.close()
     items = []
-    # for link in nav_links + reference_links:  # Combine nav_links and reference_links
-    for link in reference_links:
-        href = link.get("href")
+    seen = set()
+    for href, text in parser.links:
         if href.startswith("../") or "#" in href:
-            # print('SKIP ../index.html file=', href)
             continue  # Skip '../index.html' paths and path not ending with just index.html
-        item = {"name": link.text.strip(), "href": str(Path(base_dir, href))}
-        if item not in items:
-            # print('ITEM=', item)
+        item = {"name": text.strip(), "href": str(Path(base_dir, href))}
+        key = (item["name"], item["href"])
+        if key not in seen:
+            seen.add(key)
             items.append(item)
 
     return items
@@ -98,6 +127,86 @@ def build_indented_items(nav_items, base_dir="", indentation=1):
     return indented_items
 
 
+def version_title(version):
+    """Get the title of the documentation of a version package, such as ``Mechanical 2024 R2``."""
+    return f"Mechanical 20{version[1:3]} R{version[3]}"
+
+
+def read_stub_types(init_file):
+    """Get the interfaces, classes, and enums defined in a stub module file.
+
+    The types of a module that was split with ``--split_size`` are defined in its
+    private ``_part<n>.py`` submodules, which are read too.
+    """
+    content = init_file.read_text(encoding="utf-8")
+    match = ALL_PATTERN.search(content)
+    public_names = set(ast.literal_eval(match.group(1))) if match else None
+    for part_file in sorted(init_file.parent.glob(f"_part*{init_file.suffix}")):
+        content += part_file.read_text(encoding="utf-8")
+    interfaces, classes, enums = [], [], []
+    for name, bases in CLASS_PATTERN.findall(content):
+        if name.startswith("_") or (public_names is not None and name not in public_names):
+            continue
+        # Like the API pages, only the enums that derive from the enum base are grouped,
+        # not the classes that derive from a base such as IEnumerable with --inheritance
+        if bases.strip() in ("Enum", "LightEnum"):
+            enums.append(name)
+        elif name.startswith("I") and name[1:2].isupper():
+            interfaces.append(name)
+        else:
+            classes.append(name)
+    return sorted(interfaces) + sorted(classes) + sorted(enums)
+
+
+def build_stub_items(package_dir, href_dir, indentation=1):
+    """Create the list of navigation items of a stub package and its subpackages.
+
+    The items follow the order of the API pages: subpackages first, then the
+    interfaces, classes, and enums of the package, each sorted by name.
+    """
+    indented_items = []
+    subpackages = sorted(
+        child
+        for child in package_dir.iterdir()
+        if child.is_dir() and any(child.glob("__init__.py*"))
+    )
+    for subpackage in subpackages:
+        href = f"{href_dir}/{subpackage.name}"
+        indented_items.append(
+            (indentation, {"name": subpackage.name, "href": f"{href}/index.html"})
+        )
+        nested_items = build_stub_items(subpackage, href, indentation + 1)
+        if nested_items:
+            indented_items.append((indentation, {"name": "items:", "href": ""}))
+            indented_items.extend(nested_items)
+
+    init_files = sorted(package_dir.glob("__init__.py*"))
+    if init_files:
+        for name in read_stub_types(init_files[0]):
+            indented_items.append((indentation, {"name": name, "href": f"{href_dir}/{name}.html"}))
+    return indented_items
+
+
+def build_indented_items_from_stubs(stubs_dir):
+    """Create the navigation items of all version packages in a stub tree, newest first."""
+    versions = sorted(
+        (child for child in stubs_dir.iterdir() if VERSION_PATTERN.match(child.name)),
+        key=lambda child: child.name,
+        reverse=True,
+    )
+    indented_items = []
+    for version_dir in versions:
+        href = f"{STUBS_HREF}/{version_dir.name}"
+        indented_items.append(
+            (1, {"name": version_title(version_dir.name), "href": f"{href}/index.html"})
+        )
+        nested_items = build_stub_items(version_dir, href, indentation=2)
+        if nested_items:
+            indented_items.append((1, {"name": "items:", "href": ""}))
+            indented_items.extend(nested_items)
+    return indented_items
+
+
 def create_toc_file(api_folder, indented_items):
     """Create the toc.yml file with the indented_items list."""
     toc_file_name = Path("toc.yml")
@@ -124,7 +233,9 @@ def create_toc_file(api_folder, indented_items):
 
 
 if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Create table of contents from html files.")
+    parser = argparse.ArgumentParser(
+        description="Create table of contents from html files or from the stubs."
+    )
     parser.add_argument(
         "--api_folder",
         type=str,
@@ -143,6 +254,13 @@ if __name__ == "__main__":
         help="Name of the html file to create the table of contents from.",
         default=DEFAULT_HTML_FILE,
     )
+    parser.add_argument(
+        "--stubs_folder",
+        type=str,
+        help="Path to the folder of the generated version packages. If given, the table "
+        "of contents is created from the stubs instead of the html files.",
+        default=None,
+    )
     args = parser.parse_args()
 
     api_folder = args.api_folder
@@ -150,26 +268,35 @@ if __name__ == "__main__":
     output_folder = Path(args.output_folder)
 
     repo_dir = Path(__file__).parent.parent
-    full_file_path = Path(repo_dir, api_folder, html_file)
-    full_dir_path = str(Path(repo_dir, api_folder))
 
-    if not full_file_path.is_file():
-        raise NotADirectoryError(f"{full_file_path} is not a valid directory.")
+    if args.stubs_folder:
+        stubs_dir = Path(repo_dir, args.stubs_folder)
+        if not stubs_dir.is_dir():
+            raise NotADirectoryError(f"{stubs_dir} is not a valid directory.")
+
+        print(f"STUBS_PATH={stubs_dir}")
+        indented_items = build_indented_items_from_stubs(stubs_dir)
+    else:
+        full_file_path = Path(repo_dir, api_folder, html_file)
+        full_dir_path = str(Path(repo_dir, api_folder))
+
+        if not full_file_path.is_file():
+            raise NotADirectoryError(f"{full_file_path} is not a valid directory.")
 
-    print(f"HTML_PATH={str(Path(full_dir_path, html_file))}")
-    os.chdir(full_dir_path)
-    html_content, base_dir = parse_index_html(html_file)
-    nav_items = extract_nav_items(base_dir, html_content)
-    indented_items = build_indented_items(nav_items, base_dir)
+        print(f"HTML_PATH={str(Path(full_dir_path, html_file))}")
+        os.chdir(full_dir_path)
+        html_content, base_dir = parse_index_html(html_file)
+        nav_items = extract_nav_items(base_dir, html_content)
+        indented_items = build_indented_items(nav_items, base_dir)
 
-    os.chdir(repo_dir)
+        os.chdir(repo_dir)
 
-    if not Path(api_folder).is_dir():
-        raise NotADirectoryError(f"{api_folder} is not a valid directory.")
+        if not Path(api_folder).is_dir():
+            raise NotADirectoryError(f"{api_folder} is not a valid directory.")
 
     output_folder_path = Path(repo_dir, output_folder)
     if not output_folder_path.is_dir():
-        output_folder.mkdir()
+        output_folder_path.mkdir()
 
     os.chdir(output_folder_path)
 
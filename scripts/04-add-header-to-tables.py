@@ -23,9 +23,10 @@
 """Add headers to tables in markdown files."""
 
 import argparse
-import os
 from pathlib import Path
 
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
+
 DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
 
 
@@ -89,64 +90,49 @@ def process_md_table(input_table):
     return modified_table
 
 
-def process_md_files(folder_path):
+def add_table_headers(content):
+    """Update the tables in the content of a markdown file with a correct header."""
+    # Split the file content by at least one newline character
+    tables = content.split("\n\n")
+
+    # Process each potential Markdown table found in the file
+    modified_tables = []
+
+    for table in tables:
+        modified_table = table
+        # Check if the potential table is actually a Markdown table
+        if table.strip().startswith("|"):
+            # Check if the table has two columns with an empty column (first row only)
+            rows = table.strip().split("\n")
+            is_2_column_table = False
+            for i in range(0, len(rows)):
+                if i == 1:
+                    continue
+                if rows[i].count("|") == 3:
+                    s = rows[i].split("|")[2]
+                    if not all(char.isspace() or char == "\t" for char in s):
+                        is_2_column_table = True
+
+            # Tables with more than two columns are kept as they are
+            if rows[0].count("|") <= 3:
+                if is_2_column_table:
+                    # Process the MD table
+                    modified_table = process_md_table(table)
+                else:
+                    # Remove the empty column from the table
+                    modified_table = remove_column_table(table)
+
+        modified_tables.append(modified_table)
+
+    # Join the modified tables back into the file content
+    return "\n\n".join(modified_tables)
+
+
+def process_md_files(folder_path, jobs=1, quiet=False):
     """Parse tables and update them with a correct header if they are missing one."""
-    # Traverse the directory structure recursively
-    for root, dirs, files in os.walk(folder_path):
-        for file in files:
-            # Check if the file is a Markdown file
-            if file.endswith(".md"):
-                file_path = Path(root, file)
-                print("Processing:", file_path)
-                # Read the input file
-                with file_path.open("r", encoding="utf-8") as file:
-                    file_content = file.read()
-
-                # Split the file content by at least one newline character
-                tables = file_content.split("\n\n")
-
-                # Process each potential Markdown table found in the file
-                modified_tables = []
-
-                # Check if all items of column 2 are empty
-                for table in tables:
-                    # Check if the potential table is actually a Markdown table
-                    if table.strip().startswith("|"):
-                        # Check if the table has two columns with an empty column (first row only)
-                        rows = table.strip().split("\n")
-                        is_2_column_table = False
-                        for i in range(0, len(rows)):
-                            if i == 1:
-                                continue
-                            if rows[i].count("|") == 3:
-                                s = rows[i].split("|")[2]
-                                if all(char.isspace() or char == "\t" for char in s):
-                                    print("Found 1 column table")
-                                else:
-                                    print("Found 2 column table")
-                                    is_2_column_table = True
-
-                        if rows[0].count("|") > 3:
-                            print("Found >2 column table")
-                        elif is_2_column_table:
-                            # Process the MD table
-                            modified_table = process_md_table(table)
-                        elif not is_2_column_table:
-                            # Remove the empty column from the table
-                            modified_table = remove_column_table(table)
-                    else:
-                        modified_table = table
-
-                    modified_tables.append(modified_table)
-
-                # Join the modified tables back into the file content
-                modified_content = "\n\n".join(modified_tables)
-
-                # Write the modified content back to the input file
-                with file_path.open("w", encoding="utf-8") as file:
-                    file.write(modified_content)
-
-                print("File '{}' has been updated with corrected tables.".format(file_path))
+    return run_pipeline(
+        folder_path, [Stage("04-add-header-to-tables", add_table_headers)], jobs=jobs, quiet=quiet
+    )
 
 
 if __name__ == "__main__":
@@ -158,6 +144,7 @@ if __name__ == "__main__":
         default=DEFAULT_INPUT_FOLDER,
     )
 
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
     folder_path = args.input_folder
 
@@ -165,4 +152,4 @@ if __name__ == "__main__":
         raise NotADirectoryError(f"{folder_path} is not a valid directory.")
 
     # Process all Markdown files in the folder and its subfolders
-    process_md_files(folder_path)
+    print_report(process_md_files(folder_path, args.jobs, args.quiet))
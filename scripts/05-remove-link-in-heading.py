@@ -23,31 +23,29 @@
 """Remove links in heading."""
 
 import argparse
-import os
 from pathlib import Path
 import re
 
-DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
 
+DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
 
-def process_markdown_file(file_path):
-    """Update markdown file content."""
-    with file_path.open("r", encoding="utf-8") as file:
-        content = file.read()
+HEADING_LINK_PATTERN = re.compile(r"(#+)\s*\[`([^`]+)`\]\(#.*?\)")
 
-    updated_content = re.sub(r"(#+)\s*\[`([^`]+)`\]\(#.*?\)", r"\1 `\2`", content)
 
-    with file_path.open("w", encoding="utf-8") as file:
-        file.write(updated_content)
+def remove_links_in_headings(content):
+    """Remove links in the headings of the content of a markdown file."""
+    return HEADING_LINK_PATTERN.sub(r"\1 `\2`", content)
 
 
-def process_directory(directory):
+def process_directory(directory, jobs=1, quiet=False):
     """Process all markdown files within a directory."""
-    for dirpath, _, filenames in os.walk(directory):
-        for filename in filenames:
-            if filename.endswith(".md"):
-                file_path = Path(dirpath, filename)
-                process_markdown_file(file_path)
+    return run_pipeline(
+        directory,
+        [Stage("05-remove-link-in-heading", remove_links_in_headings)],
+        jobs=jobs,
+        quiet=quiet,
+    )
 
 
 if __name__ == "__main__":
@@ -59,6 +57,7 @@ if __name__ == "__main__":
         help="Path to the folder containing Markdown files",
         default=DEFAULT_INPUT_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     folder_path = args.input_folder
@@ -66,5 +65,4 @@ if __name__ == "__main__":
     if not Path(folder_path).is_dir():
         raise NotADirectoryError(f"{folder_path} is not a valid directory.")
 
-    process_directory(folder_path)
-    print("Markdown files processed successfully.")
+    print_report(process_directory(folder_path, args.jobs, args.quiet))
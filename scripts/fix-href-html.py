@@ -23,47 +23,36 @@
 """Update the html file with local href paths if necessary."""
 
 import argparse
-import os
 from pathlib import Path
 import re
 
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
+
 DEFAULT_API_FOLDER = "doc/_build/html/api"
 
+HREF_PATTERN = re.compile(
+    r"\<tr class\=\"[^\"]*\"\>\<td\>\<p\>\<a class\=\"reference internal\" href\=\"\.\.\/[^\"]*\""
+)
+
 
-def fix_hrefs(api_dir):
-    """Update the markdown file with local href paths if necessary."""
-    for root, dirs, files in os.walk(api_dir, topdown=True):
-        for file in files:
-            # If the html file is not index.html
-            if ("index.html" not in file) and ("html" in file):
-                # The full path to the html file
-                full_file_path = Path(root) / Path(file)
-                print(full_file_path)
+def make_hrefs_local(content):
+    """Update the content of an html file with local href paths if necessary."""
+    for match in HREF_PATTERN.findall(content):
+        # '<tr class="row-odd"><td><p><a class="reference internal" href="../../../../../../../v242/Ansys/ACT/Automation/Mechanical/Results/DeformationResults/VectorDeformation.html#VectorDeformation.Activate"
+        # get index of href="
+        href_eq = match.index("href=") + 6
+        # get index of #
+        pound = match.index("#")
+        # Replace original matched regex (match) with fixed href using local references
+        content = content.replace(match, match[0:href_eq] + match[pound:])
+    return content
 
-                pattern = re.compile(
-                    r"\<tr class\=\"[^\"]*\"\>\<td\>\<p\>\<a class\=\"reference internal\" href\=\"\.\.\/[^\"]*\""
-                )
-                with Path.open(full_file_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                    # Join all lines in the file into one string
-                    joined_lines = "".join(lines)
-                    # Check if the string contains the regex pattern
-                    matches = pattern.findall(joined_lines)
-                    if matches:
-                        for match in matches:
-                            # '<tr class="row-odd"><td><p><a class="reference internal" href="../../../../../../../v242/Ansys/ACT/Automation/Mechanical/Results/DeformationResults/VectorDeformation.html#VectorDeformation.Activate"
-                            # get index of href="
-                            href_eq = match.index("href=") + 6
-                            # get index of #
-                            pound = match.index("#")
-                            # remove href= to #
-                            new_match = match[0:href_eq] + match[pound:]
-                            print(f"Replacing {match} with {new_match}")
-                            # Replace original matched regex (match) with fixed href using local references (new_match)
-                            joined_lines = joined_lines.replace(match, new_match)
 
-                with Path.open(full_file_path, "w", encoding="utf-8") as myfile:
-                    myfile.write(joined_lines)
+def fix_hrefs(api_dir, jobs=1, quiet=False):
+    """Update the html files with local href paths if necessary."""
+    # The index.html files are not updated
+    stage = Stage("fix-href-html", make_hrefs_local, skip_index=True)
+    return run_pipeline(api_dir, [stage], suffix=".html", jobs=jobs, quiet=quiet)
 
 
 def main():
@@ -75,6 +64,7 @@ def main():
         help="Path to the api folder.",
         default=DEFAULT_API_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     repo_dir = Path(__file__).parent.parent
@@ -83,7 +73,7 @@ def main():
     print(full_api_dir_path)
 
     if full_api_dir_path.exists():
-        fix_hrefs(full_api_dir_path)
+        print_report(fix_hrefs(full_api_dir_path, args.jobs, args.quiet))
     else:
         raise NotADirectoryError(f"{full_api_dir_path} is not a valid directory.")
 
@@ -23,41 +23,41 @@
 """Update the markdown file with local href paths if necessary."""
 
 import argparse
-import fileinput
-import os
 from pathlib import Path
 import re
 
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
+
 DEFAULT_API_FOLDER = "doc/_build/markdown/api"
 
+# | [`DataType`](../../../../v242/Ansys/Mechanical/Interfaces/IReadOnlyDataSeries.md#IReadOnlyDataSeries.DataType)
+LINK_REGEX = re.compile(r"\| \[\`.*\`\]\(\.\.\/.*\)")
+# #### *class* ansys.mechanical.stubs.v242.Ansys.ACT.Automation.Mechanical.AdditiveManufacturing.AMBuildSettings
+CLASS_REGEX = re.compile(r"\#\#\#\# \*class\* ansys\.mechanical\.stubs\.v[0-9][0-9][0-9]\.")
 
-def fix_hrefs(api_dir):
-    """Update the markdown file with local href paths and remove ansys.mechanical.stubs from class name."""
-    for root, dirs, files in os.walk(api_dir, topdown=True):
-        for file in files:
-            # If the html file is not index.html
-            if ("index.md" not in file) and ("md" in file):
-                # The full path to the html file
-                full_file_path = Path(root) / Path(file)
 
-                # | [`DataType`](../../../../v242/Ansys/Mechanical/Interfaces/IReadOnlyDataSeries.md#IReadOnlyDataSeries.DataType)
-                link_regex = r"\| \[\`.*\`\]\(\.\.\/.*\)"
-                # #### *class* ansys.mechanical.stubs.v242.Ansys.ACT.Automation.Mechanical.AdditiveManufacturing.AMBuildSettings
-                class_regex = r"\#\#\#\# \*class\* ansys\.mechanical\.stubs\.v[0-9][0-9][0-9]\."
+def make_hrefs_local(content):
+    """Make the hrefs local and remove ansys.mechanical.stubs from class names in markdown content."""
+    lines = content.split("\n")
+    for index, line in enumerate(lines):
+        # Make the href local
+        if LINK_REGEX.match(line):
+            open_paren = line.index("(")
+            pound = line.index("#")
+            close_paren = line.index(")")
+            line = line[0 : open_paren + 1] + line[pound:close_paren] + line[close_paren:]
+        # Remove ansys.mechanical.stubs.v### from class name
+        if CLASS_REGEX.match(line):
+            line = CLASS_REGEX.sub("#### *class* ", line)
+        lines[index] = line
+    return "\n".join(lines)
 
-                for line in fileinput.input(full_file_path, inplace=True, encoding="utf-8"):
-                    # Make the href local
-                    if re.match(link_regex, line):
-                        open_paren = line.index("(")
-                        pound = line.index("#")
-                        close_paren = line.index(")")
-                        line = (
-                            line[0 : open_paren + 1] + line[pound:close_paren] + line[close_paren:]
-                        )
-                    # Remove ansys.mechanical.stubs.v### from class name
-                    if re.match(class_regex, line):
-                        line = re.sub(class_regex, "#### *class* ", line)
-                    print(line, end="")
+
+def fix_hrefs(api_dir, jobs=1, quiet=False):
+    """Update the markdown file with local href paths and remove ansys.mechanical.stubs from class name."""
+    # The index.md files are not updated
+    stage = Stage("fix-href-md", make_hrefs_local, skip_index=True)
+    return run_pipeline(api_dir, [stage], jobs=jobs, quiet=quiet)
 
 
 def main():
@@ -69,6 +69,7 @@ def main():
         help="Path to the api folder.",
         default=DEFAULT_API_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     repo_dir = Path(__file__).parent.parent
@@ -76,7 +77,7 @@ def main():
     full_api_dir_path = repo_dir / api_folder
 
     if full_api_dir_path.exists():
-        fix_hrefs(full_api_dir_path)
+        print_report(fix_hrefs(full_api_dir_path, args.jobs, args.quiet))
     else:
         raise NotADirectoryError(f"{full_api_dir_path} is not a valid directory.")
 
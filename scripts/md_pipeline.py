@@ -0,0 +1,227 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run the Markdown post-processing scripts as stages of a single pass.
+
+Each Markdown file is read once, goes through the transform of each stage in order,
+and is written back only if its content changed.
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+from itertools import repeat
+import math
+import os
+from pathlib import Path
+import time
+from typing import Callable, NamedTuple
+
+DEFAULT_INPUT_FOLDER = "doc/_build/markdown"
+CHUNKS_PER_JOB = 4
+
+# Stages in the order they run: script, transform function, subfolder of the input
+# folder the stage applies to, and whether index files are skipped
+STAGE_SCRIPTS = [
+    ("replace-windows-apostrophes", "replace_apostrophes", "api", False),
+    ("fix-href-md", "make_hrefs_local", "api", True),
+    ("01-clean-id", "clean_id", "", False),
+    ("02-clean-empty-row", "remove_empty_rows", "", False),
+    ("04-add-header-to-tables", "add_table_headers", "", False),
+    ("05-remove-link-in-heading", "remove_links_in_headings", "", False),
+]
+
+
+class Stage(NamedTuple):
+    """Transform of the content of the files in a folder."""
+
+    name: str
+    transform: Callable[[str], str]
+    subfolder: str = ""
+    skip_index: bool = False
+
+    def applies_to(self, relative_path: Path) -> bool:
+        """Whether the stage transforms a file, given its path relative to the input folder."""
+        if self.subfolder and relative_path.parts[0] != self.subfolder:
+            return False
+        # Skip index.md, genindex.md, and the HTML index files alike
+        return not (self.skip_index and f"index{relative_path.suffix}" in relative_path.name)
+
+
+class PipelineReport(NamedTuple):
+    """Counts and timings of a pipeline run."""
+
+    files: int
+    written: int
+    wall: float
+    timings: dict
+
+
+def load_stages():
+    """Get the stages of the Markdown pipeline from the scripts."""
+    stages = []
+    for script, transform_name, subfolder, skip_index in STAGE_SCRIPTS:
+        module = importlib.import_module(script)
+        stages.append(Stage(script, getattr(module, transform_name), subfolder, skip_index))
+    return stages
+
+
+def _iter_files(folder, suffix):
+    """Get the paths of the files to process relative to a folder, in a stable order."""
+    for root, dirs, file_names in os.walk(folder):
+        dirs.sort()
+        for file_name in sorted(file_names):
+            if not suffix or file_name.endswith(suffix):
+                yield Path(root, file_name).relative_to(folder)
+
+
+def _process_chunk(folder, relative_paths, stages):
+    """Run the stages over some files and return the files written and the timings."""
+    timings = dict.fromkeys(["read", *(stage.name for stage in stages), "write"], 0.0)
+    written = []
+    for relative_path in relative_paths:
+        file_path = folder / relative_path
+
+        start = time.perf_counter()
+        with file_path.open("r", encoding="utf-8") as file:
+            content = file.read()
+        timings["read"] += time.perf_counter() - start
+
+        new_content = content
+        for stage in stages:
+            if stage.applies_to(relative_path):
+                start = time.perf_counter()
+                new_content = stage.transform(new_content)
+                timings[stage.name] += time.perf_counter() - start
+
+        if new_content != content:
+            start = time.perf_counter()
+            with file_path.open("w", encoding="utf-8") as file:
+                file.write(new_content)
+            timings["write"] += time.perf_counter() - start
+            written.append(relative_path)
+    return written, timings
+
+
+def run_pipeline(folder, stages, suffix=".md", jobs=1, quiet=False):
+    """Run the stages over the files in a folder.
+
+    Files are independent, so with more than one job they are split in chunks
+    that are processed by a pool of processes. The files written and the
+    report are the same as with one job.
+
+    Parameters
+    ----------
+    folder: str or Path
+        Folder to process recursively.
+    stages: list[Stage]
+        Stages to run on each file, in order.
+    suffix: str, optional
+        Suffix of the files to process. If ``None``, all files are processed.
+    jobs: int, optional
+        Number of processes to use.
+    quiet: bool, optional
+        Whether to skip printing the path of each file written.
+
+    Returns
+    -------
+    PipelineReport
+        The number of files processed and written, the wall time, and the time
+        spent reading, in each stage, and writing, summed over the processes.
+    """
+    start = time.perf_counter()
+    folder = Path(folder)
+    relative_paths = list(_iter_files(folder, suffix))
+
+    if jobs > 1 and len(relative_paths) > 1:
+        # A few chunks per process balances the load without sending each path on its own
+        size = max(1, math.ceil(len(relative_paths) / (jobs * CHUNKS_PER_JOB)))
+        chunks = [relative_paths[i : i + size] for i in range(0, len(relative_paths), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(_process_chunk, repeat(folder), chunks, repeat(stages)))
+    else:
+        results = [_process_chunk(folder, relative_paths, stages)]
+
+    written = []
+    timings = dict.fromkeys(results[0][1], 0.0)
+    for chunk_written, chunk_timings in results:
+        written.extend(chunk_written)
+        for name, seconds in chunk_timings.items():
+            timings[name] += seconds
+
+    if not quiet:
+        for relative_path in written:
+            print(f"Updated {folder / relative_path}")
+
+    return PipelineReport(len(relative_paths), len(written), time.perf_counter() - start, timings)
+
+
+def add_pipeline_arguments(parser):
+    """Add the options of the pipeline runner to a command line parser."""
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes used to process the files",
+        default=1,
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Do not print the path of each file written",
+    )
+
+
+def print_report(report):
+    """Print the counts and the time of each stage of a pipeline run."""
+    print(
+        f"Processed {report.files} files, wrote {report.written} changed files "
+        f"in {report.wall:.3f} s."
+    )
+    if not report.timings:
+        return
+    width = max(len(name) for name in report.timings)
+    for name, seconds in report.timings.items():
+        print(f"  {name:<{width}}  {seconds:.3f} s")
+
+
+def main():
+    """Run all the Markdown post-processing stages."""
+    parser = argparse.ArgumentParser(description="Post-process Markdown files in one pass.")
+    parser.add_argument(
+        "--input_folder",
+        type=str,
+        help="Path to the folder containing Markdown files",
+        default=DEFAULT_INPUT_FOLDER,
+    )
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
+
+    folder_path = args.input_folder
+
+    if not Path(folder_path).is_dir():
+        raise NotADirectoryError(f"{folder_path} is not a valid directory.")
+
+    print_report(run_pipeline(folder_path, load_stages(), jobs=args.jobs, quiet=args.quiet))
+
+
+if __name__ == "__main__":
+    main()
@@ -23,27 +23,23 @@
 """Update the html file with local href paths if necessary."""
 
 import argparse
-import fileinput
-import os
 from pathlib import Path
 
+from md_pipeline import Stage, add_pipeline_arguments, print_report, run_pipeline
+
 DEFAULT_HTML_API_FOLDER = "doc/_build/html/api"
 DEFAULT_MARKDOWN_API_FOLDER = "doc/_build/markdown/api"
 
 
-def replace_windows_apostrophes(api_dir):
-    """Update the markdown file with local href paths if necessary."""
-    for root, dirs, files in os.walk(api_dir, topdown=True):
-        for file in files:
-            # The full path to the html file
-            full_file_path = Path(root) / Path(file)
+def replace_apostrophes(content):
+    """Replace Windows apostrophes with single quotes."""
+    return content.replace("‘", "'").replace("’", "'")
+
 
-            for line in fileinput.input(full_file_path, inplace=True, encoding="utf-8"):
-                if "" in line:
-                    line = line.replace("‘", "'")
-                if "" in line:
-                    line = line.replace("’", "'")
-                print(line, end="")
+def replace_windows_apostrophes(api_dir, jobs=1, quiet=False):
+    """Replace Windows apostrophes with single quotes in all files of a folder."""
+    stage = Stage("replace-windows-apostrophes", replace_apostrophes)
+    return run_pipeline(api_dir, [stage], suffix=None, jobs=jobs, quiet=quiet)
 
 
 def main():
@@ -61,6 +57,7 @@ def main():
         help="Path to the markdown api folder.",
         default=DEFAULT_MARKDOWN_API_FOLDER,
     )
+    add_pipeline_arguments(parser)
     args = parser.parse_args()
 
     repo_dir = Path(__file__).parent.parent
@@ -70,12 +67,12 @@ def main():
     full_markdown_api_dir = repo_dir / markdown_api_folder
 
     if full_html_api_dir.exists():
-        replace_windows_apostrophes(full_html_api_dir)
+        print_report(replace_windows_apostrophes(full_html_api_dir, args.jobs, args.quiet))
     else:
         raise NotADirectoryError(f"{full_html_api_dir} is not a valid directory.")
 
     if full_markdown_api_dir.exists():
-        replace_windows_apostrophes(full_markdown_api_dir)
+        print_report(replace_windows_apostrophes(full_markdown_api_dir, args.jobs, args.quiet))
     else:
         print(f"{full_markdown_api_dir} is not a valid directory. Skipping markdown.")
 
@@ -23,5 +23,9 @@
 """Init file for Mechanical Stubs."""
 
 from importlib.metadata import version
+from pathlib import Path
 
 __version__ = version("ansys-mechanical-stubs")
+
+# The versions packed into zip archives by the stub generator are imported from them
+__path__ += [str(archive) for archive in sorted(Path(__file__).parent.glob("v*.zip"))]
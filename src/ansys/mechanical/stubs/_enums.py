@@ -0,0 +1,146 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Lightweight enums for the generated stubs.
+
+Creating an ``enum.Enum`` class is one of the slowest parts of importing a stub
+module, and a version has hundreds of enums. ``LightEnum`` classes are plain
+classes whose members are created by ``__init_subclass__`` with precomputed
+name-to-member and value-to-member tables. The members are ``int`` instances of
+their enum, with the ``name`` and ``value`` of ``enum.IntEnum`` members.
+"""
+
+import types
+import typing
+
+
+def _is_sunder_or_dunder(name: str) -> bool:
+    """Get whether a name is reserved, like ``_missing_`` or ``__module__``, and isn't a member."""
+    return len(name) > 1 and name[0] == name[-1] == "_"
+
+
+class _MemberAttribute:
+    """Attribute of the members that a member of the same name hides on the class.
+
+    Like the ``name`` and ``value`` of ``enum.Enum``, ``Color.Red.name`` is the name of
+    the member, and ``Color.name`` is the member named ``name`` if there is one.
+    """
+
+    def __init__(self, fget: typing.Callable[["LightEnum"], typing.Any]):
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = name
+
+    def __get__(self, instance: typing.Any, owner: typing.Optional[type] = None) -> typing.Any:
+        if instance is None:
+            return owner._member_map_.get(self.attr, self)
+        return self.fget(instance)
+
+
+class _LightEnumType(type):
+    """Metaclass of the lightweight enums, for iteration and lookup by name."""
+
+    def __iter__(cls) -> typing.Iterator["LightEnum"]:
+        return iter(cls._members_)
+
+    def __len__(cls) -> int:
+        return len(cls._members_)
+
+    def __getitem__(cls, name: str) -> "LightEnum":
+        return cls._member_map_[name]
+
+    def __contains__(cls, member: typing.Any) -> bool:
+        return isinstance(member, cls) and member._name_ in cls._member_map_
+
+    def __repr__(cls) -> str:
+        return f"<enum {cls.__name__!r}>"
+
+    @property
+    def __members__(cls) -> typing.Mapping[str, "LightEnum"]:
+        return types.MappingProxyType(cls._member_map_)
+
+
+class LightEnum(int, metaclass=_LightEnumType):
+    """Base class of the lightweight enums.
+
+    The ``int`` attributes of a subclass are replaced by its members. As with
+    ``enum.Enum``, ``Color(1)`` is the member of value ``1`` and ``Color["Red"]`` is the
+    member named ``Red``. The first name of a value is its canonical name, the other
+    names are aliases. Names that start and end with an underscore aren't members.
+    """
+
+    _member_map_: typing.Dict[str, "LightEnum"] = {}
+    _value2member_map_: typing.Dict[int, "LightEnum"] = {}
+    _members_: typing.Tuple["LightEnum", ...] = ()
+    _name_: str
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        member_map = {}
+        value_map = {}
+        for name, value in list(vars(cls).items()):
+            if _is_sunder_or_dunder(name) or type(value) is not int:
+                continue
+            member = value_map.get(value)
+            if member is None:
+                member = int.__new__(cls, value)
+                member._name_ = name
+                value_map[value] = member
+            member_map[name] = member
+            if isinstance(getattr(LightEnum, name, None), _MemberAttribute):
+                # The member is found through the attribute, which it would hide on members
+                delattr(cls, name)
+            else:
+                setattr(cls, name, member)
+        cls._member_map_ = member_map
+        cls._value2member_map_ = value_map
+        cls._members_ = tuple(value_map.values())
+
+    def __new__(cls, value: int) -> "LightEnum":
+        try:
+            return cls._value2member_map_[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__qualname__}") from None
+
+    @_MemberAttribute
+    def name(self) -> str:
+        """Get the name of the member."""
+        return self._name_
+
+    @_MemberAttribute
+    def value(self) -> int:
+        """Get the value of the member."""
+        return int(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}.{self._name_}: {int(self)}>"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}.{self._name_}"
+
+    def __format__(self, format_spec: str) -> str:
+        return int.__format__(int(self), format_spec)
+
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> typing.Tuple:
+        return type(self), (int(self),)
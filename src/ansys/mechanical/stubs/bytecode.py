@@ -0,0 +1,257 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Byte-compile the generated stub trees and check that their bytecode is up to date.
+
+The ``vXXX`` packages are thousands of generated files, and compiling them is most of
+the time of their first import. Wheels can't ship ``__pycache__`` directories, and
+installers such as uv don't compile them by default, so the first import of a fresh
+environment compiles the whole tree. When ``site-packages`` is read-only, the bytecode
+isn't even cached and every process pays this cost again.
+
+Run this module once after installing the package, for example in the build of a
+container image, to compile the trees in parallel::
+
+    python -m ansys.mechanical.stubs.bytecode --jobs 8
+
+The bytecode is hash-based, so it stays valid when the files are copied or reinstalled
+with new modification times. Pass ``--check`` to list the files whose bytecode is
+missing or out of date instead, and ``--python`` to also compile for other interpreters.
+This module only uses the standard library, so it can run as a script under any of them.
+"""
+
+import argparse
+import concurrent.futures
+import importlib.util
+import pathlib
+import py_compile
+import re
+import subprocess
+import sys
+import typing
+
+PACKAGE_DIR = pathlib.Path(__file__).parent
+"""The ``ansys/mechanical/stubs`` directory, which has the ``vXXX`` packages."""
+
+VERSION_PATTERN = re.compile(r"v\d+")
+
+# Flags of the header of a .pyc file, see PEP 552
+_HASH_BASED = 0b01
+
+
+def version_dirs(package_dir: pathlib.Path = PACKAGE_DIR) -> typing.List[pathlib.Path]:
+    """Get the generated ``vXXX`` packages.
+
+    Parameters
+    ----------
+    package_dir: pathlib.Path
+        The directory with the packages.
+
+    Returns
+    -------
+    typing.List[pathlib.Path]
+        The sorted paths of the packages.
+    """
+    return sorted(
+        path
+        for path in package_dir.iterdir()
+        if path.is_dir() and VERSION_PATTERN.fullmatch(path.name)
+    )
+
+
+def is_stale(source: pathlib.Path) -> bool:
+    """Get whether the bytecode of a source file is missing or out of date.
+
+    The bytecode is checked as the import system checks it, for the running
+    interpreter. Unlike the import system, the source hash of unchecked hash-based
+    bytecode is checked too.
+
+    Parameters
+    ----------
+    source: pathlib.Path
+        Path to the ``.py`` file.
+
+    Returns
+    -------
+    bool
+        Whether the ``.pyc`` file of the source file must be written again.
+    """
+    try:
+        with pathlib.Path(importlib.util.cache_from_source(source)).open("rb") as stream:
+            header = stream.read(16)
+    except OSError:
+        return True
+    if len(header) < 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return True
+    if int.from_bytes(header[4:8], "little") & _HASH_BASED:
+        return header[8:16] != importlib.util.source_hash(source.read_bytes())
+    stat = source.stat()
+    mtime = (int(stat.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+    size = (stat.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+    return header[8:12] != mtime or header[12:16] != size
+
+
+def find_orphans(root: pathlib.Path) -> typing.List[pathlib.Path]:
+    """Get the bytecode files of the running interpreter whose source file is removed.
+
+    Parameters
+    ----------
+    root: pathlib.Path
+        The directory of the tree.
+
+    Returns
+    -------
+    typing.List[pathlib.Path]
+        The sorted paths of the orphaned ``.pyc`` files.
+    """
+    orphans = []
+    for cache_file in root.rglob(f"__pycache__/*.{sys.implementation.cache_tag}*.pyc"):
+        if not pathlib.Path(importlib.util.source_from_cache(cache_file)).is_file():
+            orphans.append(cache_file)
+    return sorted(orphans)
+
+
+def check_tree(root: pathlib.Path) -> typing.List[pathlib.Path]:
+    """Get the files of a tree whose bytecode is out of sync with the sources.
+
+    Parameters
+    ----------
+    root: pathlib.Path
+        The directory of the tree. For example, the ``v261`` package.
+
+    Returns
+    -------
+    typing.List[pathlib.Path]
+        The sorted source files whose bytecode is stale, followed by the orphaned
+        bytecode files. The list is empty if the bytecode is in sync.
+    """
+    stale = [source for source in sorted(root.rglob("*.py")) if is_stale(source)]
+    return stale + find_orphans(root)
+
+
+def _compile_file(source: pathlib.Path) -> None:
+    """Write the hash-based bytecode of a source file."""
+    py_compile.compile(
+        str(source),
+        doraise=True,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+
+
+def compile_tree(root: pathlib.Path, jobs: int = 1) -> typing.List[pathlib.Path]:
+    """Write the bytecode of the files of a tree that is missing or out of date.
+
+    The bytecode is checked-hash based, see PEP 552. The import system validates it
+    against the hash of the source file instead of its modification time, which
+    changes when the tree is installed or copied. Orphaned bytecode files are removed.
+
+    Parameters
+    ----------
+    root: pathlib.Path
+        The directory of the tree. For example, the ``v261`` package.
+    jobs: int
+        Number of processes compiling the files.
+
+    Returns
+    -------
+    typing.List[pathlib.Path]
+        The sorted source files that were compiled.
+    """
+    stale = [source for source in sorted(root.rglob("*.py")) if is_stale(source)]
+    if jobs > 1 and len(stale) > 1:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            chunksize = max(1, len(stale) // (jobs * 8))
+            for _ in executor.map(_compile_file, stale, chunksize=chunksize):
+                pass
+    else:
+        for source in stale:
+            _compile_file(source)
+    for orphan in find_orphans(root):
+        orphan.unlink()
+    return stale
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """Compile or check the bytecode of the stub trees from the command line.
+
+    Parameters
+    ----------
+    argv: list
+        The command line arguments. ``sys.argv`` is used if it is ``None``.
+
+    Returns
+    -------
+    int
+        The exit code. It is ``1`` if ``--check`` finds out of date bytecode.
+    """
+    parser = argparse.ArgumentParser(
+        description="Byte-compile the Mechanical stub trees, or check their bytecode."
+    )
+    parser.add_argument(
+        "roots",
+        type=pathlib.Path,
+        nargs="*",
+        help="Directories to compile. All the installed vXXX packages by default.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="List the files whose bytecode is missing or out of date instead of compiling.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes compiling the files.",
+        default=1,
+    )
+    parser.add_argument(
+        "--python",
+        action="append",
+        default=[],
+        help="Other interpreter to also compile or check the bytecode for. Can be repeated.",
+    )
+    args = parser.parse_args(argv)
+
+    roots = [root.resolve() for root in args.roots] or version_dirs()
+    exit_code = 0
+    for root in roots:
+        if args.check:
+            out_of_sync = check_tree(root)
+            for path in out_of_sync:
+                print(f"Out of date bytecode: {path}")
+            exit_code = max(exit_code, int(bool(out_of_sync)))
+        else:
+            compiled = compile_tree(root, args.jobs)
+            print(f"Compiled {len(compiled)} files in {root} for {sys.implementation.cache_tag}.")
+
+    # Bytecode is specific to each interpreter version, so each one writes its own
+    forwarded = [str(root) for root in roots] + ["--jobs", str(args.jobs)]
+    if args.check:
+        forwarded.append("--check")
+    for python in args.python:
+        result = subprocess.run([python, __file__, *forwarded], check=False)
+        exit_code = max(exit_code, result.returncode)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,16 +22,26 @@
 
 """Create __init__.py files from the content of the assembly XML files."""
 
+import argparse
+import cProfile
 import logging
 import os
 from pathlib import Path
 import shutil
 import sys
+import typing
 
-import clr
 import generate_content
 
-import System  # isort: skip
+from ansys.mechanical.stubs import bytecode
+from ansys.mechanical.stubs.stub_generator import instrumentation
+from ansys.mechanical.stubs.stub_generator.markdown_writer import render_markdown
+from ansys.mechanical.stubs.stub_generator.module_header import module_header
+from ansys.mechanical.stubs.stub_generator.pack import pack_version
+from ansys.mechanical.stubs.stub_generator.snapshot import read_snapshot
+
+if typing.TYPE_CHECKING:
+    import System
 
 ACCEPTED_TYPES = {
     "Ansys.Core.Units.Quantity",
@@ -44,6 +54,15 @@ ACCEPTED_TYPES = {
     "Ansys.ACT.Core.Math.Vector3D",
 }
 
+PUBLISHED_ATTRIBUTE = "Ansys.Utilities.Sdk.PublishedAttribute"
+
+# Whether each type is published, by assembly qualified name
+_published_types = {}
+
+# The System.Type of the published attribute, or None if it isn't found yet
+_published_attribute_type = None
+_published_attribute_searched = False
+
 
 def get_version():
     """Get the install directory and version of Ansys Mechanical installed on the system.
@@ -63,6 +82,8 @@ def get_version():
 
 def resolve():
     """Add assembly resolver for the Ansys Mechanical install."""
+    import clr
+
     install_dir, version = get_version()
     platform_string = "winx64" if os.name == "nt" else "linx64"
     ansys_mech_embedding_path = str(Path(install_dir, "aisol", "bin", platform_string))
@@ -93,6 +114,7 @@ def resolve():
         clr.AddReference("Ans.EngineeringData")
 
     import Ansys
+    import System
 
     assembly_resolver = Ansys.Mechanical.Embedding.AssemblyResolver
     resolve_handler = assembly_resolver.MechanicalResolveEventHandler
@@ -110,9 +132,64 @@ def clean(outdir):
     shutil.rmtree(outdir, ignore_errors=True)
 
 
+def get_published_attribute_type():
+    """Get the type of the published attribute from the loaded assemblies.
+
+    Returns
+    -------
+    System.Type
+        The type of ``Ansys.Utilities.Sdk.PublishedAttribute``, or ``None`` if the
+        assembly that defines it isn't loaded.
+    """
+    global _published_attribute_searched, _published_attribute_type
+
+    if _published_attribute_type is None and not _published_attribute_searched:
+        import System
+
+        _published_attribute_searched = True
+        for assembly in System.AppDomain.CurrentDomain.GetAssemblies():
+            attribute_type = assembly.GetType(PUBLISHED_ATTRIBUTE)
+            if attribute_type is not None:
+                _published_attribute_type = attribute_type
+                break
+    return _published_attribute_type
+
+
+def has_published_attribute(mod_type: "System.RuntimeType"):
+    """Check if a type or one of its base types has the published attribute.
+
+    ``IsDefined`` checks the attribute without creating instances of the attributes
+    of the type, unlike ``GetCustomAttributes``. ``GetCustomAttributes`` is only used
+    until the type of the attribute is found.
+
+    Parameters
+    ----------
+    mod_type: System.RuntimeType
+        A module type.
+
+    Returns
+    -------
+    bool
+        Whether the type has ``Ansys.Utilities.Sdk.PublishedAttribute``.
+    """
+    global _published_attribute_type
+
+    attribute_type = get_published_attribute_type()
+    if attribute_type is not None:
+        return bool(mod_type.IsDefined(attribute_type, True))
+
+    for attr in mod_type.GetCustomAttributes(True):
+        if str(attr) == PUBLISHED_ATTRIBUTE:
+            _published_attribute_type = attr.GetType()
+            return True
+    return False
+
+
 def is_type_published(mod_type: "System.RuntimeType"):
     """Get published type if it exists.
 
+    The result is cached for each type.
+
     Parameters
     ----------
     mod_type: System.RuntimeType
@@ -121,33 +198,51 @@ def is_type_published(mod_type: "System.RuntimeType"):
     Returns
     -------
     bool
-        `True` if "Ansys.Utilities.Sdk.PublishedAttribute" is in map(str, attrs)
-        `False` if "Ansys.Utilities.Sdk.PublishedAttribute" is not in map(str, attrs)
+        `True` if the type is in ACCEPTED_TYPES or has "Ansys.Utilities.Sdk.PublishedAttribute"
+        `False` otherwise
     """
     try:
         # Explicit allow-list should always win, regardless of what other
         # attributes are present on the type.
         try:
-            if mod_type.FullName in ACCEPTED_TYPES:
+            full_name = mod_type.FullName
+            if full_name in ACCEPTED_TYPES:
                 return True
         except Exception:
             return False
 
-        attrs = mod_type.GetCustomAttributes(True)
-        if len(attrs) == 0:
-            return False
-
-        return "Ansys.Utilities.Sdk.PublishedAttribute" in map(str, attrs)
+        key = mod_type.AssemblyQualifiedName or full_name
+        published = _published_types.get(key)
+        if published is None:
+            instrumentation.count("published_checks")
+            published = _published_types[key] = has_published_attribute(mod_type)
+        else:
+            instrumentation.count("published_cache_hits")
+        return published
     except Exception as e:
         print(e)
 
 
-def make(base_dir, outdir, assemblies, str_version):
+def make(
+    base_dir,
+    outdir,
+    assemblies,
+    str_version,
+    output_format="py",
+    cache_dir=None,
+    snapshot_dir=None,
+    jobs=1,
+    markdown_dir=None,
+    inheritance=False,
+    split_size=None,
+    light_enums=False,
+):
     """Generate the __init__.py files from assembly files.
 
     Make __init__.py files in src/ansys/mechanical/stubs, generate
     classes, properties, and methods with their docstrings from assembly files from the
-    Ansys Mechanical install, and add import statements to the __init__.py files.
+    Ansys Mechanical install, and add lazy submodule loaders to the __init__.py files.
+    Only the files whose content changed since the last run are written.
 
     Parameters
     ----------
@@ -155,95 +250,197 @@ def make(base_dir, outdir, assemblies, str_version):
         Path to where the init files are generated.
     assemblies: list
         List of Mechanical assembly files to create classes, properties, and methods from.
+    output_format: str
+        ``"py"`` to generate the runtime ``__init__.py`` files, ``"pyi"`` to generate
+        a stub-only tree of PEP 561 ``__init__.pyi`` files, or ``"both"``.
+    cache_dir: pathlib.Path
+        Path to the cache of the XML doc files, which is reused by later runs.
+        The XML doc files are parsed on every run if it is ``None``.
+    snapshot_dir: pathlib.Path
+        Path to write a snapshot of each assembly to, so that the stubs can be rendered
+        again with ``render`` without the Mechanical install. No snapshots are written
+        if it is ``None``.
+    jobs: int
+        Number of processes rendering the namespaces of each assembly.
+    markdown_dir: pathlib.Path
+        Path to write the Markdown API reference of the version to. No Markdown is
+        written if it is ``None``.
+    inheritance: bool
+        Whether the classes derive from the classes of their .NET base class and
+        interfaces and only define the members they don't inherit, instead of
+        defining all their inherited members.
+    split_size: int
+        Largest number of members of the runtime files of a namespace. The types of
+        larger namespaces are split into private submodules that are imported on
+        first access. The types of a namespace are written to its ``__init__.py``
+        file if it is ``None``.
+    light_enums: bool
+        Whether the enums of the runtime files derive from the lightweight
+        ``LightEnum`` class instead of ``enum.Enum``, which is slow to create on import.
     """
     install_dir, version = get_version()
     version = str(version)
     version = version[:2] + "." + version[2:]
 
     outdir.mkdir(parents=True, exist_ok=True)
+    writer = generate_content.StubWriter(outdir)
+
+    modules = generate_content.make(
+        outdir,
+        assemblies,
+        type_filter=is_type_published,
+        output_format=output_format,
+        cache_dir=cache_dir,
+        snapshot_dir=snapshot_dir,
+        jobs=jobs,
+        writer=writer,
+        inheritance=inheritance,
+        split_size=split_size,
+        light_enums=light_enums,
+    )
+
+    write_package_files(base_dir, outdir, str_version, output_format, writer)
+    if markdown_dir is not None:
+        write_markdown(modules, markdown_dir, str_version)
+
+
+def write_markdown(modules, markdown_dir, str_version):
+    """Write the Markdown API reference of a version.
+
+    Parameters
+    ----------
+    modules: list
+        The modules of all the assemblies of the version.
+    markdown_dir: pathlib.Path
+        Path to the Markdown API reference.
+    str_version: str
+        The Mechanical version. For example, ``v261``.
+    """
+    version_dir = Path(markdown_dir, "ansys", "mechanical", "stubs", str_version)
+    version_dir.mkdir(parents=True, exist_ok=True)
+    writer = generate_content.StubWriter(version_dir)
+    render_markdown(modules, markdown_dir, str_version, writer)
+    writer.flush()
+    print(
+        f"Wrote {writer.written} Markdown pages, skipped {writer.skipped} unchanged pages, "
+        f"removed {writer.removed} stale pages in {version_dir}."
+    )
+
+
+def render(
+    base_dir,
+    snapshot_dir,
+    output_format="py",
+    jobs=1,
+    markdown_dir=None,
+    inheritance=False,
+    split_size=None,
+    light_enums=False,
+):
+    """Generate the __init__.py files from the snapshots of the assembly files.
+
+    The snapshots are written by ``make``. pythonnet and the Mechanical install are
+    not needed to render them.
+
+    Parameters
+    ----------
+    base_dir: pathlib.Path
+        Path to the src/ansys/mechanical/stubs directory.
+    snapshot_dir: pathlib.Path
+        Path to the snapshot files.
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``make``.
+    jobs: int
+        Number of processes rendering the namespaces of each assembly.
+    markdown_dir: pathlib.Path
+        Path to write the Markdown API reference of the version to. See ``make``.
+    inheritance: bool
+        Whether the classes derive from their bases. See ``make``.
+    split_size: int
+        Largest number of members of the runtime files of a namespace. See ``make``.
+    light_enums: bool
+        Whether the enums of the runtime files derive from ``LightEnum``. See ``make``.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to where the init files are generated.
+    """
+    versions = set()
+    modules = []
+    snapshot_paths = sorted(Path(snapshot_dir).glob("*.jsonl"))
+    if len(snapshot_paths) == 0:
+        raise FileNotFoundError(f"No snapshot files in {snapshot_dir}")
+    for snapshot_path in snapshot_paths:
+        with instrumentation.stage("snapshot_read"):
+            snapshot = read_snapshot(snapshot_path)
+        versions.add(snapshot.version)
+        modules.extend(snapshot.modules)
+    if len(versions) != 1:
+        raise ValueError(f"The snapshots in {snapshot_dir} are of several versions: {versions}")
+
+    outdir = Path(base_dir) / versions.pop()
+    outdir.mkdir(parents=True, exist_ok=True)
+    writer = generate_content.StubWriter(outdir)
+    generate_content.render(
+        modules, outdir, output_format, jobs, writer, inheritance, split_size, light_enums
+    )
+    write_package_files(base_dir, outdir, outdir.name, output_format, writer)
+    if markdown_dir is not None:
+        write_markdown(modules, markdown_dir, outdir.name)
+    return outdir
+
+
+def compile_bytecode(outdir, jobs=1):
+    """Write the bytecode of the generated files that is missing or out of date.
+
+    Parameters
+    ----------
+    outdir: pathlib.Path
+        Path to where the init files are generated.
+    jobs: int
+        Number of processes compiling the files.
+    """
+    with instrumentation.stage("bytecode"):
+        compiled = bytecode.compile_tree(outdir, jobs)
+    print(f"Compiled {len(compiled)} files in {outdir}.")
 
-    for assembly in assemblies:
-        generate_content.make(outdir, assembly, type_filter=is_type_published)
-
-    outdir_init = outdir / "__init__.py"
-    with outdir_init.open("w") as f:
-        f.write(f'"""Ansys Mechanical {str_version} module."""\n')
-        f.write(f"""import ansys.mechanical.stubs.{str_version}.Ansys as Ansys""")
-
-    path = outdir / "Ansys"
-    path_init = path / "__init__.py"
-
-    # Make src/ansys/mechanical/stubs/v<version>/Ansys/__init__.py
-    with path_init.open("w") as f:
-        f.write('"""Ansys module."""\n')
-        for directory in path.iterdir():
-            if directory.is_dir():
-                dir_name = directory.name
-                f.write(
-                    f"import ansys.mechanical.stubs.{str_version}.Ansys.{dir_name} as {dir_name}\n"
-                )
-        f.close()
-
-    # Add import statements to init files
-    for dirpath, dirnames, filenames in os.walk(path):
-        for dir in dirnames:
-            full_path = str(Path(dirpath, dir))
-            init_path = Path(full_path, "__init__.py")
-
-            if "__pycache__" not in str(init_path):
-                module_list = []
-                original_str = f"{Path(base_dir)}{os.sep}"
-                import_str = full_path.replace(original_str, "ansys.mechanical.stubs.").replace(
-                    os.sep, "."
-                )
-                [
-                    module_list.append(Path(dir.path).name)
-                    for dir in os.scandir(Path(init_path).parent)
-                ]
-
-                # Create list of import statements for each submodule. For example,
-                # "import ansys.mechanical.stubs.v<version>.Ansys.ACT.Common as Common"
-                # in Ansys/ACT/__init__.py
-                import_statements = []
-                for module in module_list:
-                    if module != "__init__.py":
-                        import_statements.append(f"import {import_str}.{module} as {module}\n")
-
-                # If __init__ file is empty, add a docstring to the top of the file and
-                # write module import statements. For example, Ansys/ACT/__init__.py
-                if (not init_path.is_file()) or (init_path.stat().st_size == 0):
-                    with init_path.open("a") as f:
-                        f.write(f'"""{Path(full_path).name} module."""\n')
-                        f.write("".join(import_statements))
-                else:
-                    # Add "import Ansys" to the top of __init__ files
-                    import_statements.insert(0, "if typing.TYPE_CHECKING:\n    import Ansys\n")
-
-                    # Read the __init__ file contents
-                    with init_path.open("r", encoding="utf-8") as f:
-                        content_list = f.readlines()
-                        if '"' in content_list[0]:
-                            content_list.insert(1, "from __future__ import annotations\n")
-                        else:
-                            content_list.insert(0, "from __future__ import annotations\n")
-                        contents = "".join(content_list)
-
-                    # Add all module import statements from import_statements to the top of the file
-                    # For example, Ansys/ACT/Automation/Mechanical
-                    with init_path.open("w", encoding="utf-8") as f:
-                        contents = contents.replace(
-                            "import typing", f"import typing\n{''.join(import_statements)}"
-                        )
-
-                        f.write(contents)
-
-                        datamodel_interfaces = (
-                            Path("Ansys") / "Mechanical" / "DataModel" / "Interfaces"
-                        )
-                        if str(datamodel_interfaces) in str(init_path):
-                            f.write("class DataModelObject(IDataModelObject):\n")
-                            f.write("    pass\n")
 
+def write_package_files(base_dir, outdir, str_version, output_format, writer):
+    """Write the version module, the PEP 561 marker, and the stub tree.
+
+    Parameters
+    ----------
+    base_dir: pathlib.Path
+        Path to the src/ansys/mechanical/stubs directory.
+    outdir: pathlib.Path
+        Path to where the init files are generated.
+    str_version: str
+        The Mechanical version. For example, ``v261``.
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``make``.
+    writer: generate_content.StubWriter
+        The writer of the stub tree, with the files rendered by this run. Only the
+        files whose content changed are written, and the files of the last run that
+        this run didn't render are removed.
+    """
+    import_str = f"ansys.mechanical.stubs.{str_version}"
+    with instrumentation.stage("package_files"):
+        for suffix in generate_content.OUTPUT_SUFFIXES[output_format]:
+            header = module_header(import_str, ["Ansys"], pyi=suffix == ".pyi")
+            contents = f'"""Ansys Mechanical {str_version} module."""\n{header}'
+            writer.write_text(outdir / f"__init__{suffix}", contents)
+    writer.flush()
+
+    py_typed = Path(base_dir) / "py.typed"
+    if output_format != "py" and not py_typed.is_file():
+        # PEP 561 marker for type checkers
+        py_typed.touch()
+
+    print(
+        f"Wrote {writer.written} files, skipped {writer.skipped} unchanged files, "
+        f"removed {writer.removed} stale files."
+    )
     print("Done processing all mechanical stubs.")
 
 
@@ -271,20 +468,151 @@ def write_docs(commands, tiny_pages_path):
 
 def main():
     """Generate the Mechanical stubs based on assembly files."""
+    parser = argparse.ArgumentParser(description="Generate the Mechanical stubs.")
+    parser.add_argument(
+        "--output_format",
+        type=str,
+        choices=sorted(generate_content.OUTPUT_SUFFIXES),
+        help="Write runtime __init__.py files, stub-only __init__.pyi files, or both.",
+        default="py",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=Path,
+        help="Directory to cache the XML doc files of the assemblies in between runs.",
+        default=None,
+    )
+    parser.add_argument(
+        "--snapshot_dir",
+        type=Path,
+        help="Directory to write a snapshot of the types of each assembly to.",
+        default=None,
+    )
+    parser.add_argument(
+        "--from_snapshot",
+        type=Path,
+        help="Render the stubs from the snapshots in this directory, without Mechanical.",
+        default=None,
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of processes rendering the namespaces of each assembly.",
+        default=1,
+    )
+    parser.add_argument(
+        "--markdown_dir",
+        type=Path,
+        help="Directory to write the Markdown API reference of the version to.",
+        default=None,
+    )
+    parser.add_argument(
+        "--inheritance",
+        action="store_true",
+        help="Derive the classes from their base classes and interfaces instead of "
+        "flattening the inherited members into each class.",
+    )
+    parser.add_argument(
+        "--split_size",
+        type=int,
+        help="Split the types of namespaces with more members than this into files that "
+        "are imported on first access.",
+        default=None,
+    )
+    parser.add_argument(
+        "--light_enums",
+        action="store_true",
+        help="Derive the enums of the runtime files from a lightweight int class, which is "
+        "much cheaper to create on import than enum.Enum.",
+    )
+    parser.add_argument(
+        "--bytecode",
+        action="store_true",
+        help="Write the hash-based bytecode of the generated files for this interpreter.",
+    )
+    parser.add_argument(
+        "--pack",
+        action="store_true",
+        help="Pack the __init__.py files of the version into a zip archive with their "
+        "bytecode, which is imported with zipimport.",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="JSON file to write the time and counters of each stage of the run to.",
+        default=None,
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help="File to write cProfile statistics of the run to, for example for snakeviz.",
+        default=None,
+    )
+    args = parser.parse_args()
+    if args.bytecode and args.pack:
+        # The archive has its own bytecode, and packing removes the compiled files
+        parser.error("--bytecode can't be used with --pack, which writes its own bytecode")
+
+    base_dir = Path(__file__).parent.parent
+
+    logging.getLogger().setLevel(logging.INFO)
+    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
+
+    if args.report is not None:
+        instrumentation.start_report()
+    profiler = cProfile.Profile() if args.profile is not None else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        generate(base_dir, args)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"Wrote the profile of the run to {args.profile}")
+        report = instrumentation.stop_report()
+        if report is not None:
+            report.write(args.report)
+            print(f"Wrote the report of the run to {args.report}")
+
+
+def generate(base_dir, args):
+    """Generate the Mechanical stubs with the command line arguments of ``main``.
+
+    Parameters
+    ----------
+    base_dir: pathlib.Path
+        Path to the src/ansys/mechanical/stubs directory.
+    args: argparse.Namespace
+        The command line arguments.
+    """
     make_bool = True
     clean_bool = False
 
+    if args.from_snapshot is not None:
+        outdir = render(
+            base_dir,
+            args.from_snapshot,
+            args.output_format,
+            args.jobs,
+            args.markdown_dir,
+            args.inheritance,
+            args.split_size,
+            args.light_enums,
+        )
+        if args.bytecode:
+            compile_bytecode(outdir, args.jobs)
+        if args.pack:
+            pack_version(outdir, args.jobs)
+        return
+
     # Get version of the Mechanical install
     install_dir, version = get_version()
     version = f"v{str(version)}"
 
     # Path in which to generate the __init__.py files
-    base_dir = Path(__file__).parent.parent
     outdir = base_dir / version
 
-    logging.getLogger().setLevel(logging.INFO)
-    logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
-
     # Assembly files to read from the Ansys Mechanical install.
     assemblies = [
         "Ansys.Mechanical.DataModel",
@@ -295,10 +623,28 @@ def main():
         "Ans.Core",
     ]
 
-    resolve()
+    with instrumentation.stage("resolve"):
+        resolve()
 
     if make_bool:
-        make(base_dir, outdir, assemblies, version)
+        make(
+            base_dir,
+            outdir,
+            assemblies,
+            version,
+            args.output_format,
+            args.cache_dir,
+            args.snapshot_dir,
+            args.jobs,
+            args.markdown_dir,
+            args.inheritance,
+            args.split_size,
+            args.light_enums,
+        )
+        if args.bytecode:
+            compile_bytecode(outdir, args.jobs)
+        if args.pack:
+            pack_version(outdir, args.jobs)
 
     if clean_bool:
         clean(outdir)
@@ -22,51 +22,72 @@
 
 """Module containing routine to generate python stubs for an assembly."""
 
-from dataclasses import dataclass
+import collections
+import concurrent.futures
+import functools
+import io
 import json
 import logging
+import multiprocessing
 import pathlib
-import re
+import sys
 import typing
-import xml.etree.ElementTree as ElementTree
-
-import clr
-import System
-
-C_TO_PYTHON = {
-    "IronPython.Runtime.PythonTuple": "tuple",
-    "System.Array": "typing.List",
-    "System.Boolean": "bool",
-    "System.Collections.Generic.IDictionary": "dict",
-    "System.Collections.Generic.IEnumerable": "typing.Iterable",
-    "System.Collections.Generic.IEnumerator": "typing.Iterator",
-    "System.Collections.Generic.IList": "typing.List",
-    "System.Collections.Generic.IReadOnlyDictionary": "dict",
-    "System.Collections.Generic.IReadOnlyList": "tuple",
-    "System.Collections.Generic.KeyValuePair": "dict",
-    "System.Collections.Generic.List": "typing.List",
-    "System.Collections.ICollection": "typing.Collection",
-    "System.Collections.IEnumerable": "typing.Iterable",
-    "System.Collections.IEnumerator": "typing.Iterator",
-    "System.DateTime": "typing.Any",
-    "System.Double": "float",
-    "System.Int32": "int",
-    "System.IFormatProvider": "typing.Any",
-    "System.MidpointRounding": "typing.Optional[float]",
-    "System.Object": "typing.Any",
-    "System.String": "str",
-    "System.Tuple": "tuple",
-    "System.Type": "type",
-    "System.UInt32": "int",
-    "System.Void": "None",
+
+from ansys.mechanical.stubs.stub_generator import instrumentation
+from ansys.mechanical.stubs.stub_generator.inheritance import ModuleBases, resolve_inheritance
+from ansys.mechanical.stubs.stub_generator.module_header import (
+    DATAMODEL_INTERFACES,
+    get_submodules,
+    module_header,
+    type_module_header,
+)
+from ansys.mechanical.stubs.stub_generator.snapshot import (
+    EnumField,
+    Method,
+    ModuleInfo,
+    Param,
+    Property,
+    Snapshot,
+    TypeInfo,
+    write_snapshot,
+)
+from ansys.mechanical.stubs.stub_generator.stub_writer import StubWriter, write_file
+from ansys.mechanical.stubs.stub_generator.type_names import (  # noqa: F401
+    C_TO_PYTHON,
+    EXCLUDED_TYPES_LIST,
+    display_name,
+    doc_id,
+    parse_type_name,
+    python_annotation,
+    type_doc_id,
+)
+from ansys.mechanical.stubs.stub_generator.xml_doc import (
+    DocCache,
+    DocMember,
+    doc_key_filter,
+    load_doc,
+)
+
+# pythonnet is only needed to extract the types of an assembly, not to render them
+if typing.TYPE_CHECKING:
+    import System
+
+# File suffixes written for each output format. ``.pyi`` files are PEP 561 stubs.
+OUTPUT_SUFFIXES = {
+    "py": (".py",),
+    "pyi": (".pyi",),
+    "both": (".py", ".pyi"),
+}
+
+# The only namespaces written for some assemblies. Every namespace of the other
+# assemblies is written, except the excluded ones.
+NAMESPACE_ALLOW_LISTS = {
+    "Ans.Core": ["Ansys.Core.Units"],
+    "Ansys.ACT.Interfaces": ["Ansys.ACT.Interfaces.Common", "Ansys.ACT.Math"],
 }
 
-EXCLUDED_TYPES_LIST = [
-    "System.IAsyncResult",
-    "System.IDisposable",
-    "System.Func",
-    "System.Delegate",
-]
+# Namespaces that contain one of these names are never written
+EXCLUDED_NAMESPACE_NAMES = ["DesignModeler"]
 
 # Maps interface return types to their concrete runtime types for more accurate stubs.
 TYPE_OVERRIDES = {
@@ -74,38 +95,20 @@ TYPE_OVERRIDES = {
 }
 
 
+@functools.lru_cache(maxsize=4096)
 def c_types_to_python(type_str):
     """Replace C# types with Python types.
 
+    Type names found in ``C_TO_PYTHON`` are replaced, and names of Ansys types are
+    quoted as forward references. Types that contain an excluded type are quoted as
+    a whole.
+
     Parameters
     ----------
     type_str: str
         String containing C# type.
     """
-    for key, value in C_TO_PYTHON.items():
-        # Replace C# type with Python type
-        type_str = type_str.replace(key, value)
-
-        if '"' in type_str:
-            # Remove double quotes from type
-            type_str = type_str.replace('"', "")
-
-    # Wrap strings that contain Ansys or ChildrenType in quotes
-    ansys_regex = re.compile("(Ansys[^],]*|ChildrenType)")
-    matches = set(ansys_regex.findall(type_str))
-
-    for match in matches:
-        type_str = re.sub(ansys_regex, match, type_str)
-
-    # If System.x doesn't have a replacement, wrap quotes around it
-    if "System." in type_str:
-        for excluded_type in EXCLUDED_TYPES_LIST:
-            if excluded_type in type_str:
-                type_str = type_str.replace('"', "")
-                type_str = f'"{type_str}"'
-                break
-
-    return type_str
+    return python_annotation(parse_type_name(type_str))
 
 
 def is_namespace(something):
@@ -122,11 +125,15 @@ def is_namespace(something):
         True if object is Namespace: Module
         False if object is not Namespace: Module
     """
+    import System
+
     if isinstance(something, type(System)):
         return True
 
 
-def iter_module(module, type_filter: typing.Callable = None):
+def iter_module(
+    module, type_filter: typing.Callable = None, namespace_filter: typing.Callable = None
+):
     """Recursively iterates through all namespaces in assembly.
 
     Parameters
@@ -135,6 +142,9 @@ def iter_module(module, type_filter: typing.Callable = None):
         An assembly module
     type_filter: typing.Callable
         Whether or not the type is published
+    namespace_filter: typing.Callable
+        Whether or not the types of a namespace are written. It is checked before
+        ``type_filter``, which reads the attributes of the type.
 
     Returns
     -------
@@ -144,9 +154,11 @@ def iter_module(module, type_filter: typing.Callable = None):
     mod_types = module.GetTypes()
     namespaces = {}
     for mod_type in mod_types:
+        namespace = mod_type.Namespace
+        if namespace_filter and not namespace_filter(namespace):
+            continue
         if type_filter and not type_filter(mod_type):
             continue
-        namespace = mod_type.Namespace
         if namespace not in namespaces.keys():
             namespaces[namespace] = [mod_type]
         else:
@@ -155,7 +167,9 @@ def iter_module(module, type_filter: typing.Callable = None):
 
 
 def crawl_loaded_references(
-    assembly: "System.Reflection.RuntimeAssembly", type_filter: typing.Callable = None
+    assembly: "System.Reflection.RuntimeAssembly",
+    type_filter: typing.Callable = None,
+    namespace_filter: typing.Callable = None,
 ) -> dict:
     """Crawl Loaded assemblies to get Namespaces.
 
@@ -165,13 +179,39 @@ def crawl_loaded_references(
         An assembly. For example, Ansys.ACT.WB1.
     type_filter: typing.Callable
         Whether or not the type is published
+    namespace_filter: typing.Callable
+        Whether or not the types of a namespace are written
 
     Returns
     -------
     dict
         Dictionary of namespaces in the assembly
     """
-    return iter_module(assembly, type_filter)
+    return iter_module(assembly, type_filter, namespace_filter)
+
+
+def is_namespace_written(assembly_name: str, namespace: typing.Optional[str]) -> bool:
+    """Check if the types of a namespace of an assembly are written.
+
+    Parameters
+    ----------
+    assembly_name: str
+        The name of the assembly
+    namespace: typing.Optional[str]
+        The namespace of a type, or ``None`` for the global namespace
+
+    Returns
+    -------
+    bool
+        ``False`` if the assembly has an allow list in ``NAMESPACE_ALLOW_LISTS`` that
+        doesn't have the namespace or if the namespace is excluded, ``True`` otherwise
+    """
+    if namespace is None:
+        return False
+    allow_list = NAMESPACE_ALLOW_LISTS.get(assembly_name)
+    if allow_list is not None and namespace not in allow_list:
+        return False
+    return not any(name in namespace for name in EXCLUDED_NAMESPACE_NAMES)
 
 
 def dump_types(namespaces: dict):
@@ -186,72 +226,6 @@ def dump_types(namespaces: dict):
     logging.debug(json.dumps(printable_namespaces, indent=2, sort_keys=True))
 
 
-class DocMember:
-    """Docstring member."""
-
-    def __init__(self, element: ElementTree.Element):
-        self._element = element
-
-    @classmethod
-    def __get_element_text(cls, element: typing.Optional[ElementTree.Element]):
-        """Get the text of an element."""
-        if element is None:
-            return None
-        return element.text
-
-    @classmethod
-    def __flatten_summary_element(cls, element: ElementTree.Element) -> str:
-        """Flatten summary XML content to plain text while preserving tagged text.
-
-        This includes text nested in inline tags such as ``<c>`` and resolves
-        ``<paramref name=.../>`` to the parameter name.
-        """
-        parts = []
-        if element.text:
-            parts.append(element.text)
-
-        for child in list(element):
-            if child.tag.endswith("paramref"):
-                param_name = child.attrib.get("name")
-                if param_name:
-                    parts.append(param_name)
-            else:
-                parts.append(cls.__flatten_summary_element(child))
-
-            if child.tail:
-                parts.append(child.tail)
-
-        return "".join(parts)
-
-    @property
-    def name(self) -> str:
-        """The name within the element."""
-        return self._element.attrib["name"]
-
-    @property
-    def summary(self) -> str:
-        """The summary within the element."""
-        summary = self._element.find("summary")
-        if summary is None:
-            return None
-        return self.__flatten_summary_element(summary)
-
-    @property
-    def params(self) -> str:
-        """The parameters within a element."""
-        return self._element.findall("param")
-
-    @property
-    def remarks(self) -> str:
-        """The remarks within the element."""
-        return self.__get_element_text(self._element.find("remarks"))
-
-    @property
-    def example(self) -> ElementTree.Element:
-        """The example within the element."""
-        return self._element.find("example")
-
-
 def write_docstring(
     buffer: typing.TextIO, doc_member: typing.Optional[DocMember], indent_level=1
 ) -> None:
@@ -280,153 +254,202 @@ def write_docstring(
 ENUM_VALUE_REPLACEMENTS = {"None": "None_", "True": "True_"}
 
 
-def write_enum_field(buffer: typing.TextIO, field: typing.Any, indent_level: int = 1) -> None:
+def write_enum_field(buffer: typing.TextIO, field: EnumField, indent_level: int = 1) -> None:
     """Write an enum field.
 
     Parameters
     ----------
     buffer: typing.TextIO
         The buffer for writing the docstring
-    field: typing.Any
-        The field information from System.Reflection.MdFieldInfo
+    field: EnumField
+        The name and value of the field
     indent_level: int
         ``1`` to write one indent
     """
-    name = field.Name
+    name = field.name
     logging.debug(f"        writing enum value {name}")
-    int_value = field.GetRawConstantValue()
     str_value = ENUM_VALUE_REPLACEMENTS.get(name, name)
     indent = "    " * indent_level
-    buffer.write(f"{indent}{str_value} = {int_value}\n")
+    buffer.write(f"{indent}{str_value} = {field.value}\n")
 
 
-def write_enum(
-    buffer: typing.TextIO,
+def get_enum(
     enum_type: typing.Any,
-    namespace: str,
     doc: typing.Dict[str, DocMember],
     type_filter: typing.Callable = None,
-) -> None:
-    """Write an enum.
+) -> TypeInfo:
+    """Get information from an enum and store it in a TypeInfo object.
 
     Parameters
     ----------
-    buffer: typing.TextIO
-        The buffer for writing the docstring
     enum_type: typing.Any
         The enum type
-    namespace: str
-        The namespace of the enum
     doc: typing.Dict[str, DocMember]
         A DocMember or string that holds information about the enum.
     type_filter: typing.Callable = None
         Whether or not the type is published.
+
+    Returns
+    -------
+    TypeInfo
+        The enum and its fields
     """
-    logging.debug(f"    writing enum {enum_type.Name}")
     fields = [
-        field
+        EnumField(name=field.Name, value=int(field.GetRawConstantValue()))
         for field in enum_type.GetFields()
         if field.IsLiteral and (type_filter is None or type_filter(field))
     ]
-    buffer.write(f"class {enum_type.Name}(Enum):\n")
-
+    enum_doc = None
+    instrumentation.count("reflected_types")
     if doc is not None:
-        enum_doc = doc.get(f"T:{namespace}.{enum_type.Name}", None)
-        write_docstring(buffer, enum_doc, 1)
+        enum_doc = get_doc_member(doc, f"T:{type_doc_id(parse_type_name(enum_type.ToString()))}")
+    return TypeInfo(name=enum_type.Name, kind="enum", doc=enum_doc, fields=fields)
+
+
+def write_enum(
+    buffer: typing.TextIO,
+    enum_info: TypeInfo,
+    has_doc: bool = True,
+    pyi: bool = False,
+    light: bool = False,
+) -> None:
+    """Write an enum.
+
+    Parameters
+    ----------
+    buffer: typing.TextIO
+        The buffer for writing the docstring
+    enum_info: TypeInfo
+        The enum and its fields
+    has_doc: bool = True
+        Whether the assembly has an XML doc file. If not, a placeholder docstring
+        is written.
+    pyi: bool = False
+        Whether the enum is written to a ``.pyi`` stub file.
+    light: bool = False
+        Whether the enum derives from ``LightEnum``, which is much cheaper to create
+        than an ``Enum`` when the module is imported. Only used for runtime modules,
+        the enums of ``.pyi`` stub files always derive from ``Enum``.
+    """
+    logging.debug(f"    writing enum {enum_info.name}")
+    base = "LightEnum" if light and not pyi else "Enum"
+    buffer.write(f"class {enum_info.name}({base}):\n")
+
+    if has_doc:
+        write_docstring(buffer, enum_info.doc, 1)
     else:
-        write_missing_class_enum_docstring(buffer, enum_type.Name, "enum")
+        write_missing_class_enum_docstring(buffer, enum_info.name, "enum")
     buffer.write("\n")
 
-    for field in fields:
+    for field in enum_info.fields:
         write_enum_field(buffer, field, 1)
 
-    if len(fields) == 0:
-        buffer.write("    pass\n")
+    if len(enum_info.fields) == 0:
+        buffer.write("    ...\n" if pyi else "    pass\n")
     buffer.write("\n")
 
 
-# Helper for fix_str()
-def remove_backtick(input_str: str):
-    """Remove backticks from a given string.
+# Helper for get_properties() and write_properties
+def fix_str(input_str: str):
+    """Get the display name of a reflected type name.
+
+    Nested types are separated by ``.``, and generic arity, array, and byref
+    suffixes are dropped.
 
     Parameters
     ----------
     input_str: str
-        A string that could contain backticks
+        A type name that could contain backticks
 
     Returns
     -------
     str
-        A string without backticks
+        A type name that doesn't have special characters
     """
-    backtick = input_str.index("`")
-    new_str = input_str[0:backtick] + input_str[backtick + 2 :]
-
-    if "`" in new_str:
-        return remove_backtick(new_str)
-    else:
-        return new_str
+    return display_name(parse_type_name(input_str))
 
 
-# Helper for get_properties() and write_properties
-def fix_str(input_str: str):
-    """Replace incorrect special characters in strings.
+def get_static_value(value: typing.Any) -> typing.Optional[str]:
+    """Get the Python source of the value of a static property.
 
     Parameters
     ----------
-    input_str: str
-        A string that could contain backticks
+    value: typing.Any
+        The value of the property
 
     Returns
     -------
-    str
-        A string that doesn't have special characters
+    typing.Optional[str]
+        The Python source of the value, or ``None`` if the value is ``None``
     """
-    if "+" in input_str:
-        input_str = input_str.replace("+", ".")
-    if "[]" in input_str:
-        input_str = input_str.replace("[]", "")
-    if "&" in input_str:
-        input_str = input_str.replace("&", "")
-    if "`" in input_str:
-        input_str = remove_backtick(input_str)
-    return input_str
-
-
-@dataclass
-class Param:
-    """Param class."""
-
-    type: str
-    name: str
+    if value is None:
+        return None
+    if (type(value) is not type(1)) and ("`" in f"{value}"):
+        value = fix_str(f"{value}")
+    if isinstance(value, str):
+        return repr(value)
+    return f"{value}"
 
 
-@dataclass
-class Method:
-    """Method class."""
+def get_doc_member(doc: typing.Mapping[str, DocMember], key: str) -> typing.Optional[DocMember]:
+    """Get a doc member by its key, or ``None`` if it isn't documented.
 
-    name: str
-    doc: DocMember
-    return_type: str
-    static: bool
-    args: typing.List[Param]
+    Parameters
+    ----------
+    doc: typing.Mapping[str, DocMember]
+        The doc members of the assembly
+    key: str
+        The key of the member. See ``get_doc_key``.
+    """
+    member = doc.get(key, None)
+    instrumentation.count("doc_misses" if member is None else "doc_hits")
+    return member
 
 
-@dataclass
-class Property:
-    """Property class."""
+def get_full_name(reflected_type: typing.Any) -> str:
+    """Get the full name of a reflected type, without generic arity or arguments.
 
-    name: str
-    type: str
-    getter: bool
-    setter: bool
-    doc: DocMember
-    static: bool
-    value: typing.Optional[typing.Any]  # may be used if static
+    For example, the full name of ``IApplicationExtAPI<IMechanicalApplication>`` is
+    ``Ansys.ACT.Interfaces.Common.IApplicationExtAPI``.
+    """
+    return parse_type_name(reflected_type.ToString()).name
+
+
+def get_base_names(class_type: typing.Any) -> typing.List[str]:
+    """Get the full names of the base class and of all the interfaces of a type.
+
+    Parameters
+    ----------
+    class_type: typing.Any
+        The class or interface type
+
+    Returns
+    -------
+    typing.List[str]
+        The base class first, if there is one, then the interfaces in the order
+        that reflection returns them
+    """
+    bases = []
+    base_type = class_type.BaseType
+    if base_type is not None:
+        bases.append(get_full_name(base_type))
+    bases.extend(get_full_name(iface) for iface in class_type.GetInterfaces())
+    return bases
+
+
+def _get_type_key(member_type: typing.Any) -> str:
+    """Get the key of a type in a member cache.
+
+    Constructed generic types, such as ``IApplicationExtAPI<IMechanicalApplication>``,
+    have their own key.
+    """
+    return member_type.AssemblyQualifiedName or member_type.ToString()
 
 
 def _get_all_interface_members(
-    class_type: typing.Any, member_getter: typing.Callable, type_filter: typing.Callable = None
+    class_type: typing.Any,
+    member_getter: typing.Callable,
+    member_cache: typing.Optional[typing.Dict] = None,
 ) -> typing.List:
     """Collect members from an interface and all its inherited interfaces.
 
@@ -444,11 +467,12 @@ def _get_all_interface_members(
     class_type: typing.Any
         The interface type to collect members from.
     member_getter: typing.Callable
-        A callable that takes a type and returns its members
-        (e.g. lambda t: t.GetProperties()).
-    type_filter: typing.Callable, optional
-        Filter applied only to the direct members of class_type.
-        Inherited interface members are included unconditionally.
+        A callable that takes a type and returns the Property or Method objects of
+        the members it declares (e.g. ``get_interface_properties``).
+    member_cache: typing.Optional[typing.Dict], optional
+        The members of the interfaces that were already reflected, by getter and type.
+        Base interfaces such as ``IDataModelObject`` are shared by many interfaces,
+        so they are only reflected once. If ``None``, no members are cached.
 
     Returns
     -------
@@ -457,24 +481,98 @@ def _get_all_interface_members(
     """
     seen = set()
     members = []
-    for member in member_getter(class_type):
-        if type_filter is not None and not type_filter(member):
-            continue
-        if member.Name not in seen:
-            seen.add(member.Name)
-            members.append(member)
-    for iface in class_type.GetInterfaces():
-        for member in member_getter(iface):
-            if member.Name not in seen:
-                seen.add(member.Name)
+    for iface in [class_type, *class_type.GetInterfaces()]:
+        if member_cache is None:
+            iface_members = member_getter(iface)
+        else:
+            key = (member_getter.__name__, _get_type_key(iface))
+            iface_members = member_cache.get(key)
+            if iface_members is None:
+                instrumentation.count("member_cache_misses")
+                iface_members = member_cache[key] = member_getter(iface)
+            else:
+                instrumentation.count("member_cache_hits")
+        for member in iface_members:
+            if member.name not in seen:
+                seen.add(member.name)
                 members.append(member)
     return members
 
 
+def get_property(
+    prop: typing.Any, doc: typing.Dict[str, DocMember], is_interface: bool = False
+) -> Property:
+    """Get information from a property and store it in a Property object.
+
+    Parameters
+    ----------
+    prop: typing.Any
+        The reflected property.
+    doc: typing.Dict[str, DocMember]
+        A DocMember or string that holds information about the property.
+    is_interface: bool = False
+        Whether the property is read from an interface, whose accessors are
+        always public.
+
+    Returns
+    -------
+    Property
+        The property
+    """
+    instrumentation.count("reflected_properties")
+    prop_type = f'"{prop.PropertyType.ToString()}"'
+    # Apply type overrides for concrete runtime types
+    raw_type = prop.PropertyType.ToString()
+    if raw_type in TYPE_OVERRIDES:
+        prop_type = f'"{TYPE_OVERRIDES[raw_type]}"'
+    prop_name = prop.Name
+    method_doc_key = get_doc_key("P", prop, prop_name, prop.GetIndexParameters())
+
+    if doc is not None:
+        prop_doc = get_doc_member(doc, method_doc_key)
+    else:
+        prop_doc = None
+
+    property = Property(
+        getter=False,
+        setter=False,
+        type=prop_type,
+        name=prop_name,
+        doc=prop_doc,
+        static=False,
+        value=None,
+        declaring_type=get_full_name(prop.DeclaringType),
+    )
+    get_method = prop.GetMethod
+    if get_method:
+        if is_interface or get_method.IsPublic:
+            property.getter = True
+        if (
+            get_method.IsStatic
+        ):  # I don't know how to get the static modifier from the property with reflection
+            property.static = True
+        if get_method.IsPublic and get_method.IsStatic:
+            property.value = get_static_value(prop.GetValue(None, None))
+    set_method = prop.SetMethod
+    if set_method:
+        if is_interface or set_method.IsPublic:
+            property.setter = True
+
+    # ----- to test the setter only properties, there wasn't another example handy so I hacked this..
+    #       also had to hack to add published to the interface in C# (filed bug about this)
+    # if prop.Name == "ObjectId" and class_type.Name == "IDataModelObject":
+    #    property.getter=False
+    #    property.setter=True
+    # -----
+
+    return property
+
+
 def get_properties(
     class_type: typing.Any,
     doc: typing.Dict[str, DocMember],
     type_filter: typing.Callable = None,
+    member_cache: typing.Optional[typing.Dict] = None,
 ) -> typing.List[Property]:
     """Get information from properties and store it in the Property object.
 
@@ -486,6 +584,9 @@ def get_properties(
         A DocMember or string that holds information about the property.
     type_filter: typing.Callable = None
         Whether or not the type is published.
+    member_cache: typing.Optional[typing.Dict] = None
+        The members of the interfaces that were already reflected.
+        See ``_get_all_interface_members``.
 
     Returns
     -------
@@ -497,61 +598,17 @@ def get_properties(
     # Ansys.Core.Units.Quantity methods/properties) when they do not carry
     # published attributes.
     if class_type.IsInterface:
-        props = _get_all_interface_members(class_type, lambda t: t.GetProperties())
-    else:
-        props = [prop for prop in class_type.GetProperties()]
-    output = []
-    for prop in props:
-        prop_type = f'"{prop.PropertyType.ToString()}"'
-        # Apply type overrides for concrete runtime types
-        raw_type = prop.PropertyType.ToString()
-        if raw_type in TYPE_OVERRIDES:
-            prop_type = f'"{TYPE_OVERRIDES[raw_type]}"'
-        prop_name = prop.Name
-        declaring_type_name = prop.DeclaringType.ToString()
-        method_doc_key = f"P:{declaring_type_name}.{prop_name}"
-
-        if doc is not None:
-            prop_doc = doc.get(method_doc_key, None)
-        else:
-            prop_doc = None
-
-        property = Property(
-            getter=False,
-            setter=False,
-            type=prop_type,
-            name=prop_name,
-            doc=prop_doc,
-            static=False,
-            value=None,
-        )
-        get_method = prop.GetMethod
-        if get_method:
-            if class_type.IsInterface or get_method.IsPublic:
-                property.getter = True
-            if (
-                get_method.IsStatic
-            ):  # I don't know how to get the static modifier from the property with reflection
-                property.static = True
-            if get_method.IsPublic and get_method.IsStatic:
-                property.value = prop.GetValue(None, None)
-        set_method = prop.SetMethod
-        if set_method:
-            if class_type.IsInterface or set_method.IsPublic:
-                property.setter = True
-
-        # ----- to test the setter only properties, there wasn't another example handy so I hacked this..
-        #       also had to hack to add published to the interface in C# (filed bug about this)
-        # if prop.Name == "ObjectId" and class_type.Name == "IDataModelObject":
-        #    property.getter=False
-        #    property.setter=True
-        # -----
-
-        output.append(property)
-    return output
+
+        def get_interface_properties(iface):
+            return [get_property(prop, doc, True) for prop in iface.GetProperties()]
+
+        return _get_all_interface_members(class_type, get_interface_properties, member_cache)
+    return [get_property(prop, doc) for prop in class_type.GetProperties()]
 
 
-def write_property(buffer: typing.TextIO, prop: Property, indent_level: int = 1) -> None:
+def write_property(
+    buffer: typing.TextIO, prop: Property, indent_level: int = 1, pyi: bool = False
+) -> None:
     """Write a property.
 
     Parameters
@@ -562,6 +619,8 @@ def write_property(buffer: typing.TextIO, prop: Property, indent_level: int = 1)
         A Property object containing information about the property
     indent_level: int
         ``1`` to write one indent
+    pyi: bool
+        Whether the property is written to a ``.pyi`` stub file
     """
     logging.debug(f"        writing property {prop.name}")
     indent = "    " * indent_level
@@ -569,7 +628,9 @@ def write_property(buffer: typing.TextIO, prop: Property, indent_level: int = 1)
     prop_type = fix_str(prop.type)
     prop_type = c_types_to_python(prop_type)
 
-    if prop.static:
+    if pyi:
+        write_stub_property(buffer, prop, prop_type, indent_level)
+    elif prop.static:
         if prop.getter and not prop.setter:
             buffer.write(f"{indent}@classmethod\n")
             buffer.write(f"{indent}@property\n")
@@ -579,15 +640,7 @@ def write_property(buffer: typing.TextIO, prop: Property, indent_level: int = 1)
                 write_missing_prop_method_docstring(buffer, prop, "property", indent_level + 1)
             else:
                 write_docstring(buffer, prop.doc, indent_level + 1)
-            if prop.value is not None:
-                if (type(prop.value) is not type(1)) and ("`" in f"{prop.value}"):
-                    prop.value = fix_str(f"{prop.value}")
-                if isinstance(prop.value, str):
-                    buffer.write(f"{inner}return {repr(prop.value)}\n")
-                else:
-                    buffer.write(f"{inner}return {prop.value}\n")
-            else:
-                buffer.write(f"{inner}return None\n")
+            buffer.write(f"{inner}return {prop.value}\n")
 
         elif prop.getter and prop.setter:
             # Static read/write properties cannot be represented with Python's @property
@@ -648,6 +701,51 @@ def write_property(buffer: typing.TextIO, prop: Property, indent_level: int = 1)
     buffer.write("\n")
 
 
+def write_stub_property(
+    buffer: typing.TextIO, prop: Property, prop_type: str, indent_level: int = 1
+) -> None:
+    """Write a property to a ``.pyi`` stub file.
+
+    Stubs only carry annotations, so getters have a ``...`` body and properties
+    that can't be expressed with ``@property`` are written as annotated attributes.
+
+    Parameters
+    ----------
+    buffer: typing.TextIO
+        The buffer for writing the property
+    prop: Property
+        A Property object containing information about the property
+    prop_type: str
+        The Python type of the property
+    indent_level: int
+        ``1`` to write one indent
+    """
+    indent = "    " * indent_level
+    inner = "    " * (indent_level + 1)
+    if not prop.getter or (prop.static and prop.setter):
+        buffer.write(f"{indent}{prop.name}: typing.Optional[{prop_type}]\n")
+        return
+
+    if prop.static:
+        buffer.write(f"{indent}@classmethod\n")
+        buffer.write(f"{indent}@property\n")
+        buffer.write(f"{indent}def {prop.name}(cls) -> typing.Optional[{prop_type}]:\n")
+    else:
+        buffer.write(f"{indent}@property\n")
+        buffer.write(f"{indent}def {prop.name}(self) -> typing.Optional[{prop_type}]:\n")
+    if prop.doc is None:
+        write_missing_prop_method_docstring(buffer, prop, "property", indent_level + 1)
+    else:
+        write_docstring(buffer, prop.doc, indent_level + 1)
+    buffer.write(f"{inner}...\n")
+
+    if prop.setter and not prop.static:
+        buffer.write(f"{indent}@{prop.name}.setter\n")
+        buffer.write(
+            f"{indent}def {prop.name}(self, value: typing.Optional[{prop_type}]) -> None: ...\n"
+        )
+
+
 def write_missing_class_enum_docstring(buffer, name, obj_type):
     """Write a docstring for classes and enums that do not contain a docstring in the XML file.
 
@@ -742,7 +840,13 @@ def convert_operator_name(
     return method_name
 
 
-def write_method(buffer: typing.TextIO, method: Method, indent_level: int = 1) -> None:
+def write_method(
+    buffer: typing.TextIO,
+    method: Method,
+    indent_level: int = 1,
+    pyi: bool = False,
+    overload: bool = False,
+) -> None:
     """Write a method.
 
     Parameters
@@ -753,8 +857,16 @@ def write_method(buffer: typing.TextIO, method: Method, indent_level: int = 1) -
         A Method object
     indent_level: int
         ``1`` to indent a line once
+    pyi: bool
+        Whether the method is written to a ``.pyi`` stub file
+    overload: bool
+        Whether the method is one of several overloads with the same name. Only
+        used for ``.pyi`` stub files, where each overload is decorated with
+        ``@typing.overload``.
     """
     indent = "    " * indent_level
+    if pyi and overload:
+        buffer.write(f"{indent}@typing.overload\n")
     if method.static:
         buffer.write(f"{indent}@classmethod\n")
         first_arg = "cls"
@@ -773,45 +885,59 @@ def write_method(buffer: typing.TextIO, method: Method, indent_level: int = 1) -
         write_missing_prop_method_docstring(buffer, method, "method", indent_level + 1)
     else:
         write_docstring(buffer, method.doc, indent_level + 1)
-    buffer.write(f"{indent}pass\n")
+    buffer.write(f"{indent}...\n" if pyi else f"{indent}pass\n")
     buffer.write("\n")
 
 
-def adjust_method_name_xml(method_name: str):
-    """Adjust the method name to find docstring in XML.
+def get_doc_key(prefix: str, member: typing.Any, name: str, params: typing.List = ()) -> str:
+    """Get the name of a member in the XML doc file.
+
+    Generic parameters are written by position. For example,
+    ``GetChildren<ChildrenType>(bool, IList<ChildrenType>)`` is written as
+    ``GetChildren``1(System.Boolean,System.Collections.Generic.IList{``0})``.
 
     Parameters
     ----------
-    method_name: str
-        The method name
+    prefix: str
+        ``"M"`` for methods and constructors, or ``"P"`` for properties
+    member: typing.Any
+        The reflected method, constructor, or property
+    name: str
+        The name of the member. For example, ``#ctor`` for constructors.
+    params: typing.List
+        The parameters of the member, or the index parameters of a property
+
+    Returns
+    -------
+    str
+        The name of the member in the XML doc file
     """
-    # GetChildren(System...) is GetChildren``1(System...) in the XML file
-    if ".GetChildren(System" in method_name:
-        method_name = method_name.replace(".GetChildren(System", ".GetChildren``1(System")
-    # IList`1[ChildrenType] is IList{``0} in the XML file
-    if "IList`1[ChildrenType]" in method_name:
-        method_name = method_name.replace("IList`1[ChildrenType]", "IList{``0}")
-    # IList`1[Ansys...] is IList{Ansys...} in the XML file
-    # IEnumerable`1[Ansys...]` is IEnumerable{Ansys...} in the XML file
-    if "`1[Ansys" in method_name:
-        method_name = method_name.replace("`1[Ansys", "{Ansys").replace("]", "}")
-    if "`2[Ansys" in method_name:
-        method_name = method_name.replace("`2[Ansys", "{Ansys").replace("]", "}")
-    # IEnumerable`1[System.Object] is IEnumerable{System.Object} in the XML file
-    if "IEnumerable`1[System" in method_name:
-        method_name = method_name.replace("IEnumerable`1[System", "IEnumerable{System").replace(
-            "]", "}"
+    declaring_type = member.DeclaringType
+    type_generics = ()
+    if declaring_type.IsGenericType:
+        type_generics = tuple(
+            arg.Name for arg in declaring_type.GetGenericArguments() if arg.IsGenericParameter
         )
-    if "+" in method_name:
-        method_name = method_name.replace("+", ".")
-
-    return method_name
+    method_generics = ()
+    if prefix == "M" and member.IsGenericMethod:
+        method_generics = tuple(arg.Name for arg in member.GetGenericArguments())
+        name = f"{name}``{len(method_generics)}"
+
+    doc_key = f"{prefix}:{type_doc_id(parse_type_name(declaring_type.ToString()))}.{name}"
+    if len(params) > 0:
+        param_types = [
+            doc_id(parse_type_name(param.ParameterType.ToString()), method_generics, type_generics)
+            for param in params
+        ]
+        doc_key += f"({','.join(param_types)})"
+    return doc_key
 
 
 def get_methods(
     class_type: typing.Any,
     doc: typing.Dict[str, DocMember],
     type_filter: typing.Callable = None,
+    member_cache: typing.Optional[typing.Dict] = None,
 ) -> typing.List[Method]:
     """Get information from methods and store it in the Method object.
 
@@ -823,6 +949,9 @@ def get_methods(
         A DocMember or string that holds information about the method.
     type_filter: typing.Callable = None
         Whether or not the type is published.
+    member_cache: typing.Optional[typing.Dict] = None
+        The members of the interfaces that were already reflected.
+        See ``_get_all_interface_members``.
 
     Returns
     -------
@@ -833,27 +962,27 @@ def get_methods(
     # members (PropertyInfo/MethodInfo) can hide valid members (for example,
     # Ansys.Core.Units.Quantity constructor/Abs).
     if class_type.IsInterface:
-        methods = _get_all_interface_members(class_type, lambda t: t.GetMethods())
-    else:
-        methods = [prop for prop in class_type.GetMethods()]
+
+        def get_interface_methods(iface):
+            return [get_method(method, doc) for method in iface.GetMethods()]
+
+        return _get_all_interface_members(class_type, get_interface_methods, member_cache)
     output = []
 
     # Constructors are not returned by Type.GetMethods(). Include them so
     # XML entries like M:Namespace.Type.#ctor(...) are emitted as __init__ stubs.
     if not class_type.IsInterface:
         for ctor in class_type.GetConstructors():
+            instrumentation.count("reflected_methods")
             params = ctor.GetParameters()
             args = [
                 Param(type=fix_str(param.ParameterType.ToString()), name=param.Name)
                 for param in params
             ]
-            declaring_type_name = ctor.DeclaringType.ToString()
-            full_ctor_name = f"#ctor({','.join([arg.type for arg in args])})"
-            ctor_doc_key = f"M:{declaring_type_name}.{full_ctor_name}".replace("()", "")
-            ctor_doc_key = adjust_method_name_xml(ctor_doc_key)
+            ctor_doc_key = get_doc_key("M", ctor, "#ctor", params)
 
             if doc is not None:
-                ctor_doc = doc.get(ctor_doc_key, None)
+                ctor_doc = get_doc_member(doc, ctor_doc_key)
             else:
                 ctor_doc = None
 
@@ -864,123 +993,200 @@ def get_methods(
                     return_type='"System.Void"',
                     static=False,
                     args=args,
+                    declaring_type=get_full_name(class_type),
                 )
             )
 
-    for method in methods:
-        method_return_type = f'"{method.ReturnType.ToString()}"'
-        method_name = method.Name
-        params = method.GetParameters()
-        args = [
-            Param(type=fix_str(param.ParameterType.ToString()), name=param.Name) for param in params
-        ]
-        full_method_name = method_name + f"({','.join([arg.type for arg in args])})"
-        declaring_type_name = method.DeclaringType.ToString()
+    output.extend(get_method(method, doc) for method in class_type.GetMethods())
+    return output
 
-        # Get the method name
-        method_doc_key = f"M:{declaring_type_name}.{full_method_name}".replace("()", "")
-        method_doc_key = adjust_method_name_xml(method_doc_key)
 
-        if doc is not None:
-            method_doc = doc.get(method_doc_key, None)
-        else:
-            method_doc = None
-
-        method = Method(
-            name=method_name,
-            doc=method_doc,
-            return_type=fix_str(method_return_type),
-            static=method.IsStatic,
-            args=args,
-        )
-        output.append(method)
-    return output
+def get_method(method: typing.Any, doc: typing.Dict[str, DocMember]) -> Method:
+    """Get information from a method and store it in a Method object.
 
+    Parameters
+    ----------
+    method: typing.Any
+        The reflected method.
+    doc: typing.Dict[str, DocMember]
+        A DocMember or string that holds information about the method.
 
-def write_class(
-    buffer: typing.TextIO,
+    Returns
+    -------
+    Method
+        The method
+    """
+    instrumentation.count("reflected_methods")
+    method_return_type = f'"{method.ReturnType.ToString()}"'
+    method_name = method.Name
+    params = method.GetParameters()
+    args = [
+        Param(type=fix_str(param.ParameterType.ToString()), name=param.Name) for param in params
+    ]
+    method_doc_key = get_doc_key("M", method, method_name, params)
+
+    if doc is not None:
+        method_doc = get_doc_member(doc, method_doc_key)
+    else:
+        method_doc = None
+
+    return Method(
+        name=method_name,
+        doc=method_doc,
+        return_type=fix_str(method_return_type),
+        static=method.IsStatic,
+        args=args,
+        declaring_type=get_full_name(method.DeclaringType),
+    )
+
+
+def get_class(
     class_type: typing.Any,
-    namespace: str,
     doc: typing.Dict[str, DocMember],
     type_filter: typing.Callable = None,
-) -> None:
-    """Write a class.
+    member_cache: typing.Optional[typing.Dict] = None,
+) -> TypeInfo:
+    """Get information from a class and store it in a TypeInfo object.
 
     Parameters
     ----------
-    buffer: typing.TextIO
-        The buffer for writing the class
     class_type: typing.Any
         The class type object
-    namespace: str
-        The namespace of the class being written
     doc: typing.Dict[str, DocMember]
         A DocMember or string that holds information about the class.
     type_filter: typing.Callable = None
         Whether or not the type is published
-    """
-    class_name = fix_str(class_type.Name)
-    logging.debug(f"    writing class {class_name}")
-    buffer.write(f"class {class_name}(object):\n")
+    member_cache: typing.Optional[typing.Dict] = None
+        The members of the interfaces that were already reflected.
+        See ``_get_all_interface_members``.
 
+    Returns
+    -------
+    TypeInfo
+        The class and its properties and methods
+    """
+    class_doc = None
+    instrumentation.count("reflected_types")
     if doc is not None:
-        class_doc = doc.get(f"T:{namespace}.{class_type.Name}", None)
-        write_docstring(buffer, class_doc, 1)
-    else:
-        write_missing_class_enum_docstring(buffer, class_type.Name, "class")
-    buffer.write("\n")
+        class_doc = get_doc_member(doc, f"T:{type_doc_id(parse_type_name(class_type.ToString()))}")
+    return TypeInfo(
+        name=fix_str(class_type.Name),
+        kind="class",
+        doc=class_doc,
+        properties=get_properties(class_type, doc, type_filter, member_cache),
+        methods=get_methods(class_type, doc, type_filter, member_cache),
+        bases=get_base_names(class_type),
+    )
 
-    props = get_properties(class_type, doc, type_filter)
-    [write_property(buffer, prop, 1) for prop in props]
 
-    # Build sets of property names with getters and setters to filter out their backing methods
-    # from the methods list. We exclude get_/set_ methods for any property that already has
-    # an @property or @property.setter decorator.
-    properties_with_getters = {prop.name for prop in props if prop.getter}
-    properties_with_setters = {prop.name for prop in props if prop.setter}
+def get_class_methods(class_info: TypeInfo) -> typing.List[Method]:
+    """Get the methods of a class that aren't accessors of its properties.
 
-    methods = get_methods(class_type, doc, type_filter)
-    # Filter out get_/set_ methods that correspond to any property (getter or setter)
-    filtered_methods = [
+    The ``get_`` and ``set_`` methods of a property are already written as the
+    getter and setter of the property.
+
+    Parameters
+    ----------
+    class_info: TypeInfo
+        The class and its properties and methods
+
+    Returns
+    -------
+    typing.List[Method]
+        The methods of the class, in order, without the property accessors
+    """
+    properties_with_getters = {prop.name for prop in class_info.properties if prop.getter}
+    properties_with_setters = {prop.name for prop in class_info.properties if prop.setter}
+    return [
         method
-        for method in methods
+        for method in class_info.methods
         if not (
             (method.name.startswith("get_") and method.name[4:] in properties_with_getters)
             or (method.name.startswith("set_") and method.name[4:] in properties_with_setters)
         )
     ]
-    [write_method(buffer, method, 1) for method in filtered_methods]
+
+
+def write_class(
+    buffer: typing.TextIO,
+    class_info: TypeInfo,
+    has_doc: bool = True,
+    pyi: bool = False,
+    bases: typing.Sequence[str] = (),
+) -> None:
+    """Write a class.
+
+    Parameters
+    ----------
+    buffer: typing.TextIO
+        The buffer for writing the class
+    class_info: TypeInfo
+        The class and its properties and methods
+    has_doc: bool = True
+        Whether the assembly has an XML doc file. If not, a placeholder docstring
+        is written.
+    pyi: bool = False
+        Whether the class is written to a ``.pyi`` stub file
+    bases: typing.Sequence[str] = ()
+        The names of the base classes of the class. If empty, the class derives
+        from ``object``. See ``resolve_inheritance``.
+    """
+    class_name = class_info.name
+    logging.debug(f"    writing class {class_name}")
+    buffer.write(f"class {class_name}({', '.join(bases) or 'object'}):\n")
+
+    if has_doc:
+        write_docstring(buffer, class_info.doc, 1)
+    else:
+        write_missing_class_enum_docstring(buffer, class_name, "class")
+    buffer.write("\n")
+
+    props = class_info.properties
+    [write_property(buffer, prop, 1, pyi) for prop in props]
+
+    filtered_methods = get_class_methods(class_info)
+    # Methods that share a name are overloads of the same .NET method
+    method_names = collections.Counter(
+        convert_operator_name(method.name, method.args, method.static)
+        for method in filtered_methods
+    )
+    for method in filtered_methods:
+        name = convert_operator_name(method.name, method.args, method.static)
+        write_method(buffer, method, 1, pyi, overload=method_names[name] > 1)
 
     if len(props) == 0 and len(filtered_methods) == 0:
-        buffer.write("    pass\n")
+        buffer.write("    ...\n" if pyi else "    pass\n")
     buffer.write("\n")
 
 
-def write_module(
+def get_module(
     namespace: str,
     mod_types: typing.List,
     doc: typing.Dict[str, DocMember],
-    outdir: str,
     type_filter: typing.Callable = None,
-) -> None:
-    """Write a module.
+    member_cache: typing.Optional[typing.Dict] = None,
+) -> ModuleInfo:
+    """Get information from the types of a namespace and store it in a ModuleInfo object.
 
     Parameters
     ----------
-    mod_type: typing.Any
-        The module type object
+    namespace: str
+        The namespace of the module
+    mod_types: typing.List
+        The types of the namespace
     doc: typing.Dict[str, DocMember]
-        A DocMember or string that holds information about the class.
-    outdir: str
-        The path of the file that contains the module.
+        A DocMember or string that holds information about the types.
     type_filter: typing.Callable = None
         Whether or not the type is published
+    member_cache: typing.Optional[typing.Dict] = None
+        The members of the interfaces that were already reflected.
+        See ``_get_all_interface_members``.
+
+    Returns
+    -------
+    ModuleInfo
+        The enums and classes of the module
     """
-    outdir = pathlib.Path(outdir)
-    for token in namespace.split("."):
-        outdir = outdir / token
-    logging.info(f"Writing to {str(outdir.resolve())}")
-    outdir.mkdir(exist_ok=True, parents=True)
     # See https://learn.microsoft.com/en-us/dotnet/api/system.type.isclass?view=net-9.0 for more
     # information about Properties like IsClass, IsAnsiClass, and IsInterface
     class_types = [
@@ -989,57 +1195,348 @@ def write_module(
         if mod_type.IsClass or mod_type.IsAnsiClass or mod_type.IsInterface
     ]
     enum_types = [mod_type for mod_type in mod_types if mod_type.IsEnum]
-    logging.info(f"Writing to {str(outdir.resolve())}")
-    with pathlib.Path.open(outdir / "__init__.py", "w", encoding="utf-8") as f:
-        f.write(f'"""{pathlib.PurePath(outdir).name} module."""\n')
-        if len(enum_types) > 0:
-            f.write("from enum import Enum\n")
-        f.write("import typing\n\n")
-        logging.info(f"    {len(enum_types)} enum types")
-        for enum_type in enum_types:
-            write_enum(f, enum_type, namespace, doc, type_filter)
-        for class_type in class_types:
-            write_class(f, class_type, namespace, doc, type_filter)
-    logging.info(f"Done processing {namespace}")
-
-
-def load_doc(xml_path: str) -> ElementTree:
-    """Get a dictionary of doc entities from the Assembly documentation file.
+    types = [get_enum(enum_type, doc, type_filter) for enum_type in enum_types]
+    types.extend(
+        get_class(class_type, doc, type_filter, member_cache) for class_type in class_types
+    )
+    return ModuleInfo(namespace=namespace, has_doc=doc is not None, types=types)
+
+
+def get_type_size(type_info: TypeInfo) -> int:
+    """Estimate the amount of work to write a class or enum.
 
     Parameters
     ----------
-    xml_path: str
-        The path to the XML file
+    type_info: TypeInfo
+        The class or enum
 
     Returns
     -------
-    ElementTree
-        An element tree of the information from the assembly XML file
+    int
+        The number of members, plus one for the type itself
     """
-    tree = ElementTree.parse(xml_path)
-    root = tree.getroot()
-    members = root.find("members")
-    doc_members = [DocMember(member) for member in members]
-    # 'M:Ansys.ACT.Automation.Mechanical.VirtualCell.GetChildren``1(System.Boolean,System.Collections.Generic.IList{``0})': <gen.DocMember object at 0x0000018B1F50A050>
-    output = {doc_member.name: doc_member for doc_member in doc_members}
-    return output
+    return 1 + len(type_info.properties) + len(type_info.methods) + len(type_info.fields)
+
+
+def get_type_shards(
+    types: typing.List[TypeInfo], split_size: typing.Optional[int] = None
+) -> typing.List[typing.Tuple[int, int]]:
+    """Split the types of a module into files of a bounded size.
+
+    Parameters
+    ----------
+    types: typing.List[TypeInfo]
+        The types of the module, in the order they are written
+    split_size: typing.Optional[int]
+        The largest estimated size of a file, see ``get_type_size``. A type that is
+        larger than it gets a file of its own, so ``1`` writes one file per type.
+        If ``None``, the types are not split.
+
+    Returns
+    -------
+    typing.List[typing.Tuple[int, int]]
+        The ``(start, stop)`` range of the types of each file, in order
+    """
+    if split_size is None:
+        return [(0, len(types))]
+    shards, start, size = [], 0, 0
+    for index, type_info in enumerate(types):
+        type_size = get_type_size(type_info)
+        if index > start and size + type_size > split_size:
+            shards.append((start, index))
+            start, size = index, 0
+        size += type_size
+    shards.append((start, len(types)))
+    return shards
+
+
+def get_module_types(module: ModuleInfo) -> typing.List[TypeInfo]:
+    """Get the types of a module in the order they are written, enums first."""
+    enums = [type_info for type_info in module.types if type_info.kind == "enum"]
+    classes = [type_info for type_info in module.types if type_info.kind == "class"]
+    return enums + classes
+
+
+def write_types(
+    buffer: typing.TextIO,
+    types: typing.List[TypeInfo],
+    has_doc: bool = True,
+    pyi: bool = False,
+    bases: typing.Optional[typing.Mapping[str, typing.Sequence[str]]] = None,
+    light_enums: bool = False,
+) -> None:
+    """Write classes and enums.
+
+    Parameters
+    ----------
+    buffer: typing.TextIO
+        The buffer for writing the types
+    types: typing.List[TypeInfo]
+        The classes and enums
+    has_doc: bool = True
+        Whether the assembly has an XML doc file
+    pyi: bool = False
+        Whether the types are written to a ``.pyi`` stub file
+    bases: typing.Optional[typing.Mapping[str, typing.Sequence[str]]] = None
+        The names of the base classes of each class, by class name. The classes
+        that aren't in it derive from ``object``. See ``ModuleBases``.
+    light_enums: bool = False
+        Whether the enums derive from ``LightEnum``. See ``write_enum``.
+    """
+    for type_info in types:
+        if type_info.kind == "enum":
+            write_enum(buffer, type_info, has_doc, pyi, light_enums)
+        elif bases is not None:
+            write_class(buffer, type_info, has_doc, pyi, bases.get(type_info.name, ()))
+        else:
+            write_class(buffer, type_info, has_doc, pyi)
+
+
+def render_types(
+    types: typing.List[TypeInfo],
+    has_doc: bool = True,
+    suffixes: typing.Tuple[str, ...] = (".py",),
+    bases: typing.Optional[typing.Mapping[str, typing.Sequence[str]]] = None,
+    light_enums: bool = False,
+) -> typing.Dict[str, str]:
+    """Get the source of classes and enums for each file suffix. See ``write_types``."""
+    bodies = {}
+    for suffix in suffixes:
+        buffer = io.StringIO()
+        write_types(buffer, types, has_doc, suffix == ".pyi", bases, light_enums)
+        bodies[suffix] = buffer.getvalue()
+    return bodies
+
+
+def write_module(
+    module: ModuleInfo,
+    outdir: str,
+    output_format: str = "py",
+    bodies: typing.Optional[typing.Dict[str, str]] = None,
+    writer: typing.Optional[StubWriter] = None,
+    module_list: typing.Sequence[str] = (),
+    module_bases: typing.Optional[ModuleBases] = None,
+    split_size: typing.Optional[int] = None,
+    shard_bodies: typing.Optional[typing.List[typing.Dict[str, str]]] = None,
+    light_enums: bool = False,
+) -> None:
+    """Write a module.
+
+    The module is written in one pass, with the imports of its submodules and the
+    ``__all__`` of its classes and enums.
 
+    If the types of the module are larger than ``split_size``, the runtime
+    ``__init__.py`` file only has a table of the types, and the types are written
+    to private submodules that are imported when a type is first accessed. See
+    ``write_split_module``.
 
-def get_doc(assembly: "System.Reflection.RuntimeAssembly"):
+    Parameters
+    ----------
+    module: ModuleInfo
+        The enums and classes of the module
+    outdir: str
+        The path of the file that contains the module.
+    output_format: str = "py"
+        ``"py"`` to write the runtime ``__init__.py`` file, ``"pyi"`` to write a
+        ``__init__.pyi`` stub file, or ``"both"`` to write both files.
+    bodies: typing.Optional[typing.Dict[str, str]] = None
+        The source of the types of the module, by file suffix, if it is already
+        rendered. See ``render_types``.
+    writer: typing.Optional[StubWriter] = None
+        The writer that the files are written with. If ``None``, the files are
+        written directly.
+    module_list: typing.Sequence[str] = ()
+        The names of the submodules of the module. See ``get_submodules``.
+    module_bases: typing.Optional[ModuleBases] = None
+        The base classes of the classes of the module and their imports. If
+        ``None``, the classes derive from ``object``. See ``resolve_inheritance``.
+    split_size: typing.Optional[int] = None
+        The largest estimated size of the files of the types of the module. See
+        ``get_type_shards``. If ``None``, the types are written to ``__init__.py``.
+    shard_bodies: typing.Optional[typing.List[typing.Dict[str, str]]] = None
+        The source of the types of each file, by file suffix, if they are already
+        rendered.
+    light_enums: bool = False
+        Whether the enums of the runtime ``__init__.py`` file derive from
+        ``LightEnum``. See ``write_enum``.
+    """
+    import_str = f"ansys.mechanical.stubs.{pathlib.PurePath(outdir).name}.{module.namespace}"
+    outdir = pathlib.Path(outdir)
+    for token in module.namespace.split("."):
+        outdir = outdir / token
+    logging.info(f"Writing to {str(outdir.resolve())}")
+    types = get_module_types(module)
+    has_enums = any(type_info.kind == "enum" for type_info in types)
+    names = [type_info.name for type_info in types]
+    is_datamodel_interfaces = module.namespace == DATAMODEL_INTERFACES
+    if is_datamodel_interfaces:
+        names.append("DataModelObject")
+    bases = module_bases.bases if module_bases is not None else None
+    base_imports = module_bases.imports if module_bases is not None else ()
+    shards = get_type_shards(types, split_size)
+    for suffix in OUTPUT_SUFFIXES[output_format]:
+        pyi = suffix == ".pyi"
+        # Stub files are never executed, so they aren't split
+        if len(shards) > 1 and not pyi:
+            write_split_module(
+                module,
+                outdir,
+                import_str,
+                types,
+                shards,
+                writer,
+                module_list,
+                module_bases,
+                shard_bodies,
+                light_enums,
+            )
+            continue
+        buffer = io.StringIO()
+        buffer.write(f'"""{pathlib.PurePath(outdir).name} module."""\n')
+        buffer.write(
+            module_header(
+                import_str,
+                list(module_list),
+                names,
+                has_enums,
+                pyi,
+                base_imports,
+                light_enums=light_enums,
+            )
+        )
+        if bodies is not None:
+            buffer.write(bodies[suffix])
+        else:
+            write_types(buffer, types, module.has_doc, pyi, bases, light_enums)
+        if is_datamodel_interfaces:
+            buffer.write("class DataModelObject(IDataModelObject):\n")
+            buffer.write("    ...\n" if pyi else "    pass\n")
+        write_file(outdir / f"__init__{suffix}", buffer.getvalue(), writer)
+    logging.info(f"Done processing {module.namespace}")
+
+
+def write_split_module(
+    module: ModuleInfo,
+    outdir: pathlib.Path,
+    import_str: str,
+    types: typing.List[TypeInfo],
+    shards: typing.List[typing.Tuple[int, int]],
+    writer: typing.Optional[StubWriter] = None,
+    module_list: typing.Sequence[str] = (),
+    module_bases: typing.Optional[ModuleBases] = None,
+    shard_bodies: typing.Optional[typing.List[typing.Dict[str, str]]] = None,
+    light_enums: bool = False,
+) -> None:
+    """Write the runtime files of a module whose types are split into submodules.
+
+    The types of each shard are written to a private ``_part<n>.py`` submodule. The
+    ``__init__.py`` file maps each type to its submodule, so that touching one type
+    only imports the file that defines it.
+
+    Parameters
+    ----------
+    module: ModuleInfo
+        The enums and classes of the module
+    outdir: pathlib.Path
+        The directory of the module
+    import_str: str
+        Import path of the module
+    types: typing.List[TypeInfo]
+        The types of the module, in the order they are written
+    shards: typing.List[typing.Tuple[int, int]]
+        The range of the types of each submodule. See ``get_type_shards``.
+    writer: typing.Optional[StubWriter] = None
+        The writer that the files are written with. See ``write_module``.
+    module_list: typing.Sequence[str] = ()
+        The names of the submodules of the module. See ``get_submodules``.
+    module_bases: typing.Optional[ModuleBases] = None
+        The base classes of the classes of the module. See ``write_module``.
+    shard_bodies: typing.Optional[typing.List[typing.Dict[str, str]]] = None
+        The source of the types of each submodule, by file suffix, if they are
+        already rendered.
+    light_enums: bool = False
+        Whether the enums derive from ``LightEnum``. See ``write_enum``.
+    """
+    bases = module_bases.bases if module_bases is not None else {}
+    # The bases from other modules, by the name they are imported as
+    base_imports = {}
+    if module_bases is not None:
+        base_imports = {line.rsplit(" ", 1)[-1]: line for line in module_bases.imports}
+    local_names = {type_info.name for type_info in types}
+
+    type_modules = {}
+    for index, (start, stop) in enumerate(shards):
+        shard_name = f"_part{index}"
+        shard_types = types[start:stop]
+        names = [type_info.name for type_info in shard_types]
+        has_datamodel_object = (
+            module.namespace == DATAMODEL_INTERFACES and "IDataModelObject" in names
+        )
+        if has_datamodel_object:
+            names.append("DataModelObject")
+        type_modules.update((name, shard_name) for name in names)
+
+        imports = []
+        for type_info in shard_types:
+            for base in bases.get(type_info.name, ()):
+                if base in names:
+                    continue
+                if base in local_names:
+                    # Imported through the table of the module, from another submodule
+                    line = f"from {import_str} import {base}"
+                else:
+                    line = base_imports[base]
+                if line not in imports:
+                    imports.append(line)
+
+        has_enums = any(type_info.kind == "enum" for type_info in shard_types)
+        buffer = io.StringIO()
+        buffer.write(f'"""Types of the {outdir.name} module, part {index}."""\n')
+        buffer.write(type_module_header(names, has_enums, imports, light_enums))
+        if shard_bodies is not None:
+            buffer.write(shard_bodies[index][".py"])
+        else:
+            write_types(buffer, shard_types, module.has_doc, False, bases, light_enums)
+        if has_datamodel_object:
+            buffer.write("class DataModelObject(IDataModelObject):\n    pass\n")
+        write_file(outdir / f"{shard_name}.py", buffer.getvalue(), writer)
+
+    names = [type_info.name for type_info in types]
+    names.extend(name for name in type_modules if name not in local_names)
+    header = module_header(
+        import_str, list(module_list), names, pyi=False, type_modules=type_modules
+    )
+    # The header ends with the blank lines that separate it from the types
+    source = f'"""{outdir.name} module."""\n{header.rstrip()}\n'
+    write_file(outdir / "__init__.py", source, writer)
+
+
+def get_doc(
+    assembly: "System.Reflection.RuntimeAssembly",
+    key_filter: typing.Callable[[str], bool] = None,
+    doc_cache: typing.Optional[DocCache] = None,
+):
     """Get the documentation file from assembly, or None if it doesn't exist.
 
     Parameters
     ----------
     assembly: "System.Reflection.RuntimeAssembly"
         An assembly. For example, Ansys.ACT.WB1.
+    key_filter: typing.Callable[[str], bool] = None
+        Whether or not to load a doc member, given its name. See ``doc_key_filter``.
+    doc_cache: typing.Optional[DocCache] = None
+        The cache of the doc members. If ``None``, the XML doc file is parsed.
     """
+    load = load_doc if doc_cache is None else doc_cache.load
+    import System
+
     uri = System.UriBuilder(assembly.CodeBase)
     path = System.Uri.UnescapeDataString(uri.Path)
     directory = System.IO.Path.GetDirectoryName(path)
     xml_path = System.IO.Path.Combine(directory, assembly.GetName().Name + ".xml")
     if System.IO.File.Exists(xml_path):
         logging.info(f"Loading xml doc from {xml_path}")
-        doc = load_doc(xml_path)
+        doc = load(xml_path, key_filter)
         return doc
     elif "Ans.Core" in assembly.GetName().Name:
         # On some installs (especially Linux CI), Ans.Core.xml is located under
@@ -1064,12 +1561,9 @@ def get_doc(assembly: "System.Reflection.RuntimeAssembly"):
             if candidate.is_file():
                 xml_path = str(candidate)
                 logging.info(f"Loading xml doc from {xml_path}")
-                doc = load_doc(xml_path)
-                new_doc = {"T:Ansys.Core.Units.Quantity": doc["T:Ansys.Core.Units.Quantity"]}
-                for key, value in doc.items():
-                    if "Ansys.Core.Units.Quantity." in key:
-                        new_doc[key] = value
-                return new_doc
+                # Only the Quantity type is used from Ans.Core
+                doc = load(xml_path, doc_key_filter(["Ansys.Core.Units.Quantity"]))
+                return doc
 
         logging.warning("Ans.Core.xml not found in fallback locations, skipping")
         return None
@@ -1079,7 +1573,9 @@ def get_doc(assembly: "System.Reflection.RuntimeAssembly"):
 
 
 def get_namespaces(
-    assembly: "System.Reflection.RuntimeAssembly", type_filter: typing.Callable = None
+    assembly: "System.Reflection.RuntimeAssembly",
+    type_filter: typing.Callable = None,
+    namespace_filter: typing.Callable = None,
 ) -> typing.Dict:
     """Get all the namespaces and filtered types in the assembly given by assembly_name.
 
@@ -1089,6 +1585,8 @@ def get_namespaces(
         An assembly
     type_filter:
         Whether or not the type is published
+    namespace_filter:
+        Whether or not the types of a namespace are written
 
     Returns
     -------
@@ -1096,43 +1594,453 @@ def get_namespaces(
         A dictionary of published namespaces within the assembly
     """
     logging.info(f"    Getting types from the {pathlib.PurePath(assembly.CodeBase).name} assembly")
-    namespaces = crawl_loaded_references(assembly, type_filter)
+    namespaces = crawl_loaded_references(assembly, type_filter, namespace_filter)
     return namespaces
 
 
-def make(outdir: str, assembly_name: str, type_filter: typing.Callable = None) -> None:
-    """Generate Python stubs for an assembly.
+def get_doc_namespaces(namespaces: typing.Dict[str, typing.List]) -> typing.Set[str]:
+    """Get the namespaces whose doc members are used to write the given namespaces.
+
+    Inherited members are documented under the base class or interface that declares
+    them, which may be in another namespace.
+
+    Parameters
+    ----------
+    namespaces: typing.Dict[str, typing.List]
+        The types to write, by namespace
+
+    Returns
+    -------
+    typing.Set[str]
+        The namespaces of the types and of their base classes and interfaces
+    """
+    doc_namespaces = set(namespaces)
+    for mod_types in namespaces.values():
+        for mod_type in mod_types:
+            base_type = mod_type.BaseType
+            while base_type is not None:
+                doc_namespaces.add(base_type.Namespace)
+                base_type = base_type.BaseType
+            doc_namespaces.update(iface.Namespace for iface in mod_type.GetInterfaces())
+    doc_namespaces.discard(None)
+    return doc_namespaces
+
+
+def extract(
+    assembly_name: str,
+    type_filter: typing.Callable = None,
+    cache_dir: str = None,
+) -> typing.List[ModuleInfo]:
+    """Get the published types of an assembly with reflection.
 
     Parameters
     ----------
-    outdir: str
-        The directory where modules are being written to.
     assembly_name: str
         The name of the assembly
     type_filter: typing.Callable
         Whether or not a type is published
+    cache_dir: str
+        The directory of the doc cache, which is reused by later runs. If ``None``,
+        the XML doc file is parsed on every run.
+
+    Returns
+    -------
+    typing.List[ModuleInfo]
+        The modules of the namespaces of the assembly
     """
+    import clr
+
     logging.info(f"Loading assembly {assembly_name}")
-    assembly = clr.AddReference(assembly_name)
-    if type_filter is not None:
-        logging.info(f"   Using a type_filter: {str(type_filter)}")
-    # Type filter is what gets messed up
-    namespaces = get_namespaces(assembly, type_filter)
-
-    if assembly_name == "Ans.Core":
-        namespaces = {"Ansys.Core.Units": namespaces["Ansys.Core.Units"]}
-    elif assembly_name == "Ansys.ACT.Interfaces":
-        namespaces = {
-            "Ansys.ACT.Interfaces.Common": namespaces["Ansys.ACT.Interfaces.Common"],
-            "Ansys.ACT.Math": namespaces["Ansys.ACT.Math"],
-        }
-
-    dump_types(namespaces)
-    doc = get_doc(assembly)
-    logging.info(f"    {len(namespaces.items())} namespaces")
-    for namespace, mod_types in namespaces.items():
-        if "DesignModeler" not in namespace:
+    with instrumentation.scope(assembly=assembly_name):
+        with instrumentation.stage("add_reference"):
+            assembly = clr.AddReference(assembly_name)
+        if type_filter is not None:
+            logging.info(f"   Using a type_filter: {str(type_filter)}")
+        # The namespaces that aren't written are skipped before the attributes of their
+        # types are read by the type filter
+        namespace_filter = functools.partial(is_namespace_written, assembly_name)
+        # Type filter is what gets messed up
+        with instrumentation.stage("type_discovery"):
+            namespaces = get_namespaces(assembly, type_filter, namespace_filter)
+
+        allow_list = NAMESPACE_ALLOW_LISTS.get(assembly_name)
+        if allow_list is not None:
+            namespaces = {
+                namespace: namespaces[namespace]
+                for namespace in allow_list
+                if namespace in namespaces
+            }
+
+        dump_types(namespaces)
+        doc_cache = DocCache(cache_dir) if cache_dir is not None else None
+        with instrumentation.stage("doc_load"):
+            doc = get_doc(assembly, doc_key_filter(get_doc_namespaces(namespaces)), doc_cache)
+        logging.info(f"    {len(namespaces.items())} namespaces")
+        # The members of the interfaces are reflected once per assembly, since their
+        # docstrings are looked up in the doc of the assembly
+        member_cache = {}
+        modules = []
+        for namespace, mod_types in namespaces.items():
             logging.info(f"Processing {namespace}")
-            logging.info(f"   {len(namespaces.items())} namespaces")
-            write_module(namespace, mod_types, doc, outdir, type_filter)
-            logging.info(f"Done processing {namespace}")
+            with instrumentation.scope(namespace=namespace):
+                with instrumentation.stage("member_reflection"):
+                    module = get_module(namespace, mod_types, doc, type_filter, member_cache)
+            modules.append(module)
+    return modules
+
+
+def render(
+    modules: typing.List[ModuleInfo],
+    outdir: str,
+    output_format: str = "py",
+    jobs: int = 1,
+    writer: typing.Optional[StubWriter] = None,
+    inheritance: bool = False,
+    split_size: typing.Optional[int] = None,
+    light_enums: bool = False,
+) -> None:
+    """Write the modules of an assembly.
+
+    Parameters
+    ----------
+    modules: typing.List[ModuleInfo]
+        The modules of the namespaces of the assembly
+    outdir: str
+        The directory where modules are being written to.
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``write_module``.
+    jobs: int
+        The number of processes rendering the modules. See ``render_parallel``.
+    writer: typing.Optional[StubWriter]
+        The writer that the files are written with. See ``write_module``.
+    inheritance: bool
+        Whether the classes derive from the generated classes of their .NET base
+        class and interfaces, and only write the members they don't inherit. If
+        ``False``, the inherited members are flattened into each class.
+        See ``resolve_inheritance``.
+    split_size: typing.Optional[int]
+        The largest estimated size of the runtime files of the types of a module.
+        The types of larger modules are split into several files. If ``None``, the
+        types of a module are written to its ``__init__.py`` file. See ``write_module``.
+    light_enums: bool
+        Whether the enums of the runtime files derive from ``LightEnum`` instead of
+        ``Enum``. See ``write_enum``.
+    """
+    submodules = get_submodules(module.namespace for module in modules)
+    module_bases = [None] * len(modules)
+    if inheritance:
+        with instrumentation.stage("inheritance"):
+            import_prefix = f"ansys.mechanical.stubs.{pathlib.PurePath(outdir).name}"
+            modules, module_bases = resolve_inheritance(modules, import_prefix)
+    if jobs > 1 and len(modules) > 0:
+        with instrumentation.stage("render"):
+            render_parallel(
+                modules,
+                outdir,
+                output_format,
+                jobs,
+                writer,
+                submodules,
+                module_bases,
+                split_size,
+                light_enums,
+            )
+    else:
+        for module, bases in zip(modules, module_bases):
+            module_list = submodules[module.namespace]
+            with instrumentation.scope(namespace=module.namespace):
+                with instrumentation.stage("render"):
+                    write_module(
+                        module,
+                        outdir,
+                        output_format,
+                        None,
+                        writer,
+                        module_list,
+                        bases,
+                        split_size,
+                        light_enums=light_enums,
+                    )
+    with instrumentation.stage("render"):
+        write_namespace_modules(submodules, modules, outdir, output_format, writer)
+
+
+def write_namespace_modules(
+    submodules: typing.Dict[str, typing.List[str]],
+    modules: typing.List[ModuleInfo],
+    outdir: str,
+    output_format: str = "py",
+    writer: typing.Optional[StubWriter] = None,
+) -> None:
+    """Write the modules of the parent namespaces that have no types.
+
+    For example, ``Ansys/ACT/__init__.py`` only imports its submodules.
+
+    Parameters
+    ----------
+    submodules: typing.Dict[str, typing.List[str]]
+        The submodules of each module. See ``get_submodules``.
+    modules: typing.List[ModuleInfo]
+        The modules that have types, which are written by ``write_module``
+    outdir: str
+        The directory where modules are being written to.
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``write_module``.
+    writer: typing.Optional[StubWriter]
+        The writer that the files are written with. See ``write_module``.
+    """
+    written = {module.namespace for module in modules}
+    for namespace, module_list in submodules.items():
+        if namespace in written:
+            continue
+        import_str = f"ansys.mechanical.stubs.{pathlib.PurePath(outdir).name}.{namespace}"
+        path = pathlib.Path(outdir, *namespace.split("."))
+        for suffix in OUTPUT_SUFFIXES[output_format]:
+            header = module_header(import_str, module_list, pyi=suffix == ".pyi")
+            write_file(path / f"__init__{suffix}", f'"""{path.name} module."""\n{header}', writer)
+
+
+# Types of the modules being rendered by render_parallel. Forked worker processes
+# inherit them, so they don't have to be pickled for each chunk.
+_shared_module_types: typing.List[typing.List[TypeInfo]] = []
+_shared_module_bases: typing.List[typing.Optional[typing.Dict[str, typing.List[str]]]] = []
+
+
+def _render_shared_chunk(
+    module_index: int,
+    start: int,
+    stop: int,
+    has_doc: bool,
+    suffixes: typing.Tuple[str, ...],
+    light_enums: bool = False,
+) -> typing.Dict[str, str]:
+    """Render a chunk of the types of a module in a forked worker process."""
+    types = _shared_module_types[module_index][start:stop]
+    bases = _shared_module_bases[module_index]
+    return render_types(types, has_doc, suffixes, bases, light_enums)
+
+
+def get_start_method() -> str:
+    """Get the start method of the worker processes of ``render_parallel``.
+
+    Workers are forked, so that they inherit the types, unless the .NET runtime is
+    loaded. Forking a process that runs .NET threads can deadlock, so the workers are
+    then started by a fork server, or spawned where there is none.
+
+    Returns
+    -------
+    str
+        ``"fork"``, ``"forkserver"``, or ``"spawn"``.
+    """
+    start_methods = multiprocessing.get_all_start_methods()
+    if "fork" in start_methods and "clr" not in sys.modules:
+        return "fork"
+    return "forkserver" if "forkserver" in start_methods else "spawn"
+
+
+def render_parallel(
+    modules: typing.List[ModuleInfo],
+    outdir: str,
+    output_format: str = "py",
+    jobs: int = 2,
+    writer: typing.Optional[StubWriter] = None,
+    submodules: typing.Optional[typing.Dict[str, typing.List[str]]] = None,
+    module_bases: typing.Optional[typing.List[typing.Optional[ModuleBases]]] = None,
+    split_size: typing.Optional[int] = None,
+    light_enums: bool = False,
+) -> None:
+    """Write the modules of an assembly with a process pool.
+
+    The types of the modules are split into chunks of about the same estimated size,
+    so that large modules such as ``Ansys.ACT.Automation.Mechanical`` are shared by
+    several processes. The chunks are rendered largest first, and the files are written
+    by this process in the same order as ``render`` writes them, so the output doesn't
+    depend on the number of jobs.
+
+    Where processes can be forked, the workers inherit the types instead of receiving
+    a pickled copy of each chunk, which costs about as much as rendering it. Once
+    pythonnet has loaded the .NET runtime, as it has when the types are extracted from
+    the assemblies, the chunks are always pickled. See ``get_start_method``.
+
+    Parameters
+    ----------
+    modules: typing.List[ModuleInfo]
+        The modules of the namespaces of the assembly
+    outdir: str
+        The directory where modules are being written to.
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``write_module``.
+    jobs: int
+        The number of processes
+    writer: typing.Optional[StubWriter]
+        The writer that the files are written with. See ``write_module``.
+    submodules: typing.Optional[typing.Dict[str, typing.List[str]]]
+        The submodules of each module. See ``get_submodules``.
+    module_bases: typing.Optional[typing.List[typing.Optional[ModuleBases]]]
+        The base classes of the classes of each module, in the same order as
+        ``modules``. See ``write_module``.
+    split_size: typing.Optional[int]
+        The largest estimated size of the runtime files of the types of a module.
+        The chunks of a module that is split are its files. See ``write_module``.
+    light_enums: bool
+        Whether the enums of the runtime files derive from ``LightEnum``.
+        See ``write_enum``.
+    """
+    if submodules is None:
+        submodules = get_submodules(module.namespace for module in modules)
+    if module_bases is None:
+        module_bases = [None] * len(modules)
+    global _shared_module_types, _shared_module_bases
+
+    module_types = [get_module_types(module) for module in modules]
+    type_bases = [bases.bases if bases is not None else None for bases in module_bases]
+    total_size = sum(get_type_size(type_info) for types in module_types for type_info in types)
+    # A few chunks per process balance the load without sending many small tasks
+    chunk_size = max(1, total_size // (jobs * 4))
+
+    # The (start, stop) range of each chunk of each module, in order
+    module_chunks = []
+    split_modules = set()
+    tasks = []
+    for module_index, types in enumerate(module_types):
+        shards = get_type_shards(types, split_size)
+        if len(shards) > 1:
+            # Each file of a split module is rendered on its own
+            for chunk_index, (start, stop) in enumerate(shards):
+                size = sum(get_type_size(type_info) for type_info in types[start:stop])
+                tasks.append((size, module_index, chunk_index))
+            module_chunks.append(shards)
+            split_modules.add(module_index)
+            continue
+        chunks, start, size = [], 0, 0
+        for index, type_info in enumerate(types):
+            size += get_type_size(type_info)
+            if size >= chunk_size or index == len(types) - 1:
+                tasks.append((size, module_index, len(chunks)))
+                chunks.append((start, index + 1))
+                start, size = index + 1, 0
+        module_chunks.append(chunks)
+    tasks.sort(key=lambda task: task[0], reverse=True)
+
+    suffixes = OUTPUT_SUFFIXES[output_format]
+    start_method = get_start_method()
+    fork = start_method == "fork"
+    context = multiprocessing.get_context(start_method)
+    logging.info(f"Rendering {len(modules)} modules in {len(tasks)} chunks with {jobs} jobs")
+    _shared_module_types = module_types
+    _shared_module_bases = type_bases
+    try:
+        with concurrent.futures.ProcessPoolExecutor(jobs, mp_context=context) as executor:
+            futures = {}
+            for _, module_index, chunk_index in tasks:
+                start, stop = module_chunks[module_index][chunk_index]
+                has_doc = modules[module_index].has_doc
+                if fork:
+                    future = executor.submit(
+                        _render_shared_chunk,
+                        module_index,
+                        start,
+                        stop,
+                        has_doc,
+                        suffixes,
+                        light_enums,
+                    )
+                else:
+                    chunk = module_types[module_index][start:stop]
+                    future = executor.submit(
+                        render_types,
+                        chunk,
+                        has_doc,
+                        suffixes,
+                        type_bases[module_index],
+                        light_enums,
+                    )
+                futures[(module_index, chunk_index)] = future
+
+            for module_index, module in enumerate(modules):
+                chunk_bodies = [
+                    futures[(module_index, chunk_index)].result()
+                    for chunk_index in range(len(module_chunks[module_index]))
+                ]
+                bodies = {
+                    suffix: "".join(body[suffix] for body in chunk_bodies) for suffix in suffixes
+                }
+                module_list = submodules[module.namespace]
+                write_module(
+                    module,
+                    outdir,
+                    output_format,
+                    bodies,
+                    writer,
+                    module_list,
+                    module_bases[module_index],
+                    split_size,
+                    chunk_bodies if module_index in split_modules else None,
+                    light_enums,
+                )
+    finally:
+        _shared_module_types = []
+        _shared_module_bases = []
+
+
+def make(
+    outdir: str,
+    assembly_names: typing.List[str],
+    type_filter: typing.Callable = None,
+    output_format: str = "py",
+    cache_dir: str = None,
+    snapshot_dir: str = None,
+    jobs: int = 1,
+    writer: typing.Optional[StubWriter] = None,
+    inheritance: bool = False,
+    split_size: typing.Optional[int] = None,
+    light_enums: bool = False,
+) -> typing.List[ModuleInfo]:
+    """Generate Python stubs for assemblies.
+
+    All the assemblies are loaded before the modules are written, so that the
+    submodules of each module are known when it is written.
+
+    Parameters
+    ----------
+    outdir: str
+        The directory where modules are being written to.
+    assembly_names: typing.List[str]
+        The names of the assemblies
+    type_filter: typing.Callable
+        Whether or not a type is published
+    output_format: str
+        ``"py"``, ``"pyi"``, or ``"both"``. See ``write_module``.
+    cache_dir: str
+        The directory of the doc cache, which is reused by later runs. If ``None``,
+        the XML doc file is parsed on every run.
+    snapshot_dir: str
+        The directory where the snapshot of each assembly is written, as
+        ``<assembly_name>.jsonl``. The stubs can be rendered again from the snapshots
+        with ``render``. If ``None``, no snapshot is written.
+    jobs: int
+        The number of processes rendering the modules. See ``render_parallel``.
+    writer: typing.Optional[StubWriter]
+        The writer that the files are written with. See ``write_module``.
+    inheritance: bool
+        Whether the classes derive from their bases. See ``render``.
+    split_size: typing.Optional[int]
+        The largest estimated size of the runtime files of the types of a module.
+        See ``render``.
+    light_enums: bool
+        Whether the enums of the runtime files derive from ``LightEnum``. See ``render``.
+
+    Returns
+    -------
+    typing.List[ModuleInfo]
+        The modules of all the assemblies, with flattened classes
+    """
+    modules = []
+    for assembly_name in assembly_names:
+        assembly_modules = extract(assembly_name, type_filter, cache_dir)
+        if snapshot_dir is not None:
+            snapshot = Snapshot(assembly_name, pathlib.PurePath(outdir).name, assembly_modules)
+            write_snapshot(pathlib.Path(snapshot_dir) / f"{assembly_name}.jsonl", snapshot)
+        modules.extend(assembly_modules)
+    render(modules, outdir, output_format, jobs, writer, inheritance, split_size, light_enums)
+    return modules
@@ -0,0 +1,380 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Resolve the Python base classes of the generated classes.
+
+By default, each class is written with all the members it inherits, flattened into
+the class. With ``resolve_inheritance``, a class derives from the generated classes
+of its .NET base class and interfaces instead, and only writes the members that it
+doesn't inherit from them.
+
+A class is still flattened when its bases can't be written in Python: when they
+have no consistent method resolution order, or when importing them would make a
+cycle between the modules.
+"""
+
+from dataclasses import dataclass, field, replace
+import typing
+
+from ansys.mechanical.stubs.stub_generator.module_header import (
+    DATAMODEL_INTERFACES,
+    get_submodules,
+)
+from ansys.mechanical.stubs.stub_generator.snapshot import (
+    Method,
+    ModuleInfo,
+    Property,
+    TypeInfo,
+)
+
+# Names that the header of a module defines, which imported bases must not shadow
+HEADER_NAMES = frozenset(["Ansys", "Enum", "annotations", "importlib", "typing"])
+
+
+@dataclass
+class ModuleBases:
+    """Python base classes of the classes of a module."""
+
+    bases: typing.Dict[str, typing.List[str]] = field(default_factory=dict)
+    """Names of the bases of each class, as written in its ``class`` statement."""
+    imports: typing.List[str] = field(default_factory=list)
+    """Import statements of the bases that are defined in other modules."""
+
+
+def member_key(member: typing.Union[Property, Method]) -> typing.Tuple:
+    """Get the key that identifies a property or method across the types that have it.
+
+    The key has the declaring type and the signature of the member, so a member
+    of a constructed generic interface, whose types are resolved, doesn't match
+    the member of the generic interface.
+    """
+    if isinstance(member, Property):
+        return ("P", member.name, member.declaring_type, member.type, member.static)
+    args = tuple(arg.type for arg in member.args)
+    return ("M", member.name, member.declaring_type, member.return_type, member.static, args)
+
+
+def c3_merge(sequences: typing.List[typing.List[str]]) -> typing.Optional[typing.List[str]]:
+    """Merge the linearizations of the bases of a class with the C3 algorithm.
+
+    Parameters
+    ----------
+    sequences: typing.List[typing.List[str]]
+        The method resolution order of each base, followed by the list of bases
+
+    Returns
+    -------
+    typing.Optional[typing.List[str]]
+        The merged order, or ``None`` if the bases have no consistent order
+    """
+    sequences = [list(sequence) for sequence in sequences if sequence]
+    merged = []
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return None
+        merged.append(head)
+        sequences = [[name for name in sequence if name != head] for sequence in sequences]
+        sequences = [sequence for sequence in sequences if sequence]
+    return merged
+
+
+def strongly_connected_components(
+    graph: typing.Dict[str, typing.Set[str]],
+) -> typing.Dict[str, int]:
+    """Get the strongly connected component of each node of a directed graph.
+
+    Parameters
+    ----------
+    graph: typing.Dict[str, typing.Set[str]]
+        The successors of each node. Every successor must also be a node.
+
+    Returns
+    -------
+    typing.Dict[str, int]
+        The index of the component of each node. Nodes on a cycle share a component.
+    """
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    components = {}
+    # Iterative Tarjan's algorithm, the graph can be deeper than the recursion limit
+    for root in sorted(graph):
+        if root in index:
+            continue
+        work = [(root, iter(sorted(graph[root])))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = len(index)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(sorted(graph[successor]))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = len(set(components.values()))
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        components[member] = component
+                        if member == node:
+                            break
+    return components
+
+
+class _Resolver:
+    """Resolve the bases of the classes of all the modules of a version."""
+
+    def __init__(self, modules: typing.List[ModuleInfo]):
+        self.modules = modules
+        self.classes: typing.Dict[str, TypeInfo] = {}
+        self.namespaces: typing.Dict[str, str] = {}
+        ambiguous = set()
+        for module in modules:
+            for type_info in module.types:
+                if type_info.kind != "class":
+                    continue
+                full_name = f"{module.namespace}.{type_info.name}"
+                if full_name in self.classes:
+                    # For example, a generic and a non-generic type of the same name
+                    ambiguous.add(full_name)
+                self.classes[full_name] = type_info
+                self.namespaces[full_name] = module.namespace
+        for full_name in ambiguous:
+            del self.classes[full_name]
+        self._ancestors: typing.Dict[str, typing.FrozenSet[str]] = {}
+        self._mros: typing.Dict[str, typing.List[str]] = {}
+        self.bases: typing.Dict[str, typing.List[str]] = {}
+
+    def candidates(self, full_name: str) -> typing.List[str]:
+        """Get the bases of a class that are generated classes."""
+        candidates = []
+        for base in self.classes[full_name].bases:
+            if base in self.classes and base != full_name and base not in candidates:
+                candidates.append(base)
+        return candidates
+
+    def ancestors(self, full_name: str) -> typing.FrozenSet[str]:
+        """Get the generated classes that a class derives from, directly or not."""
+        if full_name not in self._ancestors:
+            # Guard against a malformed hierarchy with a cycle
+            self._ancestors[full_name] = frozenset()
+            ancestors = set()
+            for base in self.candidates(full_name):
+                ancestors.add(base)
+                ancestors.update(self.ancestors(base))
+            self._ancestors[full_name] = frozenset(ancestors)
+        return self._ancestors[full_name]
+
+    def direct_bases(self, full_name: str) -> typing.List[str]:
+        """Get the bases of a class that no other base of the class derives from."""
+        candidates = self.candidates(full_name)
+        return [
+            base
+            for base in candidates
+            if not any(base in self.ancestors(other) for other in candidates if other != base)
+        ]
+
+    def import_graph(
+        self, direct_bases: typing.Dict[str, typing.List[str]]
+    ) -> typing.Dict[str, typing.Set[str]]:
+        """Get the modules that each module imports, if all the direct bases are kept.
+
+        Importing a module also imports the modules of its parent namespaces.
+        """
+        graph = {namespace: set() for namespace in get_submodules(self.namespaces.values())}
+        for namespace in list(graph):
+            parent = namespace.rpartition(".")[0]
+            if parent:
+                graph[namespace].add(parent)
+        for full_name, bases in direct_bases.items():
+            namespace = self.namespaces[full_name]
+            for base in bases:
+                if self.namespaces[base] != namespace:
+                    graph[namespace].add(self.namespaces[base])
+        return graph
+
+    def mro(self, full_name: str) -> typing.List[str]:
+        """Get the method resolution order of a class with its resolved bases.
+
+        The bases of a class whose order is inconsistent are dropped, so that the
+        class is flattened.
+        """
+        if full_name not in self._mros:
+            bases = self.bases.get(full_name, [])
+            merged = c3_merge([*(self.mro(base) for base in bases), bases])
+            if merged is None:
+                self.bases[full_name] = bases = []
+                merged = []
+            self._mros[full_name] = [full_name, *merged]
+        return self._mros[full_name]
+
+    def resolve(self) -> None:
+        """Resolve the bases of every class."""
+        direct_bases = {full_name: self.direct_bases(full_name) for full_name in self.classes}
+        components = strongly_connected_components(self.import_graph(direct_bases))
+        for full_name, bases in direct_bases.items():
+            component = components[self.namespaces[full_name]]
+            self.bases[full_name] = [
+                base
+                for base in bases
+                if self.namespaces[base] == self.namespaces[full_name]
+                or components[self.namespaces[base]] != component
+            ]
+        for full_name in self.classes:
+            self.mro(full_name)
+
+    def declared_members(self, full_name: str) -> TypeInfo:
+        """Get a class with only the members that it doesn't inherit from its bases."""
+        type_info = self.classes[full_name]
+        bases = self.bases[full_name]
+        if not bases:
+            return type_info
+        inherited = set()
+        for base in bases:
+            base_info = self.classes[base]
+            inherited.update(member_key(member) for member in base_info.properties)
+            inherited.update(member_key(member) for member in base_info.methods)
+        properties = [prop for prop in type_info.properties if member_key(prop) not in inherited]
+        # A method hides all the overloads of its name in the bases, so they are
+        # written again with it
+        names = {method.name for method in type_info.methods if member_key(method) not in inherited}
+        methods = [method for method in type_info.methods if method.name in names]
+        return replace(type_info, properties=properties, methods=methods)
+
+
+def _sort_classes(
+    module: ModuleInfo, local_bases: typing.Callable[[TypeInfo], typing.List[TypeInfo]]
+) -> typing.List[TypeInfo]:
+    """Sort the types of a module so that each class follows its bases in the module."""
+    ordered = []
+    visited = set()
+
+    def visit(type_info: TypeInfo) -> None:
+        if id(type_info) in visited:
+            return
+        visited.add(id(type_info))
+        for base in local_bases(type_info):
+            visit(base)
+        ordered.append(type_info)
+
+    for type_info in module.types:
+        visit(type_info)
+    return ordered
+
+
+def resolve_inheritance(
+    modules: typing.List[ModuleInfo], import_prefix: str
+) -> typing.Tuple[typing.List[ModuleInfo], typing.List[ModuleBases]]:
+    """Get the modules of a version with the classes deriving from their bases.
+
+    The bases of a class are the generated classes of its .NET base class and
+    interfaces, without the ones that another base already derives from. Each
+    module is sorted so that a class follows its bases, and the bases in other
+    modules are imported.
+
+    Parameters
+    ----------
+    modules: typing.List[ModuleInfo]
+        The modules of all the assemblies of the version, with flattened classes
+    import_prefix: str
+        Import path of the version package. For example, ``ansys.mechanical.stubs.v261``.
+
+    Returns
+    -------
+    typing.Tuple[typing.List[ModuleInfo], typing.List[ModuleBases]]
+        The modules with only the members that each class doesn't inherit, and the
+        bases of the classes of each module, in the same order as ``modules``
+    """
+    resolver = _Resolver(modules)
+    resolver.resolve()
+    submodules = get_submodules(module.namespace for module in modules)
+
+    resolved_modules = []
+    module_bases = []
+    for module in modules:
+
+        def full_name_of(type_info: TypeInfo) -> str:
+            return f"{module.namespace}.{type_info.name}"
+
+        def local_bases(type_info: TypeInfo) -> typing.List[TypeInfo]:
+            full_name = full_name_of(type_info)
+            if type_info.kind != "class" or resolver.classes.get(full_name) is not type_info:
+                return []
+            return [
+                resolver.classes[base]
+                for base in resolver.bases[full_name]
+                if resolver.namespaces[base] == module.namespace
+            ]
+
+        reserved = {type_info.name for type_info in module.types}
+        reserved.update(submodules.get(module.namespace, []))
+        reserved.update(HEADER_NAMES)
+        if module.namespace == DATAMODEL_INTERFACES:
+            reserved.add("DataModelObject")
+
+        bases = ModuleBases()
+        base_names = {}
+        types = []
+        for type_info in _sort_classes(module, local_bases):
+            full_name = full_name_of(type_info)
+            if type_info.kind != "class" or resolver.classes.get(full_name) is not type_info:
+                types.append(type_info)
+                continue
+            for base in resolver.bases[full_name]:
+                base_namespace = resolver.namespaces[base]
+                if base_namespace == module.namespace:
+                    base_names[base] = resolver.classes[base].name
+                if base in base_names:
+                    continue
+                name = resolver.classes[base].name
+                import_line = f"from {import_prefix}.{base_namespace} import {name}"
+                if name in reserved:
+                    alias = f"_{base.replace('.', '_')}"
+                    import_line += f" as {alias}"
+                    name = alias
+                reserved.add(name)
+                base_names[base] = name
+                bases.imports.append(import_line)
+            if resolver.bases[full_name]:
+                bases.bases[type_info.name] = [
+                    base_names[base] for base in resolver.bases[full_name]
+                ]
+            types.append(resolver.declared_members(full_name))
+        resolved_modules.append(replace(module, types=types))
+        module_bases.append(bases)
+    return resolved_modules, module_bases
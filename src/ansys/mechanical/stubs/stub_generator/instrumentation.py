@@ -0,0 +1,173 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Record the time and counters of each stage of a generator run."""
+
+import contextlib
+import json
+import pathlib
+import time
+import typing
+
+
+class RunReport:
+    """Wall time, CPU time, and counters of the stages of a generator run.
+
+    Stages and counters are recorded by assembly and namespace. See ``scope``. The
+    ones recorded outside of an assembly or a namespace have an empty name for it.
+    """
+
+    def __init__(self):
+        self.stages: typing.Dict[typing.Tuple[str, str, str], typing.Dict[str, float]] = {}
+        self.counters: typing.Dict[typing.Tuple[str, str, str], int] = {}
+        self.assembly = ""
+        self.namespace = ""
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    def add_stage(self, name: str, wall: float, cpu: float) -> None:
+        """Add the time of one call of a stage in the current scope."""
+        stage = self.stages.setdefault(
+            (name, self.assembly, self.namespace), {"calls": 0, "wall": 0.0, "cpu": 0.0}
+        )
+        stage["calls"] += 1
+        stage["wall"] += wall
+        stage["cpu"] += cpu
+
+    def add_count(self, name: str, value: int) -> None:
+        """Add to a counter in the current scope."""
+        key = (name, self.assembly, self.namespace)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """Get the report as a JSON-serializable dictionary.
+
+        The stages and counters are also summed over the assemblies and namespaces.
+        """
+        totals = {}
+        for (name, _, _), stage in self.stages.items():
+            total = totals.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0})
+            for field, value in stage.items():
+                total[field] += value
+        counter_totals = {}
+        for (name, _, _), value in self.counters.items():
+            counter_totals[name] = counter_totals.get(name, 0) + value
+        return {
+            "wall": time.perf_counter() - self._start_wall,
+            "cpu": time.process_time() - self._start_cpu,
+            "stage_totals": totals,
+            "counter_totals": counter_totals,
+            "stages": [
+                {"stage": name, "assembly": assembly, "namespace": namespace, **stage}
+                for (name, assembly, namespace), stage in self.stages.items()
+            ],
+            "counters": [
+                {"counter": name, "assembly": assembly, "namespace": namespace, "value": value}
+                for (name, assembly, namespace), value in self.counters.items()
+            ],
+        }
+
+    def write(self, path: str) -> None:
+        """Write the report to a JSON file."""
+        with pathlib.Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+
+# The report of the current run, or None if the run isn't instrumented
+_report: typing.Optional[RunReport] = None
+
+
+def start_report() -> RunReport:
+    """Start recording the stages and counters of the run."""
+    global _report
+
+    _report = RunReport()
+    return _report
+
+
+def stop_report() -> typing.Optional[RunReport]:
+    """Stop recording and get the report of the run, if it was started."""
+    global _report
+
+    report, _report = _report, None
+    return report
+
+
+@contextlib.contextmanager
+def scope(assembly: typing.Optional[str] = None, namespace: typing.Optional[str] = None):
+    """Record the stages and counters in the block for an assembly or a namespace.
+
+    Parameters
+    ----------
+    assembly: typing.Optional[str]
+        The name of the assembly. If ``None``, the assembly of the outer scope is kept.
+    namespace: typing.Optional[str]
+        The namespace. If ``None``, the namespace of the outer scope is kept.
+    """
+    report = _report
+    if report is None:
+        yield
+        return
+    outer = report.assembly, report.namespace
+    if assembly is not None:
+        report.assembly = assembly
+    if namespace is not None:
+        report.namespace = namespace
+    try:
+        yield
+    finally:
+        report.assembly, report.namespace = outer
+
+
+@contextlib.contextmanager
+def stage(name: str):
+    """Record the wall and CPU time of the block as a stage of the run.
+
+    Parameters
+    ----------
+    name: str
+        The name of the stage. For example, ``"doc_load"``.
+    """
+    report = _report
+    if report is None:
+        yield
+        return
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    try:
+        yield
+    finally:
+        report.add_stage(name, time.perf_counter() - start_wall, time.process_time() - start_cpu)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to a counter of the run, if the run is instrumented.
+
+    Parameters
+    ----------
+    name: str
+        The name of the counter. For example, ``"doc_hits"``.
+    value: int
+        The value to add.
+    """
+    if _report is not None:
+        _report.add_count(name, value)
@@ -0,0 +1,365 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Write the API reference of the generated modules as Markdown pages.
+
+The pages are written straight from the extracted types, with the layout of the
+Markdown API reference built with Sphinx: an ``index.md`` page per namespace and a
+page per class or enum, under ``ansys/mechanical/stubs/<version>``.
+"""
+
+import collections
+import pathlib
+import typing
+
+from ansys.mechanical.stubs.stub_generator import instrumentation
+from ansys.mechanical.stubs.stub_generator.generate_content import (
+    ENUM_VALUE_REPLACEMENTS,
+    c_types_to_python,
+    convert_operator_name,
+    fix_str,
+    get_class_methods,
+    get_module_types,
+)
+from ansys.mechanical.stubs.stub_generator.module_header import (
+    DATAMODEL_INTERFACES,
+    get_submodules,
+)
+from ansys.mechanical.stubs.stub_generator.snapshot import (
+    Method,
+    ModuleInfo,
+    Property,
+    TypeInfo,
+)
+from ansys.mechanical.stubs.stub_generator.stub_writer import StubWriter, write_file
+from ansys.mechanical.stubs.stub_generator.xml_doc import DocMember
+
+# Directories of the version packages in the API reference
+STUBS_PATH = ("ansys", "mechanical", "stubs")
+
+
+def version_title(version: str) -> str:
+    """Get the title of a version. For example, ``Mechanical 2026 R1`` for ``v261``."""
+    return f"Mechanical 20{version[1:3]} R{version[3]}"
+
+
+def escape_cell(text: str) -> str:
+    """Escape text for a cell of a Markdown table."""
+    return " ".join(text.split()).replace("|", "\\|")
+
+
+def is_interface(name: str) -> bool:
+    """Whether a class is an interface, by the ``I<Name>`` naming convention."""
+    return name.startswith("I") and name[1:2].isupper()
+
+
+def type_summary(type_info: TypeInfo, has_doc: bool = True) -> str:
+    """Get the summary of a class or enum, as in the docstring of its stub.
+
+    Parameters
+    ----------
+    type_info: TypeInfo
+        The class or enum
+    has_doc: bool
+        Whether the assembly has an XML doc file. If not, the placeholder of the
+        stubs is used.
+    """
+    if has_doc:
+        if type_info.doc is None:
+            return ""
+        return type_info.doc.summary or ""
+    if type_info.kind == "enum":
+        return ""
+    kind = "interface" if type_info.name[0] == "I" else "class"
+    return f"{type_info.name} {kind}."
+
+
+def member_summary(member: typing.Union[Property, Method], kind: str) -> str:
+    """Get the summary of a property or method, as in the docstring of its stub.
+
+    Parameters
+    ----------
+    member: typing.Union[Property, Method]
+        The property or method
+    kind: str
+        ``"property"`` or ``"method"``, for the placeholder of undocumented members
+    """
+    if member.doc is not None:
+        return member.doc.summary or ""
+    if member.name == "GetChildren":
+        return "Gets the list of children, filtered by type."
+    return f"{member.name} {kind}."
+
+
+def _python_type(type_str: str) -> str:
+    """Get the Python annotation of a reflected type name, without quotes."""
+    return c_types_to_python(type_str).replace('"', "")
+
+
+def _table(rows: typing.List[typing.Tuple[str, str]], header: str = "Description") -> str:
+    lines = [f"| Name | {header} |", "|------|------|"]
+    lines.extend(f"| {name} | {escape_cell(text)} |" for name, text in rows)
+    return "\n".join(lines) + "\n\n"
+
+
+def _doc_sections(doc: typing.Optional[DocMember]) -> str:
+    """Get the parameters, remarks, and example of a member."""
+    if doc is None:
+        return ""
+    sections = []
+    if doc.params:
+        lines = [f"- `{name}`: {' '.join(text.split())}" for name, text in doc.params]
+        sections.append("**Parameters**\n\n" + "\n".join(lines) + "\n\n")
+    if doc.remarks:
+        sections.append(f"**Remarks**\n\n{doc.remarks.strip()}\n\n")
+    if doc.example:
+        sections.append(f"**Example**\n\n```\n{doc.example.strip()}\n```\n\n")
+    return "".join(sections)
+
+
+def _property_access(prop: Property) -> str:
+    if prop.getter and prop.setter:
+        access = "Read and write property"
+    elif prop.setter:
+        access = "Write-only property"
+    else:
+        access = "Read-only property"
+    return f"Static {access[0].lower()}{access[1:]}" if prop.static else access
+
+
+def class_page(class_info: TypeInfo, namespace: str, has_doc: bool = True) -> str:
+    """Render the page of a class.
+
+    The page has an overview table of the properties and methods, which link to
+    their details on the same page.
+
+    Parameters
+    ----------
+    class_info: TypeInfo
+        The class and its properties and methods
+    namespace: str
+        The namespace of the class
+    has_doc: bool
+        Whether the assembly has an XML doc file
+
+    Returns
+    -------
+    str
+        The Markdown page
+    """
+    name = class_info.name
+    kind = "interface" if is_interface(name) else "class"
+    lines = [f"# {name}\n\n", f"#### *{kind}* {namespace}.{name}\n\n"]
+    summary = type_summary(class_info, has_doc)
+    if summary:
+        lines.append(f"{summary}\n\n")
+
+    properties = class_info.properties
+    methods = [
+        (convert_operator_name(method.name, method.args, method.static), method)
+        for method in get_class_methods(class_info)
+    ]
+    if properties or methods:
+        lines.append("## Overview\n\n")
+    if properties:
+        rows = [
+            (f"[`{prop.name}`](#{name}.{prop.name})", member_summary(prop, "property"))
+            for prop in properties
+        ]
+        lines.append("### Properties\n\n" + _table(rows))
+    if methods:
+        # Overloads share one row and one anchor
+        overloads = collections.defaultdict(list)
+        for method_name, method in methods:
+            overloads[method_name].append(method)
+        rows = [
+            (f"[`{method_name}`](#{name}.{method_name})", member_summary(group[0], "method"))
+            for method_name, group in overloads.items()
+        ]
+        lines.append("### Methods\n\n" + _table(rows))
+
+    if properties:
+        lines.append("## Property detail\n\n")
+        for prop in properties:
+            prop_type = _python_type(fix_str(prop.type))
+            lines.append(f'<a id="{name}.{prop.name}"></a>\n\n')
+            lines.append(f"### `{prop.name}`\n\n")
+            lines.append(f"`{name}.{prop.name}: typing.Optional[{prop_type}]`\n\n")
+            lines.append(f"{_property_access(prop)}.\n\n")
+            summary = member_summary(prop, "property")
+            if summary:
+                lines.append(f"{summary}\n\n")
+            lines.append(_doc_sections(prop.doc))
+
+    if methods:
+        lines.append("## Method detail\n\n")
+        anchors = set()
+        for method_name, method in methods:
+            if method_name not in anchors:
+                anchors.add(method_name)
+                lines.append(f'<a id="{name}.{method_name}"></a>\n\n')
+                lines.append(f"### `{method_name}`\n\n")
+            args = ", ".join(f"{arg.name}: {_python_type(arg.type)}" for arg in method.args)
+            return_type = _python_type(method.return_type)
+            prefix = "*classmethod* " if method.static else ""
+            lines.append(f"{prefix}`{name}.{method_name}({args}) -> {return_type}`\n\n")
+            summary = member_summary(method, "method")
+            if summary:
+                lines.append(f"{summary}\n\n")
+            lines.append(_doc_sections(method.doc))
+    return "".join(lines)
+
+
+def enum_page(enum_info: TypeInfo, namespace: str, has_doc: bool = True) -> str:
+    """Render the page of an enum, with a table of its fields.
+
+    Parameters
+    ----------
+    enum_info: TypeInfo
+        The enum and its fields
+    namespace: str
+        The namespace of the enum
+    has_doc: bool
+        Whether the assembly has an XML doc file
+
+    Returns
+    -------
+    str
+        The Markdown page
+    """
+    lines = [f"# {enum_info.name}\n\n", f"#### *enum* {namespace}.{enum_info.name}\n\n"]
+    summary = type_summary(enum_info, has_doc)
+    if summary:
+        lines.append(f"{summary}\n\n")
+    if enum_info.fields:
+        rows = [
+            (f"`{ENUM_VALUE_REPLACEMENTS.get(field.name, field.name)}`", str(field.value))
+            for field in enum_info.fields
+        ]
+        lines.append("## Fields\n\n" + _table(rows, "Value"))
+    return "".join(lines)
+
+
+def namespace_page(
+    namespace: str,
+    types: typing.List[TypeInfo],
+    module_list: typing.Sequence[str] = (),
+    has_doc: bool = True,
+) -> str:
+    """Render the index page of a namespace.
+
+    The page has a table of its submodules, interfaces, classes, and enums, which
+    link to their pages.
+
+    Parameters
+    ----------
+    namespace: str
+        The namespace
+    types: typing.List[TypeInfo]
+        The classes and enums of the namespace
+    module_list: typing.Sequence[str]
+        The names of the submodules of the namespace. See ``get_submodules``.
+    has_doc: bool
+        Whether the assembly has an XML doc file
+
+    Returns
+    -------
+    str
+        The Markdown page
+    """
+    lines = [f"# `{namespace.split('.')[-1]}`\n\n", f"The `{namespace}` namespace.\n\n"]
+    if module_list:
+        rows = [(f"[`{module}`]({module}/index.md)", "") for module in module_list]
+        lines.append("## Modules\n\n" + _table(rows))
+
+    groups = [
+        ("Interfaces", [t for t in types if t.kind == "class" and is_interface(t.name)]),
+        ("Classes", [t for t in types if t.kind == "class" and not is_interface(t.name)]),
+        ("Enums", [t for t in types if t.kind == "enum"]),
+    ]
+    for title, group in groups:
+        if group:
+            rows = [
+                (f"[`{t.name}`]({t.name}.md)", type_summary(t, has_doc))
+                for t in sorted(group, key=lambda t: t.name)
+            ]
+            lines.append(f"## {title}\n\n" + _table(rows))
+    return "".join(lines)
+
+
+def version_page(version: str, module_list: typing.Sequence[str]) -> str:
+    """Render the index page of a version, which links to its top-level namespaces."""
+    lines = [f"# {version_title(version)}\n\n"]
+    rows = [(f"[`{module}`]({module}/index.md)", "") for module in module_list]
+    lines.append("## Modules\n\n" + _table(rows))
+    return "".join(lines)
+
+
+def render_markdown(
+    modules: typing.List[ModuleInfo],
+    outdir: str,
+    version: str,
+    writer: typing.Optional[StubWriter] = None,
+) -> pathlib.Path:
+    """Write the Markdown API reference of a version.
+
+    Parameters
+    ----------
+    modules: typing.List[ModuleInfo]
+        The modules of all the assemblies of the version
+    outdir: str
+        The directory of the API reference. The pages are written to
+        ``<outdir>/ansys/mechanical/stubs/<version>``.
+    version: str
+        The name of the version directory. For example, ``v261``.
+    writer: typing.Optional[StubWriter]
+        The writer that the pages are written with. If ``None``, the pages are
+        written directly.
+
+    Returns
+    -------
+    pathlib.Path
+        The directory of the pages of the version
+    """
+    version_dir = pathlib.Path(outdir, *STUBS_PATH, version)
+    submodules = get_submodules(module.namespace for module in modules)
+    module_types = {module.namespace: module for module in modules}
+    with instrumentation.stage("markdown"):
+        for namespace, module_list in submodules.items():
+            namespace_dir = version_dir.joinpath(*namespace.split("."))
+            module = module_types.get(namespace)
+            types = get_module_types(module) if module is not None else []
+            has_doc = module.has_doc if module is not None else True
+            if namespace == DATAMODEL_INTERFACES:
+                # The stubs define DataModelObject in this namespace
+                types = [*types, TypeInfo(name="DataModelObject", kind="class", doc=None)]
+            page = namespace_page(namespace, types, module_list, has_doc)
+            write_file(namespace_dir / "index.md", page, writer)
+            for type_info in types:
+                if type_info.kind == "enum":
+                    page = enum_page(type_info, namespace, has_doc)
+                else:
+                    page = class_page(type_info, namespace, has_doc)
+                write_file(namespace_dir / f"{type_info.name}.md", page, writer)
+        top_level = sorted({namespace.split(".")[0] for namespace in submodules})
+        write_file(version_dir / "index.md", version_page(version, top_level), writer)
+    return version_dir
@@ -0,0 +1,308 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Create the imports at the top of the generated module files."""
+
+import typing
+
+DATAMODEL_INTERFACES = "Ansys.Mechanical.DataModel.Interfaces"
+"""The namespace that gets a ``DataModelObject`` class deriving from ``IDataModelObject``."""
+
+LIGHT_ENUM_IMPORT = "from ansys.mechanical.stubs._enums import LightEnum\n"
+"""Import of the base class of the enums of runtime modules, with ``light_enums``."""
+
+
+def get_submodules(namespaces: typing.Iterable[str]) -> typing.Dict[str, typing.List[str]]:
+    """Get the submodules of each module of the generated tree.
+
+    Parameters
+    ----------
+    namespaces: typing.Iterable[str]
+        The namespaces that have types. For example, ``Ansys.ACT.Automation.Mechanical``.
+
+    Returns
+    -------
+    typing.Dict[str, typing.List[str]]
+        The sorted names of the submodules of each namespace and of each parent
+        namespace. For example, ``Ansys.ACT`` is mapped to ``["Automation", ...]``.
+    """
+    children = {}
+    for namespace in namespaces:
+        tokens = namespace.split(".")
+        for index in range(1, len(tokens) + 1):
+            children.setdefault(".".join(tokens[:index]), set())
+            if index < len(tokens):
+                children[".".join(tokens[:index])].add(tokens[index])
+    return {namespace: sorted(names) for namespace, names in children.items()}
+
+
+def module_header(
+    import_str: str,
+    module_list: typing.List[str],
+    names: typing.Optional[typing.Sequence[str]] = None,
+    has_enums: bool = False,
+    pyi: bool = False,
+    base_imports: typing.Sequence[str] = (),
+    type_modules: typing.Optional[typing.Mapping[str, str]] = None,
+    light_enums: bool = False,
+) -> str:
+    """Create the imports and ``__all__`` of a module, which follow its docstring.
+
+    Parameters
+    ----------
+    import_str: str
+        Import path of the module. For example, ``ansys.mechanical.stubs.v261.Ansys.ACT``.
+    module_list: list
+        Names of the submodules of the module.
+    names: list
+        Names of the classes and enums defined in the module, or ``None`` if the
+        module only has submodules.
+    has_enums: bool
+        Whether the module defines enums.
+    pyi: bool
+        Whether the module is a ``.pyi`` stub file.
+    base_imports: list
+        Import statements of the base classes that are defined in other modules.
+        They are executed when the module is imported, since the classes of the
+        module derive from them.
+    type_modules: dict
+        The private submodule that defines each class and enum, if the types of the
+        module are split into several files. See ``lazy_loader``.
+    light_enums: bool
+        Whether the enums of a runtime module derive from ``LightEnum`` instead of
+        ``Enum``. Stub files always use ``Enum``.
+
+    Returns
+    -------
+    str
+        The header of the module. The classes and enums of the module follow it.
+    """
+    if names is None:
+        if pyi:
+            return stub_imports(import_str, module_list)
+        return module_imports(module_list) + lazy_loader(import_str, module_list)
+
+    lines = []
+    # Annotations in stub files are never evaluated
+    if not pyi:
+        lines.append("from __future__ import annotations\n")
+    if has_enums:
+        lines.append(LIGHT_ENUM_IMPORT if light_enums and not pyi else "from enum import Enum\n")
+    if pyi:
+        lines.append("import typing\n")
+        lines.extend(f"{line}\n" for line in base_imports)
+        lines.append(stub_imports(import_str, module_list, names, import_ansys=True))
+    else:
+        lines.append(module_imports(module_list, bool(type_modules)))
+        if base_imports:
+            lines.extend(f"{line}\n" for line in base_imports)
+            lines.append("\n")
+        lines.append(
+            lazy_loader(
+                import_str, module_list, names, import_ansys=True, type_modules=type_modules
+            )
+        )
+    lines.append("\n\n")
+    return "".join(lines)
+
+
+def lazy_loader(
+    import_str: str,
+    module_list: typing.List[str],
+    names: typing.Sequence[str] = (),
+    import_ansys: bool = False,
+    type_modules: typing.Optional[typing.Mapping[str, str]] = None,
+) -> str:
+    """Create the PEP 562 loader that imports the submodules of a module on first access.
+
+    Importing a version package used to import the whole ``Ansys`` tree. With the
+    loader, a submodule such as ``Ansys.ACT`` is only imported when it is first
+    touched. The submodules are still imported in a ``typing.TYPE_CHECKING`` block
+    so that IDEs and type checkers can follow them.
+
+    Parameters
+    ----------
+    import_str: str
+        Import path of the module. For example, ``ansys.mechanical.stubs.v261.Ansys.ACT``.
+    module_list: list
+        Names of the submodules of the module.
+    names: list
+        Names of the classes and enums defined in the module.
+    import_ansys: bool
+        Whether to also import ``Ansys`` for the type annotations of the module.
+    type_modules: dict
+        The private submodule that defines each class and enum, if the types of the
+        module are split into several files. The ``_TYPES`` table of the loader maps
+        each name to its submodule, which is only imported when the name is first
+        accessed.
+
+    Returns
+    -------
+    str
+        The source code of the loader. It requires ``typing``, and ``importlib`` if the
+        module has submodules or split types.
+    """
+    lines = []
+    if import_ansys or module_list or type_modules:
+        lines.append("if typing.TYPE_CHECKING:\n")
+        if import_ansys:
+            lines.append("    import Ansys\n")
+        for module in module_list:
+            lines.append(f"    import {import_str}.{module} as {module}\n")
+        for type_module, type_names in _group_names(type_modules or {}).items():
+            lines.append(f"    from .{type_module} import {', '.join(type_names)}\n")
+        lines.append("\n")
+
+    all_names = ", ".join(f'"{name}"' for name in [*names, *module_list])
+    lines.append(f"__all__ = [{all_names}]\n")
+    if type_modules:
+        table = ", ".join(f'"{name}": "{module}"' for name, module in type_modules.items())
+        lines.append(f"_TYPES = {{{table}}}\n")
+    if module_list:
+        module_names = ", ".join(f'"{module}"' for module in module_list)
+        lines.append(f"_SUBMODULES = {{{module_names}}}\n")
+    if type_modules or module_list:
+        lines.append("\n\n")
+        lines.append("def __getattr__(name: str) -> typing.Any:\n")
+        if type_modules:
+            lines.append("    if name in _TYPES:\n")
+            lines.append('        module = importlib.import_module(f"{__name__}.{_TYPES[name]}")\n')
+            # The type is cached in the module, so __getattr__ is only called once
+            lines.append("        value = globals()[name] = getattr(module, name)\n")
+            lines.append("        return value\n")
+        if module_list:
+            lines.append("    if name in _SUBMODULES:\n")
+            lines.append('        return importlib.import_module(f"{__name__}.{name}")\n')
+        lines.append('    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")\n')
+        lines.append("\n\n")
+        lines.append("def __dir__() -> typing.List[str]:\n")
+        lazy_names = ["set(globals())"]
+        if module_list:
+            lazy_names.append("_SUBMODULES")
+        if type_modules:
+            lazy_names.append("set(_TYPES)")
+        lines.append(f"    return sorted({' | '.join(lazy_names)})\n")
+    return "".join(lines)
+
+
+def _group_names(type_modules: typing.Mapping[str, str]) -> typing.Dict[str, typing.List[str]]:
+    """Get the names defined in each submodule, in order."""
+    groups = {}
+    for name, module in type_modules.items():
+        groups.setdefault(module, []).append(name)
+    return groups
+
+
+def type_module_header(
+    names: typing.Sequence[str],
+    has_enums: bool = False,
+    base_imports: typing.Sequence[str] = (),
+    light_enums: bool = False,
+) -> str:
+    """Create the imports and ``__all__`` of a private submodule with split types.
+
+    Parameters
+    ----------
+    names: list
+        Names of the classes and enums defined in the submodule.
+    has_enums: bool
+        Whether the submodule defines enums.
+    base_imports: list
+        Import statements of the base classes that are defined in other files.
+    light_enums: bool
+        Whether the enums derive from ``LightEnum`` instead of ``Enum``.
+
+    Returns
+    -------
+    str
+        The header of the submodule. See ``module_header``.
+    """
+    lines = ["from __future__ import annotations\n"]
+    if has_enums:
+        lines.append(LIGHT_ENUM_IMPORT if light_enums else "from enum import Enum\n")
+    lines.append("import typing\n\n")
+    if base_imports:
+        lines.extend(f"{line}\n" for line in base_imports)
+        lines.append("\n")
+    lines.append("if typing.TYPE_CHECKING:\n    import Ansys\n\n")
+    all_names = ", ".join(f'"{name}"' for name in names)
+    lines.append(f"__all__ = [{all_names}]\n\n\n")
+    return "".join(lines)
+
+
+def module_imports(module_list: typing.List[str], split_types: bool = False) -> str:
+    """Get the import statements needed by the lazy loader of a module.
+
+    Parameters
+    ----------
+    module_list: list
+        Names of the submodules of the module.
+    split_types: bool
+        Whether the types of the module are split into private submodules.
+
+    Returns
+    -------
+    str
+        ``import typing``, preceded by ``import importlib`` if the module has submodules
+        or split types.
+    """
+    if module_list or split_types:
+        return "import importlib\nimport typing\n\n"
+    return "import typing\n\n"
+
+
+def stub_imports(
+    import_str: str,
+    module_list: typing.List[str],
+    names: typing.Sequence[str] = (),
+    import_ansys: bool = False,
+) -> str:
+    """Create the submodule imports of a ``.pyi`` stub file.
+
+    Stub files are never executed, so the submodules are imported directly.
+
+    Parameters
+    ----------
+    import_str: str
+        Import path of the module. For example, ``ansys.mechanical.stubs.v261.Ansys.ACT``.
+    module_list: list
+        Names of the submodules of the module.
+    names: list
+        Names of the classes and enums defined in the module.
+    import_ansys: bool
+        Whether to also import ``Ansys`` for the type annotations of the module.
+
+    Returns
+    -------
+    str
+        The import statements and ``__all__`` of the stub file.
+    """
+    lines = []
+    if import_ansys:
+        lines.append("import Ansys\n")
+    for module in module_list:
+        lines.append(f"import {import_str}.{module} as {module}\n")
+    if lines:
+        lines.append("\n")
+    all_names = ", ".join(f'"{name}"' for name in [*names, *module_list])
+    lines.append(f"__all__ = [{all_names}]\n")
+    return "".join(lines)
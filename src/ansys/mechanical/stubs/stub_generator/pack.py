@@ -0,0 +1,149 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pack the runtime files of a version into a zip archive that is imported with zipimport."""
+
+import concurrent.futures
+import importlib.util
+import io
+import logging
+import marshal
+import pathlib
+import shutil
+import typing
+import zipfile
+
+from ansys.mechanical.stubs.stub_generator import instrumentation
+
+# Fixed time of the archive entries, so that the same files give the same archive
+_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Flags of the header of a .pyc file, see PEP 552
+_UNCHECKED_HASH = 0b01
+
+
+def compile_source(path: str, source: bytes) -> bytes:
+    """Get the bytecode of a source file, as it is stored next to it in an archive.
+
+    The bytecode is hash-based and its source isn't checked on import, since the
+    source and the bytecode are replaced together with the archive.
+
+    Parameters
+    ----------
+    path: str
+        The name of the source file, which is the file name of the code in
+        tracebacks. For example, ``v261.zip/v261/Ansys/__init__.py``. It mustn't
+        depend on where the archive is packed, so that the same files always give
+        the same archive.
+    source: bytes
+        The content of the source file.
+
+    Returns
+    -------
+    bytes
+        The content of the ``.pyc`` file.
+    """
+    code = compile(source, path, "exec", dont_inherit=True)
+    return b"".join(
+        [
+            importlib.util.MAGIC_NUMBER,
+            _UNCHECKED_HASH.to_bytes(4, "little"),
+            importlib.util.source_hash(source),
+            marshal.dumps(code),
+        ]
+    )
+
+
+def _compile_entry(entry: typing.Tuple[str, bytes]) -> bytes:
+    """Compile an archive entry in a worker process. See ``compile_source``."""
+    return compile_source(*entry)
+
+
+def pack_version(outdir: pathlib.Path, jobs: int = 1, remove: bool = True) -> pathlib.Path:
+    """Pack the runtime files of a version into a zip archive next to its directory.
+
+    The archive has the ``.py`` files of the version and their bytecode, under the
+    name of the version. ``ansys.mechanical.stubs`` adds the archives next to it to
+    its ``__path__``, so that zipimport imports the version from the archive under
+    the same module paths. Other Python versions than the one packing the archive
+    can't use its bytecode and compile the sources instead. The ``.pyi`` files are
+    left in the directory, since type checkers don't read archives.
+
+    Parameters
+    ----------
+    outdir: pathlib.Path
+        Path to the version. For example, ``src/ansys/mechanical/stubs/v261``.
+    jobs: int
+        Number of processes compiling the files.
+    remove: bool
+        Whether to remove the packed files and their bytecode from the directory. The
+        version is imported from the directory instead of the archive while it has
+        an ``__init__.py`` file.
+
+    Returns
+    -------
+    pathlib.Path
+        Path to the archive. For example, ``src/ansys/mechanical/stubs/v261.zip``.
+    """
+    outdir = pathlib.Path(outdir)
+    archive_path = outdir.with_suffix(".zip")
+    sources = sorted(outdir.rglob("*.py"))
+    if len(sources) == 0:
+        raise FileNotFoundError(f"No files to pack in {outdir}")
+    entries = [
+        (f"{outdir.name}/{source.relative_to(outdir).as_posix()}", source.read_bytes())
+        for source in sources
+    ]
+    # The archive is installed elsewhere, so the code is named relative to the archive
+    compile_entries = [(f"{archive_path.name}/{name}", source) for name, source in entries]
+
+    with instrumentation.stage("pack_compile"):
+        if jobs > 1:
+            with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+                bytecode = list(executor.map(_compile_entry, compile_entries, chunksize=8))
+        else:
+            bytecode = [compile_source(*entry) for entry in compile_entries]
+
+    with instrumentation.stage("pack_write"):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for (name, source), code in zip(entries, bytecode):
+                for entry_name, data in ((name, source), (f"{name}c", code)):
+                    info = zipfile.ZipInfo(entry_name, _DATE_TIME)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    archive.writestr(info, data)
+        contents = buffer.getvalue()
+        # Like the stub files, the archive keeps its modification time if it didn't change
+        if not archive_path.is_file() or archive_path.read_bytes() != contents:
+            archive_path.write_bytes(contents)
+        instrumentation.count("packed_files", len(entries))
+
+    if remove:
+        for source in sources:
+            source.unlink()
+        for cache_dir in sorted(outdir.rglob("__pycache__"), reverse=True):
+            shutil.rmtree(cache_dir)
+        for directory in sorted(outdir.rglob("*"), reverse=True):
+            if directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+    logging.info(f"Packed {len(entries)} files of {outdir} in {archive_path}")
+    return archive_path
@@ -0,0 +1,217 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Intermediate representation of the published types of an assembly.
+
+The types are extracted from an assembly with reflection, and the stubs are rendered
+from this representation. It can be saved to a JSON Lines snapshot file, so that the
+stubs can be rendered again without loading the assemblies.
+"""
+
+from dataclasses import asdict, dataclass, field
+import json
+import pathlib
+import typing
+
+from ansys.mechanical.stubs.stub_generator.xml_doc import DocMember
+
+SNAPSHOT_FORMAT = "pymechanical-stubs-snapshot"
+
+# Version of the snapshot files. Snapshots of another version can't be read.
+SNAPSHOT_VERSION = 2
+
+# Versions of the snapshot files that can be read. Version 1 snapshots have no base
+# types or declaring types, so their classes can only be written flattened.
+READABLE_SNAPSHOT_VERSIONS = (1, 2)
+
+
+@dataclass
+class Param:
+    """Param class."""
+
+    type: str
+    name: str
+
+
+@dataclass
+class Method:
+    """Method class."""
+
+    name: str
+    doc: typing.Optional[DocMember]
+    return_type: str
+    static: bool
+    args: typing.List[Param]
+    declaring_type: typing.Optional[str] = None
+    """Full name of the class or interface that declares the method."""
+
+
+@dataclass
+class Property:
+    """Property class."""
+
+    name: str
+    type: str
+    getter: bool
+    setter: bool
+    doc: typing.Optional[DocMember]
+    static: bool
+    value: typing.Optional[str]  # Python source of the value, may be used if static
+    declaring_type: typing.Optional[str] = None
+    """Full name of the class or interface that declares the property."""
+
+
+@dataclass
+class EnumField:
+    """Enum field class."""
+
+    name: str
+    value: int
+
+
+@dataclass
+class TypeInfo:
+    """Class or enum of a module."""
+
+    name: str
+    kind: str
+    """``"class"`` or ``"enum"``."""
+    doc: typing.Optional[DocMember]
+    properties: typing.List[Property] = field(default_factory=list)
+    methods: typing.List[Method] = field(default_factory=list)
+    fields: typing.List[EnumField] = field(default_factory=list)
+    bases: typing.List[str] = field(default_factory=list)
+    """Full names of the base class and of all the interfaces of a class."""
+
+
+@dataclass
+class ModuleInfo:
+    """Module of a namespace."""
+
+    namespace: str
+    has_doc: bool
+    """Whether the assembly has an XML doc file."""
+    types: typing.List[TypeInfo]
+
+
+@dataclass
+class Snapshot:
+    """Published types of an assembly."""
+
+    assembly: str
+    version: str
+    """The name of the version directory of the stubs. For example, ``v261``."""
+    modules: typing.List[ModuleInfo]
+
+
+def _doc_from_dict(data: typing.Optional[dict]) -> typing.Optional[DocMember]:
+    if data is None:
+        return None
+    params = tuple(tuple(param) for param in data["params"])
+    return DocMember(data["name"], data["summary"], params, data["remarks"], data["example"])
+
+
+def _type_from_dict(data: dict) -> TypeInfo:
+    properties = [
+        Property(**{**prop, "doc": _doc_from_dict(prop["doc"])}) for prop in data["properties"]
+    ]
+    methods = [
+        Method(
+            **{
+                **method,
+                "doc": _doc_from_dict(method["doc"]),
+                "args": [Param(**arg) for arg in method["args"]],
+            }
+        )
+        for method in data["methods"]
+    ]
+    return TypeInfo(
+        name=data["name"],
+        kind=data["kind"],
+        doc=_doc_from_dict(data["doc"]),
+        properties=properties,
+        methods=methods,
+        fields=[EnumField(**enum_field) for enum_field in data["fields"]],
+        bases=data.get("bases", []),
+    )
+
+
+def write_snapshot(path: str, snapshot: Snapshot) -> None:
+    """Write a snapshot to a JSON Lines file.
+
+    The first line is a header with the format, version, and assembly. Each of the
+    other lines is a module.
+
+    Parameters
+    ----------
+    path: str
+        The path of the snapshot file
+    snapshot: Snapshot
+        The published types of an assembly
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "format_version": SNAPSHOT_VERSION,
+        "assembly": snapshot.assembly,
+        "version": snapshot.version,
+    }
+    with path.open("w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for module in snapshot.modules:
+            f.write(json.dumps(asdict(module), ensure_ascii=False) + "\n")
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """Read a snapshot from a JSON Lines file.
+
+    Parameters
+    ----------
+    path: str
+        The path of the snapshot file
+
+    Returns
+    -------
+    Snapshot
+        The published types of an assembly
+    """
+    with pathlib.Path(path).open("r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a snapshot file")
+        if header.get("format_version") not in READABLE_SNAPSHOT_VERSIONS:
+            raise ValueError(
+                f"{path} has snapshot version {header.get('format_version')}, "
+                f"expected one of {READABLE_SNAPSHOT_VERSIONS}"
+            )
+        modules = []
+        for line in f:
+            data = json.loads(line)
+            modules.append(
+                ModuleInfo(
+                    namespace=data["namespace"],
+                    has_doc=data["has_doc"],
+                    types=[_type_from_dict(type_data) for type_data in data["types"]],
+                )
+            )
+    return Snapshot(header["assembly"], header["version"], modules)
@@ -0,0 +1,175 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Write the files of a stub tree, skipping the files whose content didn't change."""
+
+import hashlib
+import json
+import logging
+import pathlib
+import typing
+
+from ansys.mechanical.stubs.stub_generator import instrumentation
+
+MANIFEST_NAME = ".stub_manifest.json"
+
+
+class StubWriter:
+    """Write the files of a stub tree, skipping the files whose content didn't change.
+
+    Files are kept in memory until ``flush`` is called, so that they can be edited
+    after they are rendered. A manifest in the root directory records the SHA-256
+    hash, size, and modification time of each file that was written. On ``flush``, a
+    file is only written if its hash differs from the manifest or if it was changed
+    or removed since, so an unchanged file keeps its modification time. The files of
+    the manifest that weren't set since the writer was created are no longer
+    generated, so they are removed, with the directories they leave empty.
+
+    Parameters
+    ----------
+    root: str
+        The root directory of the stub tree. For example, ``src/ansys/mechanical/stubs/v261``.
+    """
+
+    def __init__(self, root: str):
+        self.root = pathlib.Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+        self._manifest: typing.Dict[str, typing.Dict] = {}
+        if self.manifest_path.is_file():
+            try:
+                self._manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            except ValueError:
+                logging.warning(f"Ignoring invalid manifest {self.manifest_path}")
+        self._pending: typing.Dict[pathlib.Path, str] = {}
+        # The manifest keys of the files set since the writer was created
+        self._current: typing.Set[str] = set()
+        self.written = 0
+        self.skipped = 0
+        self.removed = 0
+
+    def write_text(self, path: str, text: str) -> None:
+        """Set the content of a file.
+
+        Parameters
+        ----------
+        path: str
+            The path of the file, in the root directory
+        text: str
+            The content of the file
+        """
+        path = pathlib.Path(path)
+        self._pending[path] = text
+        self._current.add(self._key(path))
+
+    def read_text(self, path: str) -> str:
+        """Get the content of a file set in this run, or ``""`` if it wasn't set.
+
+        Parameters
+        ----------
+        path: str
+            The path of the file, in the root directory
+        """
+        return self._pending.get(pathlib.Path(path), "")
+
+    def _key(self, path: pathlib.Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def _is_unchanged(self, path: pathlib.Path, digest: str) -> bool:
+        """Check if a file has the given hash, using the manifest to avoid reading it."""
+        entry = self._manifest.get(self._key(path))
+        if entry is None or entry["sha256"] != digest:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def flush(self) -> None:
+        """Write the files whose content changed, remove the stale files, and the manifest."""
+        with instrumentation.stage("file_io"):
+            self._flush()
+
+    def _flush(self) -> None:
+        for path, text in sorted(self._pending.items()):
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            if self._is_unchanged(path, digest):
+                self.skipped += 1
+                instrumentation.count("files_skipped")
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("w", encoding="utf-8") as f:
+                f.write(text)
+            stat = path.stat()
+            self._manifest[self._key(path)] = {
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            self.written += 1
+            instrumentation.count("files_written")
+            instrumentation.count("bytes_written", stat.st_size)
+        self._pending.clear()
+        self._remove_stale_files()
+
+        manifest = json.dumps(self._manifest, indent=1, sort_keys=True)
+        if not self.manifest_path.is_file() or self.manifest_path.read_text("utf-8") != manifest:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self.manifest_path.write_text(manifest, encoding="utf-8")
+        logging.info(
+            f"Wrote {self.written} files, skipped {self.skipped} unchanged files, "
+            f"removed {self.removed} stale files"
+        )
+
+    def _remove_stale_files(self) -> None:
+        """Remove the files of the manifest that weren't set in this run."""
+        for key in sorted(set(self._manifest) - self._current):
+            path = self.root / key
+            path.unlink(missing_ok=True)
+            del self._manifest[key]
+            self.removed += 1
+            instrumentation.count("files_removed")
+            directory = path.parent
+            while directory != self.root and directory.is_dir() and not any(directory.iterdir()):
+                directory.rmdir()
+                directory = directory.parent
+
+
+def write_file(path: str, text: str, writer: typing.Optional[StubWriter] = None) -> None:
+    """Write a file with a writer, or directly if the writer is ``None``.
+
+    Parameters
+    ----------
+    path: str
+        The path of the file
+    text: str
+        The content of the file
+    writer: typing.Optional[StubWriter]
+        The writer of the stub tree
+    """
+    if writer is not None:
+        writer.write_text(path, text)
+        return
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(text)
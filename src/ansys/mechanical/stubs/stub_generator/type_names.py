@@ -0,0 +1,289 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Parse reflected .NET type names and render them for stubs and XML doc keys."""
+
+from dataclasses import dataclass
+import functools
+import typing
+
+C_TO_PYTHON = {
+    "IronPython.Runtime.PythonTuple": "tuple",
+    "System.Array": "typing.List",
+    "System.Boolean": "bool",
+    "System.Collections.Generic.IDictionary": "dict",
+    "System.Collections.Generic.IEnumerable": "typing.Iterable",
+    "System.Collections.Generic.IEnumerator": "typing.Iterator",
+    "System.Collections.Generic.IList": "list",
+    "System.Collections.Generic.IReadOnlyDictionary": "dict",
+    "System.Collections.Generic.IReadOnlyList": "tuple",
+    "System.Collections.Generic.KeyValuePair": "dict",
+    "System.Collections.Generic.List": "typing.List",
+    "System.Collections.ICollection": "typing.Collection",
+    "System.Collections.IEnumerable": "typing.Iterable",
+    "System.Collections.IEnumerator": "typing.Iterator",
+    "System.DateTime": "typing.Any",
+    "System.Double": "float",
+    "System.Int32": "int",
+    "System.IFormatProvider": "typing.Any",
+    "System.MidpointRounding": "typing.Optional[float]",
+    "System.Object": "typing.Any",
+    "System.String": "str",
+    "System.Tuple": "tuple",
+    "System.Type": "type",
+    "System.UInt32": "int",
+    "System.Void": "None",
+}
+
+EXCLUDED_TYPES_LIST = [
+    "System.IAsyncResult",
+    "System.IDisposable",
+    "System.Func",
+    "System.Delegate",
+]
+
+EXCLUDED_TYPES = frozenset(EXCLUDED_TYPES_LIST)
+
+# Characters that end a name in a reflected type name
+DELIMITERS = frozenset("[],&+`")
+
+
+@dataclass(frozen=True)
+class TypeName:
+    """Parsed .NET type name.
+
+    Nodes are immutable and interned, so equal type names share one instance and
+    the renderings of a node are cached.
+    """
+
+    parts: typing.Tuple[typing.Tuple[str, int], ...]
+    """Names separated by ``+`` for nested types, with their generic arity."""
+    args: typing.Tuple["TypeName", ...] = ()
+    """Generic type arguments."""
+    array_ranks: typing.Tuple[int, ...] = ()
+    """Rank of each array suffix. For example, ``(1,)`` for ``System.Double[]``."""
+    byref: bool = False
+    """Whether the type is passed by reference (``&``)."""
+
+    @property
+    def name(self) -> str:
+        """The name with nested types separated by ``.`` and without generic arity."""
+        return ".".join(part for part, _ in self.parts)
+
+
+_INTERNED: typing.Dict[TypeName, TypeName] = {}
+
+
+def _intern(node: TypeName) -> TypeName:
+    """Get the shared instance of a node."""
+    return _INTERNED.setdefault(node, node)
+
+
+class _Parser:
+    """Recursive descent parser for the names returned by ``System.Type.ToString()``."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+
+    def peek(self) -> str:
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def parse_type(self) -> TypeName:
+        parts = [self.parse_part()]
+        while self.peek() == "+":
+            self.pos += 1
+            parts.append(self.parse_part())
+
+        args = ()
+        array_ranks = []
+        while self.peek() == "[":
+            self.pos += 1
+            if self.peek() in ("]", ","):
+                rank = 1
+                while self.peek() == ",":
+                    rank += 1
+                    self.pos += 1
+                array_ranks.append(rank)
+            else:
+                args = self.parse_args()
+            self.expect("]")
+
+        byref = self.peek() == "&"
+        if byref:
+            self.pos += 1
+        return _intern(TypeName(tuple(parts), args, tuple(array_ranks), byref))
+
+    def parse_part(self) -> typing.Tuple[str, int]:
+        start = self.pos
+        while self.pos < len(self.text) and self.text[self.pos] not in DELIMITERS:
+            self.pos += 1
+        name = self.text[start : self.pos].strip()
+        arity = 0
+        if self.peek() == "`":
+            self.pos += 1
+            start = self.pos
+            while self.peek().isdigit():
+                self.pos += 1
+            arity = int(self.text[start : self.pos] or 0)
+        return name, arity
+
+    def parse_args(self) -> typing.Tuple[TypeName, ...]:
+        args = [self.parse_type()]
+        while self.peek() == ",":
+            self.pos += 1
+            args.append(self.parse_type())
+        return tuple(args)
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at {self.pos} in {self.text!r}")
+        self.pos += 1
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_type_name(type_str: str) -> TypeName:
+    """Parse a reflected .NET type name.
+
+    The name may have generic arity (``IList`1``), generic arguments (``[...]``),
+    nested types (``+``), array suffixes (``[]``, ``[,]``), and a byref suffix (``&``).
+    Quotes around the name are ignored.
+
+    Parameters
+    ----------
+    type_str: str
+        A type name as returned by ``System.Type.ToString()``.
+
+    Returns
+    -------
+    TypeName
+        The interned node of the type name. A name that can't be parsed is kept
+        as a single name.
+    """
+    text = type_str.replace('"', "")
+    parser = _Parser(text)
+    try:
+        node = parser.parse_type()
+        if parser.pos == len(text):
+            return node
+    except ValueError:
+        pass
+    return _intern(TypeName(((text, 0),)))
+
+
+@functools.lru_cache(maxsize=8192)
+def display_name(node: TypeName) -> str:
+    """Render a type name without generic arity, arrays, or byref suffixes.
+
+    For example, ``System.Collections.Generic.IList`1[Ansys.A+B]&`` is rendered as
+    ``System.Collections.Generic.IList[Ansys.A.B]``.
+    """
+    if not node.args:
+        return node.name
+    return f"{node.name}[{','.join(display_name(arg) for arg in node.args)}]"
+
+
+def _contains_excluded(node: TypeName) -> bool:
+    return node.name in EXCLUDED_TYPES or any(_contains_excluded(arg) for arg in node.args)
+
+
+def _mapped_name(node: TypeName) -> str:
+    """Render a type name with the C# types replaced and no quotes."""
+    name = C_TO_PYTHON.get(node.name, node.name)
+    if not node.args:
+        return name
+    return f"{name}[{','.join(_mapped_name(arg) for arg in node.args)}]"
+
+
+def _annotation(node: TypeName) -> str:
+    name = node.name
+    if name in C_TO_PYTHON:
+        name = C_TO_PYTHON[name]
+    elif name.startswith("Ansys") or name == "ChildrenType":
+        # Wrap Ansys types in quotes. A generic Ansys type is quoted along with
+        # its type arguments.
+        return f'"{_mapped_name(node)}"'
+    if not node.args:
+        return name
+    return f"{name}[{','.join(_annotation(arg) for arg in node.args)}]"
+
+
+@functools.lru_cache(maxsize=8192)
+def python_annotation(node: TypeName) -> str:
+    """Render a type name as a Python annotation.
+
+    C# types found in ``C_TO_PYTHON`` are replaced and Ansys types are quoted as
+    forward references. A type that uses an excluded type, such as ``System.Func``,
+    is quoted as a whole.
+    """
+    if _contains_excluded(node):
+        return f'"{_mapped_name(node)}"'
+    return _annotation(node)
+
+
+@functools.lru_cache(maxsize=8192)
+def doc_id(
+    node: TypeName,
+    method_generics: typing.Tuple[str, ...] = (),
+    type_generics: typing.Tuple[str, ...] = (),
+) -> str:
+    """Render a parameter type as it appears in the member names of XML doc files.
+
+    Generic arguments are written in braces, nested types are separated by ``.``,
+    and generic parameters are written by position, ``0`` for a type
+    parameter of the method and ```0`` for a type parameter of the declaring type.
+    For example, ``System.Collections.Generic.IList`1[ChildrenType]`` is
+    ``System.Collections.Generic.IList{``0}`` for ``GetChildren<ChildrenType>``.
+
+    Parameters
+    ----------
+    node: TypeName
+        The parameter type.
+    method_generics: typing.Tuple[str, ...]
+        Names of the generic parameters of the method.
+    type_generics: typing.Tuple[str, ...]
+        Names of the generic parameters of the declaring type.
+    """
+    name = node.name
+    if len(node.parts) == 1 and not node.args:
+        if name in method_generics:
+            name = f"``{method_generics.index(name)}"
+        elif name in type_generics:
+            name = f"`{type_generics.index(name)}"
+    if node.args:
+        args = ",".join(doc_id(arg, method_generics, type_generics) for arg in node.args)
+        name = f"{name}{{{args}}}"
+    for rank in node.array_ranks:
+        name += "[]" if rank == 1 else f"[{','.join(['0:'] * rank)}]"
+    if node.byref:
+        name += "@"
+    return name
+
+
+@functools.lru_cache(maxsize=8192)
+def type_doc_id(node: TypeName) -> str:
+    """Render a type definition as it appears in the member names of XML doc files.
+
+    Nested types are separated by ``.`` and generic types keep their arity. For
+    example, ``Ansys.A`1+B[System.Int32]`` is ``Ansys.A`1.B``.
+    """
+    return ".".join(f"{part}`{arity}" if arity else part for part, arity in node.parts)
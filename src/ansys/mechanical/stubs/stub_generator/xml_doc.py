@@ -0,0 +1,345 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Load the members of the XML doc files of the assemblies."""
+
+import collections.abc
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import pathlib
+import sqlite3
+import typing
+import xml.etree.ElementTree as ElementTree
+
+
+def flatten_element(element: ElementTree.Element) -> str:
+    """Flatten XML content to plain text while preserving tagged text.
+
+    This includes text nested in inline tags such as ``<c>`` and resolves
+    ``<paramref name=.../>`` to the parameter name.
+    """
+    parts = []
+    if element.text:
+        parts.append(element.text)
+
+    for child in element:
+        if child.tag.endswith("paramref"):
+            param_name = child.attrib.get("name")
+            if param_name:
+                parts.append(param_name)
+        else:
+            parts.append(flatten_element(child))
+
+        if child.tail:
+            parts.append(child.tail)
+
+    return "".join(parts)
+
+
+def _flatten_child(element: ElementTree.Element, tag: str) -> typing.Optional[str]:
+    """Flatten the first child element with the given tag, if any."""
+    child = element.find(tag)
+    if child is None:
+        return None
+    return flatten_element(child)
+
+
+@dataclass(frozen=True, slots=True)
+class DocMember:
+    """Docstring member.
+
+    The text of the member is extracted once when the doc file is loaded, so the
+    XML element isn't kept.
+    """
+
+    name: str
+    """The name of the member. For example, ``T:Ansys.Core.Units.Quantity``."""
+    summary: typing.Optional[str] = None
+    """The summary, including the text of inline tags."""
+    params: typing.Tuple[typing.Tuple[str, str], ...] = ()
+    """The name and description of each parameter."""
+    remarks: typing.Optional[str] = None
+    """The remarks."""
+    example: typing.Optional[str] = None
+    """The example."""
+
+    @classmethod
+    def from_element(cls, element: ElementTree.Element) -> "DocMember":
+        """Extract a doc member from a ``<member>`` element."""
+        return cls(
+            name=element.attrib["name"],
+            summary=_flatten_child(element, "summary"),
+            params=tuple(
+                (param.attrib.get("name", ""), flatten_element(param))
+                for param in element.iterfind("param")
+            ),
+            remarks=_flatten_child(element, "remarks"),
+            example=_flatten_child(element, "example"),
+        )
+
+
+def doc_key_filter(
+    namespaces: typing.Iterable[str] = (), keys: typing.Iterable[str] = ()
+) -> typing.Callable[[str], bool]:
+    """Get a filter for the names of the doc members that are loaded.
+
+    Parameters
+    ----------
+    namespaces: typing.Iterable[str]
+        Namespaces or types whose members are kept. For example, ``Ansys.Core.Units``
+        keeps ``T:Ansys.Core.Units.Quantity`` and ``M:Ansys.Core.Units.Quantity.Abs``.
+    keys: typing.Iterable[str]
+        Names of doc members that are kept. For example, ``T:Ansys.Core.Units.Quantity``.
+
+    Returns
+    -------
+    typing.Callable[[str], bool]
+        Whether or not a doc member is kept, given its name
+    """
+    namespaces = frozenset(namespaces)
+    prefixes = tuple(f"{namespace}." for namespace in namespaces)
+    keys = frozenset(keys)
+
+    def key_filter(name: str) -> bool:
+        if name in keys:
+            return True
+        qualified_name = name.partition(":")[2]
+        return qualified_name in namespaces or qualified_name.startswith(prefixes)
+
+    return key_filter
+
+
+def load_doc(
+    xml_path: str, key_filter: typing.Callable[[str], bool] = None
+) -> typing.Dict[str, DocMember]:
+    """Get a dictionary of doc entities from the Assembly documentation file.
+
+    The file is parsed incrementally and each member is cleared as soon as it is
+    read, so only the text of the kept members stays in memory.
+
+    Parameters
+    ----------
+    xml_path: str
+        The path to the XML file
+    key_filter: typing.Callable[[str], bool] = None
+        Whether or not to keep a member, given its name. For example,
+        ``M:Ansys.ACT.Automation.Mechanical.VirtualCell.GetChildren``1(...)``.
+        All members are kept if it is ``None``.
+
+    Returns
+    -------
+    typing.Dict[str, DocMember]
+        The doc members by name
+    """
+    output = {}
+    for _, element in ElementTree.iterparse(xml_path):
+        if element.tag != "member":
+            continue
+        name = element.attrib.get("name")
+        if name is not None and (key_filter is None or key_filter(name)):
+            output[name] = DocMember.from_element(element)
+        # Only an empty element is left in the tree
+        element.clear()
+    return output
+
+
+# Version of the tables of the doc cache. The cache is rebuilt when it changes.
+SCHEMA_VERSION = 2
+
+
+class CachedDoc(collections.abc.Mapping):
+    """Read-only mapping of the doc members of an XML doc file in a ``DocCache``."""
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        digest: str,
+        key_filter: typing.Callable[[str], bool] = None,
+    ):
+        self._connection = connection
+        self._digest = digest
+        self._key_filter = key_filter
+        # Members inherited from interfaces are looked up once for each implementing class
+        self._members: typing.Dict[str, typing.Optional[DocMember]] = {}
+
+    def __getitem__(self, name: str) -> DocMember:
+        """Get a doc member by name."""
+        if name in self._members:
+            member = self._members[name]
+        else:
+            member = self._members[name] = self._read(name)
+        if member is None:
+            raise KeyError(name)
+        return member
+
+    def _read(self, name: str) -> typing.Optional[DocMember]:
+        """Read a doc member from the cache."""
+        if self._key_filter is not None and not self._key_filter(name):
+            return None
+        row = self._connection.execute(
+            "SELECT summary, params, remarks, example FROM members WHERE digest = ? AND name = ?",
+            (self._digest, name),
+        ).fetchone()
+        if row is None:
+            return None
+        summary, params, remarks, example = row
+        params = tuple(tuple(param) for param in json.loads(params))
+        return DocMember(name, summary, params, remarks, example)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """Iterate over the names of the doc members."""
+        rows = self._connection.execute(
+            "SELECT name FROM members WHERE digest = ? ORDER BY name", (self._digest,)
+        )
+        for (name,) in rows:
+            if self._key_filter is None or self._key_filter(name):
+                yield name
+
+    def __len__(self) -> int:
+        """Get the number of doc members."""
+        return sum(1 for _ in self)
+
+
+class DocCache:
+    """Persistent index of the members of XML doc files.
+
+    The members of each XML doc file are stored in a SQLite database in the cache
+    directory, keyed by the SHA-256 hash of the file. A file whose path, size, and
+    modification time are unchanged since the last run is not read again, and its
+    members are looked up by name instead of parsing the file.
+
+    Parameters
+    ----------
+    cache_dir: str
+        The directory of the cache database. It is created if it doesn't exist.
+    """
+
+    def __init__(self, cache_dir: str):
+        cache_dir = pathlib.Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(cache_dir / "doc_cache.sqlite3"), timeout=60)
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._connection.executescript(
+                f"""
+                DROP TABLE IF EXISTS sources;
+                DROP TABLE IF EXISTS documents;
+                DROP TABLE IF EXISTS members;
+                CREATE TABLE sources (
+                    path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest TEXT
+                );
+                CREATE TABLE documents (digest TEXT PRIMARY KEY);
+                CREATE TABLE members (
+                    digest TEXT,
+                    name TEXT,
+                    summary TEXT,
+                    params TEXT,
+                    remarks TEXT,
+                    example TEXT,
+                    PRIMARY KEY (digest, name)
+                ) WITHOUT ROWID;
+                PRAGMA user_version = {SCHEMA_VERSION};
+                """
+            )
+
+    def load(self, xml_path: str, key_filter: typing.Callable[[str], bool] = None) -> CachedDoc:
+        """Get the doc members of an XML doc file, indexing the file if it changed.
+
+        Parameters
+        ----------
+        xml_path: str
+            The path to the XML file
+        key_filter: typing.Callable[[str], bool] = None
+            Whether or not to look up a member, given its name. See ``doc_key_filter``.
+            All the members are stored in the cache, so that the cache can be reused
+            with other filters.
+
+        Returns
+        -------
+        CachedDoc
+            The doc members by name
+        """
+        digest = self._get_digest(xml_path)
+        indexed = self._connection.execute(
+            "SELECT 1 FROM documents WHERE digest = ?", (digest,)
+        ).fetchone()
+        if indexed is None:
+            logging.info(f"Indexing xml doc {xml_path} in the doc cache")
+            self._index(xml_path, digest)
+        else:
+            logging.info(f"Using the doc cache for {xml_path}")
+        return CachedDoc(self._connection, digest, key_filter)
+
+    def _get_digest(self, xml_path: str) -> str:
+        """Get the hash of a file, only reading the file if its size or mtime changed."""
+        path = pathlib.Path(xml_path).resolve()
+        stat = path.stat()
+        row = self._connection.execute(
+            "SELECT size, mtime_ns, digest FROM sources WHERE path = ?", (str(path),)
+        ).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+
+        sha256 = hashlib.sha256()
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)",
+                (str(path), stat.st_size, stat.st_mtime_ns, digest),
+            )
+            # Drop the members of files that are no longer referenced
+            for table in ("documents", "members"):
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE digest NOT IN (SELECT digest FROM sources)"
+                )
+        return digest
+
+    def _index(self, xml_path: str, digest: str) -> None:
+        """Store all the members of a file."""
+
+        def iter_members():
+            for _, element in ElementTree.iterparse(xml_path):
+                if element.tag != "member":
+                    continue
+                if element.attrib.get("name") is not None:
+                    member = DocMember.from_element(element)
+                    yield (
+                        digest,
+                        member.name,
+                        member.summary,
+                        json.dumps(member.params),
+                        member.remarks,
+                        member.example,
+                    )
+                element.clear()
+
+        with self._connection:
+            self._connection.execute("DELETE FROM members WHERE digest = ?", (digest,))
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?, ?)", iter_members()
+            )
+            self._connection.execute("INSERT INTO documents VALUES (?)", (digest,))
@@ -0,0 +1,43 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Options of the stubs_generator tests."""
+
+# Numbers of types of the synthetic assemblies of the benchmarks
+DEFAULT_GENERATOR_SIZES = "100,1000"
+
+
+def pytest_addoption(parser):
+    """Add the sizes of the synthetic assemblies of the benchmarks."""
+    parser.addoption(
+        "--generator-sizes",
+        default=DEFAULT_GENERATOR_SIZES,
+        help="Comma-separated numbers of types of the benchmarked synthetic assemblies, "
+        "for example 100,1000,10000,50000.",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the benchmarks with the sizes of the synthetic assemblies."""
+    if "num_types" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--generator-sizes")
+        metafunc.parametrize("num_types", [int(size) for size in sizes.split(",")], scope="module")
@@ -0,0 +1,310 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pure-Python stand-in for the .NET reflection surface used by stubs_generator.
+
+The generator reads assemblies through pythonnet. The classes in this module have the
+same attributes and methods as the reflected .NET objects that the generator uses, so
+that it can run without a Mechanical install. ``make_assembly`` builds a synthetic
+assembly of any size and ``write_doc`` writes its XML doc file.
+"""
+
+import pathlib
+import typing
+from xml.sax.saxutils import escape
+
+from ansys.mechanical.stubs.stub_generator.type_names import doc_id, parse_type_name
+
+
+class FakeType:
+    """Stand-in for ``System.Type``."""
+
+    def __init__(
+        self,
+        full_name: str,
+        kind: str = "class",
+        interfaces: typing.Sequence["FakeType"] = (),
+    ):
+        self.FullName = full_name
+        self.AssemblyQualifiedName = f"{full_name}, Fake.Assembly"
+        self.Namespace, _, self.Name = full_name.rpartition(".")
+        self.IsInterface = kind == "interface"
+        self.IsEnum = kind == "enum"
+        self.IsClass = kind == "class"
+        self.IsAnsiClass = kind == "class"
+        self.IsGenericType = False
+        self.IsGenericParameter = False
+        self.BaseType = None
+        self.properties = []
+        self.methods = []
+        self.constructors = []
+        self.interfaces = list(interfaces)
+        self.fields = []
+
+    def ToString(self):
+        return self.FullName
+
+    def GetProperties(self):
+        return self.properties
+
+    def GetMethods(self):
+        return self.methods
+
+    def GetConstructors(self):
+        return self.constructors
+
+    def GetInterfaces(self):
+        return self.interfaces
+
+    def GetFields(self):
+        return self.fields
+
+    def GetGenericArguments(self):
+        return []
+
+
+class FakeAccessor:
+    """Stand-in for the ``System.Reflection.MethodInfo`` of a property accessor."""
+
+    def __init__(self, is_static: bool = False):
+        self.IsPublic = True
+        self.IsStatic = is_static
+
+
+class FakeProperty:
+    """Stand-in for ``System.Reflection.PropertyInfo``."""
+
+    def __init__(
+        self,
+        name: str,
+        property_type: FakeType,
+        declaring_type: FakeType,
+        setter: bool = False,
+        value: typing.Any = None,
+    ):
+        self.Name = name
+        self.PropertyType = property_type
+        self.DeclaringType = declaring_type
+        self.GetMethod = FakeAccessor(value is not None)
+        self.SetMethod = FakeAccessor() if setter else None
+        self.value = value
+
+    def GetValue(self, obj, index):
+        return self.value
+
+    def GetIndexParameters(self):
+        return []
+
+
+class FakeParameter:
+    """Stand-in for ``System.Reflection.ParameterInfo``."""
+
+    def __init__(self, name: str, parameter_type: FakeType):
+        self.Name = name
+        self.ParameterType = parameter_type
+
+
+class FakeMethod:
+    """Stand-in for ``System.Reflection.MethodInfo`` and ``ConstructorInfo``."""
+
+    def __init__(
+        self,
+        name: str,
+        return_type: FakeType,
+        declaring_type: FakeType,
+        parameters: typing.Sequence[FakeParameter] = (),
+        is_static: bool = False,
+    ):
+        self.Name = name
+        self.ReturnType = return_type
+        self.DeclaringType = declaring_type
+        self.parameters = list(parameters)
+        self.IsStatic = is_static
+        self.IsGenericMethod = False
+
+    def GetParameters(self):
+        return self.parameters
+
+    def GetGenericArguments(self):
+        return []
+
+
+class FakeField:
+    """Stand-in for the ``System.Reflection.FieldInfo`` of an enum value."""
+
+    def __init__(self, name: str, value: int):
+        self.Name = name
+        self.IsLiteral = True
+        self.value = value
+
+    def GetRawConstantValue(self):
+        return self.value
+
+
+class FakeAssembly:
+    """Stand-in for ``System.Reflection.RuntimeAssembly``."""
+
+    def __init__(self, types: typing.List[FakeType]):
+        self.types = types
+
+    def GetTypes(self):
+        return self.types
+
+
+# Property and parameter types, as they are returned by System.Type.ToString()
+VALUE_TYPES = [
+    FakeType(name)
+    for name in [
+        "System.String",
+        "System.Double",
+        "System.Int32",
+        "System.Boolean",
+        "Ansys.Core.Units.Quantity",
+        "System.Collections.Generic.IList`1[Ansys.ACT.Automation.Mechanical.Body]",
+        "System.Collections.Generic.IEnumerable`1[System.Collections.Generic.KeyValuePair`2"
+        "[System.String,Ansys.Core.Units.Quantity]]",
+    ]
+]
+VOID = FakeType("System.Void")
+
+TYPES_PER_NAMESPACE = 100
+PROPERTIES_PER_TYPE = 6
+METHODS_PER_TYPE = 4
+FIELDS_PER_ENUM = 8
+
+
+def make_assembly(num_types: int) -> FakeAssembly:
+    """Build a synthetic assembly.
+
+    The types are split in namespaces of ``TYPES_PER_NAMESPACE`` types. One type in
+    ten is an enum and one in five is an interface, and every interface inherits a
+    shared base interface. The assembly is the same for the same number of types.
+
+    Parameters
+    ----------
+    num_types: int
+        The number of types of the assembly, including the base interface.
+
+    Returns
+    -------
+    FakeAssembly
+        The assembly
+    """
+    base = FakeType("Ansys.Fake.Interfaces.IDataModelObject", "interface")
+    base.properties = [
+        FakeProperty("Name", VALUE_TYPES[0], base, setter=True),
+        FakeProperty("ObjectId", VALUE_TYPES[2], base),
+    ]
+    base.methods = [FakeMethod("Delete", VOID, base)]
+    types = [base]
+    for index in range(1, num_types):
+        namespace = f"Ansys.Fake.Namespace{index // TYPES_PER_NAMESPACE}"
+        if index % 10 == 0:
+            enum_type = FakeType(f"{namespace}.State{index}", "enum")
+            enum_type.fields = [
+                FakeField(f"Value{value}", value) for value in range(FIELDS_PER_ENUM)
+            ]
+            types.append(enum_type)
+            continue
+
+        if index % 5 == 0:
+            mod_type = FakeType(f"{namespace}.IObject{index}", "interface", [base])
+        else:
+            mod_type = FakeType(f"{namespace}.Object{index}")
+            mod_type.constructors = [
+                FakeMethod(".ctor", VOID, mod_type),
+                FakeMethod(".ctor", VOID, mod_type, [FakeParameter("name", VALUE_TYPES[0])]),
+            ]
+        mod_type.properties = [
+            FakeProperty(
+                f"Property{number}",
+                VALUE_TYPES[(index + number) % len(VALUE_TYPES)],
+                mod_type,
+                setter=number % 2 == 0,
+                value=number if number == 0 and not mod_type.IsInterface else None,
+            )
+            for number in range(PROPERTIES_PER_TYPE)
+        ]
+        mod_type.methods = [
+            FakeMethod(
+                f"Method{number}",
+                VALUE_TYPES[(index + number) % len(VALUE_TYPES)] if number % 2 else VOID,
+                mod_type,
+                [
+                    FakeParameter(f"arg{arg}", VALUE_TYPES[(index + arg) % len(VALUE_TYPES)])
+                    for arg in range(number)
+                ],
+            )
+            for number in range(METHODS_PER_TYPE)
+        ]
+        types.append(mod_type)
+    return FakeAssembly(types)
+
+
+def get_namespaces(assembly: FakeAssembly) -> typing.Dict[str, typing.List[FakeType]]:
+    """Get the types of an assembly by namespace, like ``generate_content.iter_module``."""
+    namespaces = {}
+    for mod_type in assembly.GetTypes():
+        namespaces.setdefault(mod_type.Namespace, []).append(mod_type)
+    return namespaces
+
+
+def write_doc(assembly: FakeAssembly, path: pathlib.Path) -> pathlib.Path:
+    """Write the XML doc file of a synthetic assembly.
+
+    Every type and member is documented, so that doc lookups hit.
+
+    Parameters
+    ----------
+    assembly: FakeAssembly
+        The assembly
+    path: pathlib.Path
+        The path of the XML doc file
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the XML doc file
+    """
+    with path.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0"?>\n<doc>\n<assembly><name>Fake</name></assembly>\n<members>\n')
+
+        def write_member(name, summary, params=()):
+            f.write(f'<member name="{escape(name)}">\n<summary>{escape(summary)}</summary>\n')
+            for param in params:
+                f.write(f'<param name="{param.Name}">The {param.Name} argument.</param>\n')
+            f.write("</member>\n")
+
+        for mod_type in assembly.GetTypes():
+            name = mod_type.FullName
+            write_member(f"T:{name}", f"The {mod_type.Name} type.")
+            for prop in mod_type.GetProperties():
+                write_member(f"P:{name}.{prop.Name}", f"Gets the {prop.Name} of the object.")
+            for method in [*mod_type.GetConstructors(), *mod_type.GetMethods()]:
+                method_name = "#ctor" if method.Name == ".ctor" else method.Name
+                key = f"M:{name}.{method_name}"
+                params = method.GetParameters()
+                if params:
+                    key += f"({','.join(doc_id(parse_type_name(param.ParameterType.ToString())) for param in params)})"
+                write_member(key, f"Calls {method.Name}.", params)
+        f.write("</members>\n</doc>\n")
+    return path
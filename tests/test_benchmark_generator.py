@@ -0,0 +1,153 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the stages of stubs_generator on synthetic assemblies.
+
+The assemblies are built with the reflection stand-in of ``fake_reflection``, so the
+benchmarks run without a Mechanical install. Their sizes are set with
+``--generator-sizes``. For example, to run the benchmarks from 100 to 50,000 types::
+
+    pytest tests/test_benchmark_generator.py --generator-sizes 100,1000,10000,50000
+
+The peak memory of each stage is stored in the ``extra_info`` of its benchmark.
+"""
+
+import tracemalloc
+
+from fake_reflection import get_namespaces, make_assembly, write_doc
+import pytest
+from test_c_types_to_python import TYPE_STRINGS, legacy_c_types_to_python
+
+from ansys.mechanical.stubs.stub_generator.generate_content import (
+    c_types_to_python,
+    get_module,
+    render,
+    render_types,
+)
+from ansys.mechanical.stubs.stub_generator.stub_writer import StubWriter
+from ansys.mechanical.stubs.stub_generator.xml_doc import doc_key_filter, load_doc
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(scope="module")
+def assembly(num_types):
+    """Get the synthetic assembly of the benchmark."""
+    return make_assembly(num_types)
+
+
+@pytest.fixture(scope="module")
+def doc_path(assembly, num_types, tmp_path_factory):
+    """Get the XML doc file of the synthetic assembly."""
+    return write_doc(assembly, tmp_path_factory.mktemp("doc") / f"Fake{num_types}.xml")
+
+
+@pytest.fixture(scope="module")
+def doc(assembly, doc_path):
+    """Get the doc members of the synthetic assembly."""
+    return load_doc(doc_path, doc_key_filter(get_namespaces(assembly)))
+
+
+@pytest.fixture(scope="module")
+def modules(assembly, doc):
+    """Get the modules of the synthetic assembly."""
+    return extract(assembly, doc)
+
+
+def extract(assembly, doc):
+    """Get the modules of an assembly, like ``generate_content.extract``."""
+    member_cache = {}
+    return [
+        get_module(namespace, mod_types, doc, None, member_cache)
+        for namespace, mod_types in get_namespaces(assembly).items()
+    ]
+
+
+def run_benchmark(benchmark, num_types, function, *args):
+    """Benchmark a stage and store its peak memory in the ``extra_info`` of the benchmark."""
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["num_types"] = num_types
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 2**20, 2)
+    # Large assemblies take seconds per round
+    rounds = max(1, min(5, 5000 // num_types))
+    return benchmark.pedantic(function, args=args, rounds=rounds, iterations=1)
+
+
+@pytest.mark.benchmark(group="load_doc")
+def test_load_doc(benchmark, num_types, assembly, doc_path):
+    """Benchmark reading the doc members of the written namespaces from the XML doc file."""
+    key_filter = doc_key_filter(get_namespaces(assembly))
+    doc = run_benchmark(benchmark, num_types, load_doc, doc_path, key_filter)
+    assert f"T:{assembly.GetTypes()[-1].FullName}" in doc
+
+
+@pytest.mark.benchmark(group="extract")
+def test_extract(benchmark, num_types, assembly, doc):
+    """Benchmark reading the types and members of the assembly with reflection."""
+    modules = run_benchmark(benchmark, num_types, extract, assembly, doc)
+    assert sum(len(module.types) for module in modules) == num_types
+    assert all(type_info.doc is not None for module in modules for type_info in module.types)
+
+
+@pytest.mark.benchmark(group="render_types")
+def test_render_types(benchmark, num_types, modules):
+    """Benchmark writing the source of the classes and enums."""
+
+    def render_all():
+        return [render_types(module.types, module.has_doc, (".py", ".pyi")) for module in modules]
+
+    bodies = run_benchmark(benchmark, num_types, render_all)
+    assert all(body[".py"] for body in bodies)
+
+
+@pytest.mark.benchmark(group="render")
+def test_render(benchmark, num_types, modules, tmp_path):
+    """Benchmark writing the modules, with their headers, to a stub writer."""
+
+    def render_all():
+        writer = StubWriter(tmp_path / "v261")
+        render(modules, tmp_path / "v261", "py", writer=writer)
+        return writer
+
+    writer = run_benchmark(benchmark, num_types, render_all)
+    assert writer.read_text(tmp_path / "v261" / "Ansys" / "Fake" / "__init__.py")
+
+
+@pytest.mark.benchmark(group="c_types_to_python")
+@pytest.mark.parametrize(
+    "translate", [c_types_to_python, legacy_c_types_to_python], ids=["cached", "legacy"]
+)
+def test_c_types_to_python(benchmark, translate):
+    """Benchmark the cached type translation against the replace-based one."""
+
+    def translate_all():
+        if hasattr(translate, "cache_clear"):
+            translate.cache_clear()
+        return [translate(type_str) for type_str in TYPE_STRINGS * 500]
+
+    translated = benchmark(translate_all)
+    assert len(translated) == len(TYPE_STRINGS) * 500
@@ -0,0 +1,58 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test byte-compiling the generated stub trees."""
+
+import importlib.util
+import pathlib
+
+from ansys.mechanical.stubs.bytecode import check_tree, compile_tree, main
+
+
+def test_compile_tree(tmp_path):
+    """Test the bytecode of a tree is written, kept in sync, and checked."""
+    package = tmp_path / "v261" / "Ansys"
+    package.mkdir(parents=True)
+    init = package / "__init__.py"
+    init.write_text('"""Ansys module."""\n')
+    submodule = package / "_part0.py"
+    submodule.write_text("VALUE = 1\n")
+    root = tmp_path / "v261"
+    assert check_tree(root) == [init, submodule]
+
+    assert compile_tree(root, jobs=2) == [init, submodule]
+    assert check_tree(root) == []
+    assert main([str(root), "--check"]) == 0
+    # The bytecode is hash-based, so it doesn't depend on the modification time
+    init.touch()
+    assert check_tree(root) == []
+    assert compile_tree(root) == []
+
+    init.write_text('"""The Ansys module."""\n')
+    cache_file = pathlib.Path(importlib.util.cache_from_source(submodule))
+    submodule.unlink()
+    assert check_tree(root) == [init, cache_file]
+    assert main([str(root), "--check"]) == 1
+
+    assert compile_tree(root) == [init]
+    assert not cache_file.exists()
+    assert check_tree(root) == []
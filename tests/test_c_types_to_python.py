@@ -0,0 +1,87 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the C# to Python type translation in stubs_generator."""
+
+import re
+
+from ansys.mechanical.stubs.stub_generator.generate_content import (
+    C_TO_PYTHON,
+    EXCLUDED_TYPES_LIST,
+    c_types_to_python,
+)
+
+# Type strings as they are passed to c_types_to_python by write_property and write_method
+TYPE_STRINGS = [
+    '"System.Void"',
+    '"System.Boolean"',
+    '"System.String"',
+    "System.Int32",
+    "System.Double",
+    "System.Object",
+    '"Ansys.ACT.Automation.Mechanical.Model"',
+    '"Ansys.Mechanical.DataModel.Enums.GeometryType"',
+    "Ansys.Core.Units.Quantity",
+    "Ansys.ACT.Interfaces.Mechanical.IParameter",
+    '"System.Collections.Generic.IList[ChildrenType]"',
+    "System.Collections.Generic.IEnumerable[Ansys.ACT.Automation.Mechanical.Body]",
+    "System.Collections.Generic.IList[Ansys.ACT.Automation.Mechanical.Part]",
+    "System.Collections.Generic.IReadOnlyList[System.Double]",
+    "System.Collections.Generic.KeyValuePair[System.String,System.Object]",
+    "System.Func[Ansys.Mechanical.DataModel.Interfaces.IDataModelObject,System.Boolean]",
+    '"System.Tuple[Ansys.Core.Units.Quantity,Ansys.Core.Units.Quantity]"',
+    "System.Collections.Generic.IEnumerable[System.Collections.Generic.KeyValuePair[System.Int32,System.Collections.Generic.IEnumerable[Ansys.Core.Units.Quantity]]]",
+]
+
+
+def legacy_c_types_to_python(type_str):
+    """Translate types like the replace-based implementation that was replaced."""
+    for key, value in C_TO_PYTHON.items():
+        type_str = type_str.replace(key, value)
+        if '"' in type_str:
+            type_str = type_str.replace('"', "")
+
+    ansys_regex = re.compile("(Ansys[^],]*|ChildrenType)")
+    matches = set(ansys_regex.findall(type_str))
+    for match in matches:
+        type_str = re.sub(ansys_regex, match, type_str)
+
+    if "System." in type_str:
+        for excluded_type in EXCLUDED_TYPES_LIST:
+            if excluded_type in type_str:
+                type_str = type_str.replace('"', "")
+                type_str = f'"{type_str}"'
+                break
+
+    return type_str
+
+
+def test_c_types_to_python_matches_legacy():
+    """Test the single-pass translation gives the types of the replace-based one."""
+    c_types_to_python.cache_clear()
+    for type_str in TYPE_STRINGS:
+        # Ansys types are now quoted as forward references
+        expected = legacy_c_types_to_python(type_str).replace('"', "")
+        assert c_types_to_python(type_str).replace('"', "") == expected
+    for type_str in TYPE_STRINGS:
+        c_types_to_python(type_str)
+    assert c_types_to_python.cache_info().hits >= len(TYPE_STRINGS)
@@ -0,0 +1,122 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test writing the classes with their base classes in stubs_generator."""
+
+from fake_reflection import FakeMethod, FakeParameter, FakeProperty, FakeType
+
+from ansys.mechanical.stubs.stub_generator.generate_content import get_module, render
+from ansys.mechanical.stubs.stub_generator.inheritance import resolve_inheritance
+from ansys.mechanical.stubs.stub_generator.snapshot import ModuleInfo, TypeInfo
+
+STRING = FakeType("System.String")
+INT = FakeType("System.Int32")
+VOID = FakeType("System.Void")
+
+
+def make_modules():
+    """Build a class hierarchy across two namespaces and extract it."""
+    base_iface = FakeType("Ansys.Fake.Interfaces.IBase", "interface")
+    base_iface.properties = [FakeProperty("Name", STRING, base_iface, setter=True)]
+    base_iface.methods = [FakeMethod("Delete", VOID, base_iface)]
+    child_iface = FakeType("Ansys.Fake.Objects.IChild", "interface", [base_iface])
+    child_iface.properties = [FakeProperty("Volume", INT, child_iface)]
+
+    base = FakeType("Ansys.Fake.Objects.Base")
+    base.properties = [FakeProperty("Size", INT, base)]
+    base.methods = [FakeMethod("Add", VOID, base, [FakeParameter("x", STRING)])]
+    derived = FakeType("Ansys.Fake.Objects.Derived", interfaces=[child_iface, base_iface])
+    derived.BaseType = base
+    derived.properties = [
+        FakeProperty("Name", STRING, derived, setter=True),
+        FakeProperty("Volume", INT, derived),
+        FakeProperty("Size", INT, base),
+    ]
+    derived.methods = [
+        FakeMethod("Add", VOID, derived, [FakeParameter("x", INT)]),
+        FakeMethod("Add", VOID, base, [FakeParameter("x", STRING)]),
+        FakeMethod("Delete", VOID, derived),
+    ]
+    # The derived class is listed before its base
+    namespaces = {
+        "Ansys.Fake.Interfaces": [base_iface],
+        "Ansys.Fake.Objects": [derived, child_iface, base],
+    }
+    return [get_module(namespace, types, None, None, {}) for namespace, types in namespaces.items()]
+
+
+def test_render_inheritance(tmp_path):
+    """Test the classes derive from their bases and only write their own members."""
+    modules = make_modules()
+    render(modules, tmp_path / "v261", "both", inheritance=True)
+
+    objects = tmp_path / "v261" / "Ansys" / "Fake" / "Objects" / "__init__.py"
+    contents = objects.read_text(encoding="utf-8")
+    compile(contents, str(objects), "exec")
+    assert "from ansys.mechanical.stubs.v261.Ansys.Fake.Interfaces import IBase\n" in contents
+    assert "class IChild(IBase):" in contents
+    assert "class Derived(Base, IChild):" in contents
+    assert contents.index("class Base(object):") < contents.index("class Derived(")
+    assert contents.index("class IChild(") < contents.index("class Derived(")
+
+    derived = contents[contents.index("class Derived(") :]
+    assert "def Size(" not in derived
+    assert "def Name(" in derived
+    # Add(int) hides Add(str) of the base, so both overloads are written
+    assert "def Add(self, x: int)" in derived
+    assert "def Add(self, x: str)" in derived
+    assert "def Name(" not in contents[contents.index("class IChild(") :].split("class ")[1]
+
+    stub = objects.with_suffix(".pyi").read_text(encoding="utf-8")
+    assert "class Derived(Base, IChild):" in stub
+
+    # The flattened classes are unchanged by the inheritance mode
+    assert [type_info.name for type_info in modules[1].types] == ["Derived", "IChild", "Base"]
+    assert len(modules[1].types[0].properties) == 3
+
+
+def test_import_cycle_is_flattened():
+    """Test the classes whose bases would make the modules import each other are flattened."""
+    modules = [
+        ModuleInfo(
+            "Ansys.A",
+            False,
+            [
+                TypeInfo("IA", "class", None),
+                TypeInfo("A", "class", None, bases=["Ansys.B.IB"]),
+            ],
+        ),
+        ModuleInfo(
+            "Ansys.B",
+            False,
+            [
+                TypeInfo("IB", "class", None),
+                TypeInfo("B", "class", None, bases=["Ansys.A.IA", "System.Object"]),
+                TypeInfo("C", "class", None, bases=["Ansys.B.IB"]),
+            ],
+        ),
+    ]
+    resolved, module_bases = resolve_inheritance(modules, "ansys.mechanical.stubs.v261")
+    assert module_bases[0].bases == {}
+    assert module_bases[0].imports == []
+    assert module_bases[1].bases == {"C": ["IB"]}
+    assert [type_info.name for type_info in resolved[1].types] == ["IB", "B", "C"]
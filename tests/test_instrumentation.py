@@ -0,0 +1,62 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the run report of stubs_generator."""
+
+import json
+
+from ansys.mechanical.stubs.stub_generator import instrumentation
+
+
+def test_report_by_scope(tmp_path):
+    """Test stages and counters are recorded for the assembly and namespace of their scope."""
+    report = instrumentation.start_report()
+    try:
+        with instrumentation.scope(assembly="Ans.Core"):
+            with instrumentation.stage("doc_load"):
+                instrumentation.count("doc_hits", 2)
+            with instrumentation.scope(namespace="Ansys.Core.Units"):
+                instrumentation.count("doc_hits")
+        instrumentation.count("files_written")
+    finally:
+        assert instrumentation.stop_report() is report
+
+    report.write(tmp_path / "report.json")
+    data = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert data["stage_totals"]["doc_load"]["calls"] == 1
+    assert data["counter_totals"] == {"doc_hits": 3, "files_written": 1}
+    assert {"counter": "doc_hits", "assembly": "Ans.Core", "namespace": "", "value": 2} in data[
+        "counters"
+    ]
+    assert {
+        "counter": "doc_hits",
+        "assembly": "Ans.Core",
+        "namespace": "Ansys.Core.Units",
+        "value": 1,
+    } in data["counters"]
+
+
+def test_no_report():
+    """Test nothing is recorded if no report is started."""
+    with instrumentation.scope(assembly="Ans.Core"), instrumentation.stage("doc_load"):
+        instrumentation.count("doc_hits")
+    assert instrumentation.stop_report() is None
@@ -0,0 +1,104 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the lightweight enums of the runtime stub files."""
+
+import pickle
+
+from fake_reflection import FakeField, FakeType
+import pytest
+
+from ansys.mechanical.stubs._enums import LightEnum
+from ansys.mechanical.stubs.stub_generator.generate_content import get_module, render
+
+
+class State(LightEnum):
+    """Enum used to test ``LightEnum``."""
+
+    Unknown = 0
+    Solved = 1
+    Done = 1
+
+
+def test_light_enum():
+    """Test the members of a ``LightEnum`` behave like those of an int ``Enum``."""
+    assert isinstance(State.Solved, State)
+    assert State.Solved == 1 and State.Solved.value == 1
+    assert State.Solved.name == "Solved"
+    assert State.Done is State.Solved
+    assert State(1) is State.Solved
+    assert State["Unknown"] is State.Unknown
+    assert list(State) == [State.Unknown, State.Solved]
+    assert len(State) == 2
+    assert list(State.__members__) == ["Unknown", "Solved", "Done"]
+    assert repr(State.Solved) == "<State.Solved: 1>"
+    assert str(State.Solved) == "State.Solved"
+    assert f"{State.Solved}" == "1"
+    assert pickle.loads(pickle.dumps(State.Solved)) is State.Solved
+    with pytest.raises(ValueError):
+        State(2)
+
+
+class Shape(LightEnum):
+    """Enum with a member whose name starts with an underscore."""
+
+    _2D = 1
+    _3D = 2
+
+
+class Field(LightEnum):
+    """Enum with members that have the names of the attributes of the members."""
+
+    Other = 0
+    name = 1
+    value = 2
+
+
+def test_light_enum_member_names():
+    """Test the members that ``enum.Enum`` accepts are members of a ``LightEnum``."""
+    assert list(Shape) == [Shape._2D, Shape._3D]
+    assert isinstance(Shape._2D, Shape) and Shape(1) is Shape._2D
+    assert Shape._2D.name == "_2D"
+
+    assert Field.Other.name == "Other" and Field.Other.value == 0
+    assert isinstance(Field.name, Field) and Field.name.name == "name"
+    assert Field.value.value == 2 and Field(2) is Field.value
+    assert list(Field) == [Field.Other, Field.name, Field.value]
+
+
+def test_render_light_enums(tmp_path):
+    """Test the enums of the runtime files derive from ``LightEnum``."""
+    enum = FakeType("Ansys.Fake.Enums.State", "enum")
+    enum.fields = [FakeField("Unknown", 0), FakeField("Solved", 1)]
+    render(
+        [get_module("Ansys.Fake.Enums", [enum], None, None, {})], tmp_path, "both", light_enums=True
+    )
+
+    module = tmp_path / "Ansys" / "Fake" / "Enums"
+    contents = (module / "__init__.py").read_text(encoding="utf-8")
+    assert "from ansys.mechanical.stubs._enums import LightEnum\n" in contents
+    assert "class State(LightEnum):" in contents
+    namespace = {}
+    exec(compile(contents, "__init__.py", "exec"), namespace)
+    assert namespace["State"](1).name == "Solved"
+    # Stub files are never executed, so type checkers see a regular Enum
+    assert "class State(Enum):" in (module / "__init__.pyi").read_text(encoding="utf-8")
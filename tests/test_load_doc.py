@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test loading the XML doc files in stubs_generator."""
+
+from ansys.mechanical.stubs.stub_generator.xml_doc import DocCache, doc_key_filter, load_doc
+
+DOC_XML = """<?xml version="1.0"?>
+<doc>
+    <assembly><name>Ans.Core</name></assembly>
+    <members>
+        <member name="T:Ansys.Core.Units.Quantity">
+            <summary>A <c>Quantity</c> with a unit.</summary>
+        </member>
+        <member name="M:Ansys.Core.Units.Quantity.Abs">
+            <summary>Get the absolute value.</summary>
+        </member>
+        <member name="M:Ansys.Core.Units.Quantity.Round(System.Int32)">
+            <summary>Round to <paramref name="digits"/> digits.</summary>
+            <param name="digits">The number of <c>digits</c>.</param>
+            <remarks>The unit is kept.</remarks>
+        </member>
+        <member name="T:Ansys.Core.Units.QuantityFormatter">
+            <summary>Format quantities.</summary>
+        </member>
+        <member name="T:Ansys.Core.Other">
+            <summary>Other type.</summary>
+        </member>
+    </members>
+</doc>
+"""
+
+
+def test_load_doc(tmp_path):
+    """Test only the doc members accepted by the key filter are loaded."""
+    xml_path = tmp_path / "Ans.Core.xml"
+    xml_path.write_text(DOC_XML, encoding="utf-8")
+
+    doc = load_doc(str(xml_path))
+    assert len(doc) == 5
+    assert doc["T:Ansys.Core.Units.Quantity"].summary == "A Quantity with a unit."
+    round_doc = doc["M:Ansys.Core.Units.Quantity.Round(System.Int32)"]
+    assert round_doc.summary == "Round to digits digits."
+    assert round_doc.params == (("digits", "The number of digits."),)
+    assert round_doc.remarks == "The unit is kept."
+    assert round_doc.example is None
+
+    doc = load_doc(str(xml_path), doc_key_filter(["Ansys.Core.Units.Quantity"]))
+    assert len(doc) == 3
+    assert "T:Ansys.Core.Units.QuantityFormatter" not in doc
+    assert doc["M:Ansys.Core.Units.Quantity.Abs"].summary == "Get the absolute value."
+
+    doc = load_doc(str(xml_path), doc_key_filter(keys=["T:Ansys.Core.Other"]))
+    assert list(doc) == ["T:Ansys.Core.Other"]
+
+
+def test_doc_cache(tmp_path):
+    """Test the doc members are reused from the cache until the XML doc file changes."""
+    xml_path = tmp_path / "Ans.Core.xml"
+    xml_path.write_text(DOC_XML, encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    doc = DocCache(cache_dir).load(str(xml_path))
+    assert len(doc) == 5
+    assert doc == load_doc(str(xml_path))
+    assert doc.get("T:Ansys.Core.Missing") is None
+
+    doc = DocCache(cache_dir).load(str(xml_path), doc_key_filter(["Ansys.Core.Units.Quantity"]))
+    assert len(doc) == 3
+    assert doc.get("T:Ansys.Core.Other") is None
+
+    xml_path.write_text(DOC_XML.replace("Other type.", "Changed type."), encoding="utf-8")
+    doc = DocCache(cache_dir).load(str(xml_path))
+    assert doc["T:Ansys.Core.Other"].summary == "Changed type."
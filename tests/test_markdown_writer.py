@@ -0,0 +1,53 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test writing the Markdown API reference in stubs_generator."""
+
+import pathlib
+
+from ansys.mechanical.stubs.stub_generator.markdown_writer import render_markdown
+from ansys.mechanical.stubs.stub_generator.snapshot import read_snapshot
+
+SNAPSHOT_PATH = pathlib.Path(__file__).parent / "data" / "Sample.jsonl"
+
+
+def test_render_markdown(tmp_path):
+    """Test the namespace and type pages are written from a snapshot."""
+    snapshot = read_snapshot(SNAPSHOT_PATH)
+    version_dir = render_markdown(snapshot.modules, tmp_path, snapshot.version)
+    assert version_dir == tmp_path / "ansys" / "mechanical" / "stubs" / "v261"
+    assert (
+        (version_dir / "index.md").read_text(encoding="utf-8").startswith("# Mechanical 2026 R1\n")
+    )
+
+    model_dir = version_dir / "Ansys" / "ACT" / "Automation" / "Mechanical"
+    index = (model_dir / "index.md").read_text(encoding="utf-8")
+    assert "| [`Model`](Model.md) | The model. |" in index
+
+    model = (model_dir / "Model.md").read_text(encoding="utf-8")
+    assert model.startswith("# Model\n\n#### *class* Ansys.ACT.Automation.Mechanical.Model\n")
+    # The overview links to the details on the same page
+    assert "| [`Name`](#Model.Name) |" in model
+    assert '<a id="Model.Name"></a>' in model
+
+    enums = version_dir / "Ansys" / "Mechanical" / "DataModel" / "Enums"
+    assert "| `None_` | 0 |" in (enums / "State.md").read_text(encoding="utf-8")
@@ -0,0 +1,80 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test packing the runtime files of a version into a zip archive in stubs_generator."""
+
+import importlib
+import marshal
+import sys
+import zipfile
+
+from fake_reflection import get_namespaces, make_assembly
+
+from ansys.mechanical.stubs.stub_generator.generate_content import get_module, render
+from ansys.mechanical.stubs.stub_generator.pack import pack_version
+
+
+def test_pack_version(tmp_path, monkeypatch):
+    """Test the packed version is imported from its archive with its bytecode."""
+    modules = [
+        get_module(ns, types, None, None, {})
+        for ns, types in get_namespaces(make_assembly(20)).items()
+    ]
+    outdir = tmp_path / "v999"
+    render(modules, outdir, "both")
+    (outdir / "__init__.py").write_text('"""Version module."""\n')
+
+    archive_path = pack_version(outdir, jobs=2)
+    assert archive_path == tmp_path / "v999.zip"
+    # Type checkers don't read archives, so the stub files stay in the directory
+    assert not list(outdir.rglob("*.py"))
+    assert (outdir / "Ansys" / "Fake" / "Namespace0" / "__init__.pyi").is_file()
+    with zipfile.ZipFile(archive_path) as archive:
+        names = archive.namelist()
+    assert "v999/__init__.py" in names and "v999/__init__.pyc" in names
+    assert "v999/Ansys/Fake/Namespace0/__init__.pyc" in names
+    with zipfile.ZipFile(archive_path) as archive:
+        code = marshal.loads(archive.read("v999/Ansys/__init__.pyc")[16:])
+    # The code is named independently of where the archive is packed
+    assert code.co_filename == "v999.zip/v999/Ansys/__init__.py"
+
+    # Packing the same files again gives the same archive
+    contents = archive_path.read_bytes()
+    render(modules, outdir, "py")
+    (outdir / "__init__.py").write_text('"""Version module."""\n')
+    pack_version(outdir)
+    assert archive_path.read_bytes() == contents
+
+    # Packing the same files in another directory gives the same archive too
+    other_outdir = tmp_path / "other" / "v999"
+    render(modules, other_outdir, "py")
+    (other_outdir / "__init__.py").write_text('"""Version module."""\n')
+    assert pack_version(other_outdir).read_bytes() == contents
+
+    monkeypatch.syspath_prepend(str(archive_path))
+    try:
+        namespace = importlib.import_module("v999.Ansys.Fake.Namespace0")
+        assert namespace.__spec__.origin.endswith("__init__.pyc")
+        assert "Object1" in dir(namespace)
+    finally:
+        for name in [name for name in sys.modules if name.split(".")[0] == "v999"]:
+            del sys.modules[name]
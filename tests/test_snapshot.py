@@ -0,0 +1,105 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test rendering the stubs from a snapshot in stubs_generator."""
+
+import importlib
+import pathlib
+import sys
+import types
+
+import pytest
+
+from ansys.mechanical.stubs.stub_generator.generate_content import get_start_method
+from ansys.mechanical.stubs.stub_generator.snapshot import read_snapshot, write_snapshot
+
+SNAPSHOT_DIR = pathlib.Path(__file__).parent / "data"
+SNAPSHOT_PATH = SNAPSHOT_DIR / "Sample.jsonl"
+GENERATOR_DIR = pathlib.Path(__file__).parents[1] / "src/ansys/mechanical/stubs/stub_generator"
+
+
+@pytest.fixture
+def create_files(monkeypatch):
+    """Import create_files.py, which imports generate_content like the script does."""
+    monkeypatch.syspath_prepend(str(GENERATOR_DIR))
+    return importlib.import_module("create_files")
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test a snapshot is unchanged by writing and reading it."""
+    snapshot = read_snapshot(SNAPSHOT_PATH)
+    assert snapshot.assembly == "Sample"
+    assert snapshot.version == "v261"
+
+    write_snapshot(tmp_path / "Sample.jsonl", snapshot)
+    assert read_snapshot(tmp_path / "Sample.jsonl") == snapshot
+
+
+def test_render_snapshot(tmp_path, create_files):
+    """Test the stubs are rendered from the snapshots of a version."""
+    outdir = create_files.render(tmp_path, SNAPSHOT_DIR, "both")
+    assert outdir == tmp_path / "v261"
+
+    model_dir = outdir / "Ansys" / "ACT" / "Automation" / "Mechanical"
+    contents = (model_dir / "__init__.py").read_text(encoding="utf-8")
+    assert "class Model(object):" in contents
+    assert "    The model.\n" in contents
+    assert "        return 3\n" in contents
+    assert contents.startswith('"""Mechanical module."""\nfrom __future__ import annotations\n')
+    assert '__all__ = ["Model"' in contents
+    compile(contents, str(model_dir / "__init__.py"), "exec")
+
+    enums = (outdir / "Ansys" / "Mechanical" / "DataModel" / "Enums" / "__init__.pyi").read_text(
+        encoding="utf-8"
+    )
+    assert "class State(Enum):" in enums
+    assert "    None_ = 0\n" in enums
+    assert (outdir / "__init__.py").is_file()
+
+
+def test_render_snapshot_jobs(tmp_path, create_files):
+    """Test rendering with a process pool writes the same files as rendering serially."""
+    assert_jobs_output(tmp_path, create_files)
+
+
+def test_render_snapshot_jobs_clr(tmp_path, create_files, monkeypatch):
+    """Test the workers aren't forked once the .NET runtime is loaded."""
+    monkeypatch.setitem(sys.modules, "clr", types.ModuleType("clr"))
+    assert get_start_method() != "fork"
+    assert_jobs_output(tmp_path, create_files)
+
+
+def assert_jobs_output(tmp_path, create_files):
+    """Check rendering with a process pool writes the same files as rendering serially."""
+    create_files.render(tmp_path / "serial", SNAPSHOT_DIR, "both")
+    create_files.render(tmp_path / "parallel", SNAPSHOT_DIR, "both", jobs=2)
+
+    serial_files = sorted(
+        path.relative_to(tmp_path / "serial") for path in (tmp_path / "serial").rglob("*.py*")
+    )
+    parallel_files = sorted(
+        path.relative_to(tmp_path / "parallel") for path in (tmp_path / "parallel").rglob("*.py*")
+    )
+    assert serial_files == parallel_files
+    for path in serial_files:
+        assert (tmp_path / "serial" / path).read_text() == (
+            tmp_path / "parallel" / path
+        ).read_text()
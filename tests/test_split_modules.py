@@ -0,0 +1,66 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test splitting the types of large modules into submodules in stubs_generator."""
+
+import re
+
+from fake_reflection import get_namespaces, make_assembly
+
+from ansys.mechanical.stubs.stub_generator.generate_content import get_module, render
+
+
+def read_tree(root):
+    """Read the generated files of a stub tree, by relative path."""
+    return {path.relative_to(root): path.read_text() for path in root.rglob("*.py*")}
+
+
+def test_render_split_modules(tmp_path):
+    """Test the types of a large module are written to submodules loaded on first access."""
+    assembly = make_assembly(40)
+    modules = [
+        get_module(ns, types, None, None, {}) for ns, types in get_namespaces(assembly).items()
+    ]
+    render(modules, tmp_path / "serial" / "v261", "both", split_size=40)
+    render(modules, tmp_path / "parallel" / "v261", "both", jobs=2, split_size=40)
+
+    files = read_tree(tmp_path / "serial")
+    assert files == read_tree(tmp_path / "parallel")
+    for path, contents in files.items():
+        compile(contents, str(path), "exec")
+
+    namespace = tmp_path / "serial" / "v261" / "Ansys" / "Fake" / "Namespace0"
+    init = (namespace / "__init__.py").read_text()
+    assert "class " not in init
+    match = re.search(r'"Object1": "(_part\d+)"', init)
+    assert match is not None
+    assert f"    from .{match.group(1)} import " in init
+    assert "        value = globals()[name] = getattr(module, name)\n" in init
+    assert len(list(namespace.glob("_part*.py"))) > 1
+    assert "class Object1(object):" in (namespace / f"{match.group(1)}.py").read_text()
+    # Stub files are never executed, so they aren't split
+    assert "class Object1(object):" in (namespace / "__init__.pyi").read_text()
+
+    # The module of the base interface is too small to be split
+    interfaces = namespace.parent / "Interfaces"
+    assert "class IDataModelObject(object):" in (interfaces / "__init__.py").read_text()
+    assert not list(interfaces.glob("_part*.py"))
@@ -0,0 +1,78 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test writing only the changed files of a stub tree in stubs_generator."""
+
+from ansys.mechanical.stubs.stub_generator.stub_writer import StubWriter
+
+
+def write_tree(root, files):
+    """Write files to a stub tree and return the writer."""
+    writer = StubWriter(root)
+    for name, text in files.items():
+        writer.write_text(root / name, text)
+    writer.flush()
+    return writer
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    """Test that a rerun with the same content doesn't write any file."""
+    files = {"__init__.py": '"""v261 module."""\n', "Ansys/__init__.py": '"""Ansys module."""\n'}
+    assert write_tree(tmp_path, files).written == 2
+    mtime_ns = (tmp_path / "Ansys" / "__init__.py").stat().st_mtime_ns
+
+    writer = write_tree(tmp_path, files)
+    assert (writer.written, writer.skipped) == (0, 2)
+    assert (tmp_path / "Ansys" / "__init__.py").stat().st_mtime_ns == mtime_ns
+
+
+def test_changed_files_are_written(tmp_path):
+    """Test that changed files and files edited since the last run are written."""
+    files = {"a.py": "a = 1\n", "b.py": "b = 1\n"}
+    write_tree(tmp_path, files)
+    (tmp_path / "b.py").write_text("edited\n")
+
+    writer = write_tree(tmp_path, {"a.py": "a = 2\n", "b.py": "b = 1\n"})
+    assert (writer.written, writer.skipped) == (2, 0)
+    assert (tmp_path / "a.py").read_text() == "a = 2\n"
+    assert (tmp_path / "b.py").read_text() == "b = 1\n"
+
+
+def test_stale_files_are_removed(tmp_path):
+    """Test that the files of the last run that aren't written again are removed."""
+    files = {
+        "__init__.py": "",
+        "Ansys/Fake/__init__.py": "",
+        "Ansys/Fake/_part0.py": "a = 1\n",
+        "Ansys/Old/__init__.py": "",
+    }
+    write_tree(tmp_path, files)
+    (tmp_path / "notes.txt").write_text("not generated\n")
+
+    writer = write_tree(tmp_path, {"__init__.py": "", "Ansys/Fake/__init__.py": ""})
+    assert writer.removed == 2
+    assert not (tmp_path / "Ansys" / "Fake" / "_part0.py").exists()
+    assert not (tmp_path / "Ansys" / "Old").exists()
+    assert (tmp_path / "notes.txt").is_file()
+
+    writer = write_tree(tmp_path, {"__init__.py": "", "Ansys/Fake/__init__.py": ""})
+    assert (writer.written, writer.skipped, writer.removed) == (0, 2, 0)
@@ -0,0 +1,70 @@
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test the parsing of .NET type names in stubs_generator."""
+
+from ansys.mechanical.stubs.stub_generator.type_names import (
+    display_name,
+    doc_id,
+    parse_type_name,
+    type_doc_id,
+)
+
+
+def test_display_name():
+    """Test generic arity, nested types, arrays, and byrefs are removed for display."""
+    test_types = {
+        "System.Collections.Generic.IList`1[ChildrenType]": (
+            "System.Collections.Generic.IList[ChildrenType]"
+        ),
+        "Ansys.Mechanical.Graphics.Tools+Options": "Ansys.Mechanical.Graphics.Tools.Options",
+        "System.Double[]&": "System.Double",
+        '"System.Collections.Generic.KeyValuePair`2[System.Int32,System.String]"': (
+            "System.Collections.Generic.KeyValuePair[System.Int32,System.String]"
+        ),
+    }
+
+    for key, value in test_types.items():
+        assert display_name(parse_type_name(key)) == value
+
+
+def test_doc_id():
+    """Test parameter types are written as in the XML doc files."""
+    method_generics = ("ChildrenType",)
+    test_types = {
+        "System.Collections.Generic.IList`1[ChildrenType]": "System.Collections.Generic.IList{``0}",
+        "System.Collections.Generic.IEnumerable`1[Ansys.Core.Units.Quantity]": (
+            "System.Collections.Generic.IEnumerable{Ansys.Core.Units.Quantity}"
+        ),
+        "Ansys.Mechanical.Graphics.Tools+Options": "Ansys.Mechanical.Graphics.Tools.Options",
+        "System.Double[]": "System.Double[]",
+        "System.Double[,]": "System.Double[0:,0:]",
+        "System.Int32&": "System.Int32@",
+    }
+
+    for key, value in test_types.items():
+        assert doc_id(parse_type_name(key), method_generics) == value
+    assert type_doc_id(parse_type_name("Ansys.A`1+B[System.Int32]")) == "Ansys.A`1.B"
+
+
+def test_interned():
+    """Test equal type names share one node."""
+    assert parse_type_name("System.Int32") is parse_type_name('"System.Int32"')